@@ -76,6 +76,11 @@ CREATE TABLE IF NOT EXISTS business(
                time TEXT NOT NULL
                );
 
+CREATE TABLE IF NOT EXISTS game_clock(
+               id INTEGER PRIMARY KEY,
+               last_tick FLOAT NOT NULL
+               );
+
 ''')
 connect.commit()
 connect.close()
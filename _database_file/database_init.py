@@ -1,7 +1,56 @@
 import sqlite3
-from datetime import datetime
+
+# Миграции data/data.db (кошелек, статус, отметка времени начислений)
+DATA_MIGRATIONS = [
+    (1, "Таблица отметки времени начислений", [
+        'CREATE TABLE IF NOT EXISTS game_clock(id INTEGER PRIMARY KEY, last_tick FLOAT NOT NULL)',
+    ]),
+    (2, "Состояние экономики бизнесов рядом с отметкой времени", [
+        'ALTER TABLE game_clock ADD COLUMN economy TEXT',
+    ]),
+]
+
+def migrate(db_path, migrations):
+    """Применение недостающих миграций и включение WAL-журнала.
+    
+    У каждого файла базы свой список (версия, описание, SQL-команды);
+    номер последней применённой миграции хранится в PRAGMA user_version файла.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        # WAL: чтение не блокирует запись и наоборот
+        conn.execute('PRAGMA journal_mode=WAL')
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        for target, description, statements in migrations:
+            if target <= version:
+                continue
+            with conn:
+                for statement in statements:
+                    conn.execute(statement)
+                conn.execute(f'PRAGMA user_version = {int(target)}')
+            version = target
+            print(f"✅ Миграция {target}: {description}")
+        return version
+    finally:
+        conn.close()
 
 class BusinessDatabaseInitializer:
+    # Версионированные миграции: (версия, описание, SQL-команды).
+    # Номер последней применённой миграции хранится в PRAGMA user_version.
+    MIGRATIONS = [
+        (1, "Покрывающие индексы по business_id", [
+            'CREATE INDEX IF NOT EXISTS idx_business_roles_cover ON business_roles(business_id, name, cost, effect)',
+            'CREATE INDEX IF NOT EXISTS idx_special_modes_cover ON special_modes(business_id, name, cooldown, cost, effect)',
+            'CREATE INDEX IF NOT EXISTS idx_business_synergies_cover ON business_synergies(business_id, synergy_name)',
+            'CREATE INDEX IF NOT EXISTS idx_dark_actions_cover ON dark_actions(business_id, name, income_multiplier, risk_increase)',
+            'CREATE INDEX IF NOT EXISTS idx_business_upgrades_cover ON business_upgrades(business_id, upgrade_type, level)',
+            'CREATE INDEX IF NOT EXISTS idx_player_businesses_business_id ON player_businesses(business_id, is_active)',
+            # Старые индексы по одному business_id стали префиксами покрывающих
+            'DROP INDEX IF EXISTS idx_business_roles_business_id',
+            'DROP INDEX IF EXISTS idx_special_modes_business_id',
+        ]),
+    ]
+
     def __init__(self, db_path="business_empire.db"):
         self.db_path = db_path
     
@@ -125,6 +174,10 @@ class BusinessDatabaseInitializer:
         conn.close()
         print("✅ Структура базы данных создана успешно!")
     
+    def migrate(self):
+        """Применение недостающих миграций базы бизнесов и включение WAL-журнала"""
+        return migrate(self.db_path, self.MIGRATIONS)
+    
     def populate_businesses(self):
         """Заполнение таблицы бизнесов начальными данными"""
         conn = sqlite3.connect(self.db_path)
@@ -393,6 +446,7 @@ def main():
     try:
         # Создаем структуру БД
         initializer.init_database()
+        initializer.migrate()
         
         # Заполняем данными
         initializer.populate_businesses()
@@ -0,0 +1,72 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import coreLogic
+
+# Сравнение загрузки бизнесов: старый вариант (1 + 5 запросов на бизнес)
+# против BusinessLoader (6 запросов на всё). Запуск: python _tests/bench_business_loader.py
+
+CHILD_QUERIES = (
+    ('available_roles', 'SELECT name, cost, effect FROM business_roles WHERE business_id = ? ORDER BY id',
+     lambda r: {'name': r[0], 'cost': r[1], 'effect': r[2]}),
+    ('special_modes', 'SELECT name, cooldown, cost, effect FROM special_modes WHERE business_id = ? ORDER BY id',
+     lambda r: {'name': r[0], 'cooldown': r[1], 'cost': r[2], 'effect': r[3]}),
+    ('synergies', 'SELECT synergy_name FROM business_synergies WHERE business_id = ? ORDER BY id',
+     lambda r: r[0]),
+    ('dark_actions', 'SELECT name, income_multiplier, risk_increase FROM dark_actions WHERE business_id = ? ORDER BY id',
+     lambda r: {'name': r[0], 'income_multiplier': r[1], 'risk_increase': r[2]}),
+)
+
+
+def load_n_plus_one():
+    """Прежний алгоритм BusinessManager.load_business_data"""
+    cursor = coreLogic.DB.get(coreLogic.BUSINESSES_DB).cursor()
+    cursor.execute(f"SELECT {', '.join(coreLogic.BUSINESS_COLUMNS)} FROM businesses")
+    businesses = []
+    for row in cursor.fetchall():
+        business = dict(zip(coreLogic.BUSINESS_COLUMNS, row))
+        for column in coreLogic.BUSINESS_FLAG_COLUMNS:
+            business[column] = bool(business[column])
+        for key, query, make in CHILD_QUERIES:
+            cursor.execute(query, (business['id'],))
+            business[key] = [make(r) for r in cursor.fetchall()]
+        cursor.execute('SELECT upgrade_type, level FROM business_upgrades WHERE business_id = ?', (business['id'],))
+        for upgrade_type, level in cursor.fetchall():
+            business[f'upgrade_{upgrade_type}'] = level
+        businesses.append(business)
+    return businesses
+
+
+def measure(load, repeats):
+    statements = []
+    connection = coreLogic.DB.get(coreLogic.BUSINESSES_DB)
+    connection.set_trace_callback(statements.append)
+    try:
+        result = load()
+    finally:
+        connection.set_trace_callback(None)
+    started = time.perf_counter()
+    for _ in range(repeats):
+        load()
+    elapsed = (time.perf_counter() - started) / repeats
+    return result, len(statements), elapsed
+
+
+def main(repeats=200):
+    loader = coreLogic.BusinessLoader()
+    old, old_queries, old_time = measure(load_n_plus_one, repeats)
+    new, new_queries, new_time = measure(loader.load_all, repeats)
+
+    assert old == new, "Результаты загрузки различаются"
+    print(f"Бизнесов: {len(new)}")
+    print(f"N+1:            {old_queries:4d} запросов, {old_time * 1000:.2f} мс")
+    print(f"BusinessLoader: {new_queries:4d} запросов, {new_time * 1000:.2f} мс")
+    print(f"Ускорение: x{old_time / new_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import economy
+
+# Прокрутка экономики без окна: тик за тиком по 5 секунд (так ее продвигают часы игры) против одного шага
+# на весь промежуток. Пропускная способность - это скорость пошаговой прокрутки; один шаг лишь проверяет,
+# что итог не зависит от размера шага, потому что сроки обрабатываются в свой момент.
+# Запуск: python _tests/bench_economy.py
+
+
+def make_economy(seed):
+    state = economy.BusinessEconomy(now=0.0, rng=random.Random(seed))
+    state.wallet.credit(sum(template['price'] for template in state.available_businesses))
+    for template in state.available_businesses:
+        state.buy_business(template)
+    state.start_research(1, 'Генная терапия')
+    state.start_ai_training(3, 'Компьютерное зрение')
+    return state
+
+
+def measure(run, seed):
+    state = make_economy(seed)
+    events = []
+    state.subscribe(lambda event: events.append(event.kind) if event.kind != 'income' else None)
+    started = time.perf_counter()
+    ticks = run(state)
+    elapsed = time.perf_counter() - started
+    return state.player_balance, events, ticks, elapsed
+
+
+def main(hours=168, step=5.0, seed=1):
+    seconds = hours * 3600
+    stepped = measure(lambda state: economy.fast_forward(state, seconds, step), seed)
+    single = measure(lambda state: economy.fast_forward(state, seconds, seconds), seed)
+
+    assert abs(stepped[0] - single[0]) <= 1e-6 * abs(single[0]), "Итоговый баланс различается"
+    assert stepped[1] == single[1], "События различаются"
+    print(f"Игровое время: {hours} ч, событий: {len(single[1])}")
+    print(f"Шаг {step:g} с: {stepped[2]:,d} шагов за {stepped[3] * 1000:.1f} мс - {stepped[2] / stepped[3]:,.0f} шагов/с")
+    print(f"Один шаг на весь промежуток: {single[3] * 1000:.1f} мс, итог совпадает с пошаговым")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,88 @@
 import sqlite3
 import json
+import os
+import atexit
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from collections.abc import MutableMapping
+import threading
+import time
+import heapq
+import itertools
+import re
+from typing import NamedTuple
+try:
+	import numpy as np
+except ImportError:  # numpy необязателен: без него экономика считается обычным циклом
+	np = None
+
+# Пути к базам данных
+DATA_DB = 'data/data.db'
+INVEST_DB = 'data/invest.db'
+WHITE_SHOP_DB = 'data/white_shop.db'
+BUSINESSES_DB = 'data/businesses.db'
+CONFIG_PATH = 'data/config.json'
+
+#пул соединений: одно долгоживущее соединение на файл базы и поток
+class ConnectionPool:
+	def __init__(self, cached_statements=256):
+		self.cached_statements = cached_statements
+		self._local = threading.local()
+		self._lock = threading.Lock()
+		self._connections = []
+
+	#получение соединения текущего потока (создаётся при первом обращении)
+	def get(self, path):
+		connections = getattr(self._local, 'connections', None)
+		if connections is None:
+			connections = self._local.connections = {}
+		connection = connections.get(path)
+		if connection is None:
+			# sqlite3 кэширует подготовленные выражения внутри соединения,
+			# поэтому повторные SELECT не компилируются заново
+			connection = sqlite3.connect(path, cached_statements=self.cached_statements, check_same_thread=False)
+			connections[path] = connection
+			with self._lock:
+				self._connections.append(connection)
+		return connection
+
+	#одна строка результата или None
+	def fetchone(self, path, query, params=()):
+		return self.get(path).execute(query, params).fetchone()
+
+	#все строки результата
+	def fetchall(self, path, query, params=()):
+		return self.get(path).execute(query, params).fetchall()
+
+	#закрытие соединений текущего потока (вызывается рабочим потоком перед завершением)
+	def close_thread(self):
+		connections = getattr(self._local, 'connections', None)
+		if not connections:
+			return
+		self._local.connections = {}
+		closing = set(map(id, connections.values()))
+		with self._lock:
+			self._connections = [connection for connection in self._connections if id(connection) not in closing]
+		for connection in connections.values():
+			try:
+				connection.close()
+			except sqlite3.Error:
+				pass
+
+	#закрытие всех соединений (вызывается при выходе)
+	def close_all(self):
+		with self._lock:
+			connections, self._connections = self._connections, []
+		for connection in connections:
+			try:
+				connection.close()
+			except sqlite3.Error:
+				pass
+		self._local = threading.local()
+
+DB = ConnectionPool()
+atexit.register(DB.close_all)
 
 #работа с логикой приложения
 class AppLogic:
@@ -17,6 +100,8 @@ class ExportDB:
 		self.show_earn_business_in_hour
 		self.show_earn_rent_in_hour
 		self.taxes
+		self.wallet_snapshot
+		self.status_snapshot
 		self.get_full_status
 		self.get_bag
 		self.get_my_homes
@@ -28,243 +113,1187 @@ class ExportDB:
 		self.get_homes
 
 	#работа с таблицой wallet
+	#снимок всей строки wallet (для отрисовки одного кадра)
+	def wallet_snapshot(self):
+		return SNAPSHOTS.wallet()
+
+	#снимок всей строки status
+	def status_snapshot(self):
+		return SNAPSHOTS.status()
+
 	#отображение баланса
 	def balance(self):
-		connect_balance = sqlite3.connect('data/data.db')
-		cursor_balance = connect_balance.cursor()
-		cursor_balance.execute('SELECT balance FROM wallet')
-		result = cursor_balance.fetchone()[0]
-		connect_balance.close()
-		return result
+		return LEDGER.balance()
 	
 	#возвращаем значение заработка за 1 клик
 	def earn_one_click(self):
-		connect_earn_one_click = sqlite3.connect('data/data.db')
-		cursor_earn_one_click = connect_earn_one_click.cursor()
-		cursor_earn_one_click.execute('SELECT moneys_one_click FROM wallet')
-		result = cursor_earn_one_click.fetchone()[0]
-		connect_earn_one_click.close()
-		return result
+		return SNAPSHOTS.wallet().moneys_one_click
 
 	#отображение уровня кликера(заработок за 1 клик)
 	def show_earn_click_level(self):
-		connect_earn_one_click = sqlite3.connect('data/data.db')
-		cursor_earn_one_click = connect_earn_one_click.cursor()
-		cursor_earn_one_click.execute('SELECT moneys_one_click FROM wallet')
-		result_level = cursor_earn_one_click.fetchone()[0]
-		connect_earn_one_click.close()
-		return result_level
+		return SNAPSHOTS.wallet().moneys_one_click
 	
 	#отображение заработка с бизнеса в час
 	def show_earn_business_in_hour(self):
-		connect_earn_business_in_hour = sqlite3.connect('data/data.db')
-		cursor_earn_business_in_hour = connect_earn_business_in_hour.cursor()
-		cursor_earn_business_in_hour.execute('SELECT moneys_in_hour FROM wallet')
-		result_earn_business_in_hour = cursor_earn_business_in_hour.fetchone()[0]
-		connect_earn_business_in_hour.close()
-		return result_earn_business_in_hour
+		return SNAPSHOTS.wallet().moneys_in_hour
 	
 	#отображение заработка с аренды в час
 	def show_earn_rent_in_hour(self):
-		connect_earn_rent_in_hour = sqlite3.connect('data/data.db')
-		cursor_earn_rent_in_hour = connect_earn_rent_in_hour.cursor()
-		cursor_earn_rent_in_hour.execute('SELECT moneys_rent_in_hour FROM wallet')
-		result_earn_rent_in_hour = cursor_earn_rent_in_hour.fetchone()[0]
-		connect_earn_rent_in_hour.close()
-		return result_earn_rent_in_hour
+		return SNAPSHOTS.wallet().moneys_rent_in_hour
 	
 	#отображение налогов в месяц
 	def taxes(self):
-		connect_taxes = sqlite3.connect('data/data.db')
-		cursor_taxes = connect_taxes.cursor()
-		cursor_taxes.execute('SELECT taxes FROM wallet')
-		result_taxes = cursor_taxes.fetchone()[0]
-		connect_taxes.close()
-		return result_taxes
+		return SNAPSHOTS.wallet().taxes
 	
-	#получение статуса
+	#получение статуса (порядок полей совпадает со столбцами таблицы status)
 	def get_full_status(self):
-		connect = sqlite3.connect("data/data.db")
-		cursor = connect.cursor()
-		cursor.execute("""SELECT all_money, balance, income_business, income_rent, actives, amount_business, amount_homes, amount_company, amount_cars, amount_airplanes, amount_yachts, amount_items, amount_islands, earn_clicks, earn_business, earn_rent, earn_crypto FROM status""")
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return SNAPSHOTS.status()
 
 	#получение данных портфеля
 	def get_bag(self):
-		connect = sqlite3.connect("data/data.db")
-		cursor = connect.cursor()
-		cursor.execute('SELECT all_moneys_bag, dividend_yield, stable_income, growth_potential, rental_income FROM my_bag')
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(DATA_DB, 'SELECT all_moneys_bag, dividend_yield, stable_income, growth_potential, rental_income FROM my_bag')
 
 	#получение данных своей недвижимости
 	def get_my_homes(self):
-		connect = sqlite3.connect("data/data.db")
-		cursor = connect.cursor()
-		cursor.execute("""SELECT name_homes, money_homes, profitability_homes FROM homes""")
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(DATA_DB, """SELECT name_homes, money_homes, profitability_homes FROM homes""")
 
 	#получение данных своей криптовалюты
 	def get_my_crypto(self):
-		connect = sqlite3.connect("data/data.db")
-		cursor = connect.cursor()
-		cursor.execute("""SELECT name_crypto, money_crypto, amount_crypto FROM crypto""")
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(DATA_DB, """SELECT name_crypto, money_crypto, amount_crypto FROM crypto""")
 
 	#получение данных своих бизнесов
 	def get_my_business(self):
-		connect = sqlite3.connect("data/data.db")
-		cursor = connect.cursor()
-		cursor.execute("""SELECT my_business_name, levels, earn_in_hour, type, all_moneys, capitalization, time FROM business""")
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(DATA_DB, """SELECT my_business_name, levels, earn_in_hour, type, all_moneys, capitalization, time FROM business""")
 
 	#получение данных своих активов
 	def get_my_actives(self):
-		connect = sqlite3.connect("data/data.db")
-		cursor = connect.cursor()
-		cursor.execute("""SELECT name_actives, money_actives, amount_actives, profitability_actives FROM actives""")
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(DATA_DB, """SELECT name_actives, money_actives, amount_actives, profitability_actives FROM actives""")
 
 	# Инвестиции
 	#получение криптовалюты
 	def get_crypto(self):
-		connect = sqlite3.connect("data/invest.db")
-		cursor = connect.cursor()
-		cursor.execute('SELECT name_crypto FROM crypto')
-		result = [row[0] for row in cursor.fetchall()]
-		connect.close()
-		return result
+		return [row[0] for row in DB.fetchall(INVEST_DB, 'SELECT name_crypto FROM crypto')]
 
 	#получение недвижимости
 	def get_homes(self):
-		connect = sqlite3.connect("data/invest.db")
-		cursor = connect.cursor()
-		cursor.execute('SELECT name_homes FROM homes')
-		result = [row[0] for row in cursor.fetchall()]
-		connect.close()
-		return result
+		return [row[0] for row in DB.fetchall(INVEST_DB, 'SELECT name_homes FROM homes')]
 
 	#получение активов
 	def get_actives(self):
-		connect = sqlite3.connect("data/invest.db")
-		cursor = connect.cursor()
-		cursor.execute('SELECT name_actives FROM actives')
-		result = [row[0] for row in cursor.fetchall()]
-		connect.close()
-		return result
+		return [row[0] for row in DB.fetchall(INVEST_DB, 'SELECT name_actives FROM actives')]
 
 	# White shop
 	# получение островов для магазина
 	def get_shop_islands(self):
-		connect = sqlite3.connect("data/white_shop.db")
-		cursor = connect.cursor()
-		cursor.execute('SELECT id, name_island, price_island, description FROM island')
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(WHITE_SHOP_DB, 'SELECT id, name_island, price_island, description FROM island')
 
 	# получение бустеров для магазина
 	def get_shop_boosters(self):
-		connect = sqlite3.connect("data/white_shop.db")
-		cursor = connect.cursor()
-		cursor.execute('SELECT id, name_boosters, price_boosters, description, time_boosters, increase_income FROM boosters')
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(WHITE_SHOP_DB, 'SELECT id, name_boosters, price_boosters, description, time_boosters, increase_income FROM boosters')
 
 	def get_shop_nft(self):
-		connect = sqlite3.connect("data/white_shop.db")
-		cursor = connect.cursor()
-		cursor.execute('SELECT id, name_NFT, price_NFT, description FROM NFT')
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(WHITE_SHOP_DB, 'SELECT id, name_NFT, price_NFT, description FROM NFT')
 
 	def get_shop_cars(self):
-		connect = sqlite3.connect("data/white_shop.db")
-		cursor = connect.cursor()
-		cursor.execute('SELECT id, name_cars, price_cars, description, type, max_speed FROM cars')
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(WHITE_SHOP_DB, 'SELECT id, name_cars, price_cars, description, type, max_speed FROM cars')
 	
 	def get_shop_u_items(self):
-		connect = sqlite3.connect("data/white_shop.db")
-		cursor = connect.cursor()
-		cursor.execute('SELECT id, name_unique_items, price_unique_items, description FROM unique_items')
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(WHITE_SHOP_DB, 'SELECT id, name_unique_items, price_unique_items, description FROM unique_items')
 
 	def get_shop_yachts(self):
-		connect = sqlite3.connect("data/white_shop.db")
-		cursor = connect.cursor()
-		cursor.execute('SELECT id, name_yacht, price_yacht, description FROM yacht')
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(WHITE_SHOP_DB, 'SELECT id, name_yacht, price_yacht, description FROM yacht')
 		
 	def get_shop_planes(self):
-		connect = sqlite3.connect("data/white_shop.db")
-		cursor = connect.cursor()
-		cursor.execute('SELECT id, name_airplanes, price_airplanes, description FROM airplanes')
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(WHITE_SHOP_DB, 'SELECT id, name_airplanes, price_airplanes, description FROM airplanes')
 
 	def get_shop_jewelry(self):
-		connect = sqlite3.connect("data/white_shop.db")
-		cursor = connect.cursor()
-		cursor.execute('SELECT id, name_jewelry, price_jewelry, description FROM jewelry')
-		result = cursor.fetchall()
-		for results in result:
-			return results
-		connect.close()
+		return DB.fetchone(WHITE_SHOP_DB, 'SELECT id, name_jewelry, price_jewelry, description FROM jewelry')
+
+#журнал кошелька: клики и пассивный доход копятся в памяти,
+#а в data.db уходят одной транзакцией по таймеру или после накопления изменений
+class WalletLedger:
+	def __init__(self, path=DATA_DB, flush_interval=2.0, flush_threshold=100):
+		self.path = path
+		self.flush_interval = flush_interval
+		self.flush_threshold = flush_threshold
+		self._balance = None
+		self._dirty = 0
+		self._stamp = None
+		self._economy = None
+		self._lock = threading.Lock()
+		self._flush_lock = threading.Lock()
+		self._wakeup = threading.Event()
+		self._stopped = False
+		self._writer = None
+
+	#текущий баланс с учётом ещё не записанных изменений
+	def balance(self):
+		with self._lock:
+			self._load()
+			return self._balance
+
+	#зачисление суммы (клик, доход бизнеса и т.д.)
+	def credit(self, amount):
+		with self._lock:
+			self._load()
+			self._balance += amount
+			# баланс после этого начисления: после выхода из блокировки его может изменить другой поток
+			balance = self._balance
+			threshold_reached = self._mark_dirty()
+		self._after_change(threshold_reached)
+		return balance
+
+	#списание суммы (покупка, улучшение); False и без изменений, если денег не хватает
+	def debit(self, amount):
+		with self._lock:
+			self._load()
+			if amount > self._balance:
+				return False
+			self._balance -= amount
+			threshold_reached = self._mark_dirty()
+		self._after_change(threshold_reached)
+		return True
+
+	#момент последнего начисления дохода по времени (None - игра ещё ни разу не запускалась)
+	#таблицу game_clock создаёт миграция data.db при запуске
+	def last_tick(self):
+		row = DB.fetchone(self.path, 'SELECT last_tick FROM game_clock WHERE id = 1')
+		return row[0] if row else None
+
+	#сохранённое вместе с отметкой времени состояние экономики бизнесов (None, если его ещё нет)
+	def economy_state(self):
+		row = DB.fetchone(self.path, 'SELECT economy FROM game_clock WHERE id = 1')
+		return json.loads(row[0]) if row and row[0] else None
+
+	#отметка времени начисления и состояние экономики на этот момент; пишутся в базу вместе с балансом
+	def stamp(self, timestamp, economy=None):
+		economy = None if economy is None else json.dumps(economy, ensure_ascii=False)
+		with self._lock:
+			self._stamp = timestamp
+			if economy is not None:
+				self._economy = economy
+		self._start_writer()
+
+	#запись накопленных изменений: одно обновление на таблицу вместо четырёх на клик
+	def flush(self):
+		with self._flush_lock:
+			with self._lock:
+				if not self._dirty and self._stamp is None:
+					return False
+				balance = self._balance
+				dirty = self._dirty
+				stamp = self._stamp
+				economy = self._economy
+				self._dirty = 0
+				self._stamp = None
+				self._economy = None
+			try:
+				with DB.get(self.path) as connection:
+					if dirty:
+						connection.execute('UPDATE wallet SET balance = ?, all_moneys = ?', (balance, balance))
+						connection.execute('UPDATE status SET balance = ?, all_money = ?', (balance, balance))
+					if stamp is not None:
+						connection.execute('INSERT INTO game_clock(id, last_tick) VALUES (1, ?) '
+							'ON CONFLICT(id) DO UPDATE SET last_tick = excluded.last_tick', (stamp,))
+					if economy is not None:
+						connection.execute('UPDATE game_clock SET economy = ? WHERE id = 1', (economy,))
+			except sqlite3.Error:
+				# возвращаем признак изменений, чтобы повторить запись позже
+				with self._lock:
+					self._dirty += dirty
+					if self._stamp is None:
+						self._stamp = stamp
+					if self._economy is None:
+						self._economy = economy
+				raise
+		return True
+
+	#остановка фонового писателя с финальной записью (при выходе из игры)
+	def close(self):
+		self._stopped = True
+		self._wakeup.set()
+		if self._writer is not None and self._writer is not threading.current_thread():
+			self._writer.join(timeout=5)
+		self.flush()
+
+	def _mark_dirty(self):
+		self._dirty += 1
+		return self._dirty >= self.flush_threshold
+
+	def _after_change(self, threshold_reached):
+		self._start_writer()
+		if threshold_reached:
+			self._wakeup.set()
+
+	def _load(self):
+		if self._balance is None:
+			self._balance = DB.fetchone(self.path, 'SELECT balance FROM wallet')[0]
+
+	def _start_writer(self):
+		if self._writer is None and not self._stopped:
+			self._writer = threading.Thread(target=self._run, name='WalletLedgerWriter', daemon=True)
+			self._writer.start()
+
+	def _run(self):
+		while not self._stopped:
+			self._wakeup.wait(self.flush_interval)
+			self._wakeup.clear()
+			try:
+				self.flush()
+			except sqlite3.Error as e:
+				print(f"Ошибка записи кошелька: {e}")
+
+LEDGER = WalletLedger()
+atexit.register(LEDGER.close)
+
+#снимок строки wallet
+class WalletSnapshot(NamedTuple):
+	all_moneys: float
+	balance: float
+	moneys_one_click: float
+	moneys_in_hour: float
+	moneys_rent_in_hour: float
+	taxes: float
+
+#снимок строки status
+class StatusSnapshot(NamedTuple):
+	all_money: float
+	balance: float
+	income_business: float
+	income_rent: float
+	actives: float
+	amount_business: int
+	amount_homes: int
+	amount_company: int
+	amount_cars: int
+	amount_airplanes: int
+	amount_yachts: int
+	amount_items: int
+	amount_islands: int
+	earn_clicks: float
+	earn_business: float
+	earn_rent: float
+	earn_crypto: float
+
+#кэш снимков: wallet и status читаются одним запросом и хранятся до явного сброса
+class SnapshotCache:
+	def __init__(self, path=DATA_DB):
+		self.path = path
+		self._wallet = None
+		self._status = None
+		self._lock = threading.Lock()
+		columns = ', '.join([f'wallet.{name}' for name in WalletSnapshot._fields] +
+			[f'status.{name}' for name in StatusSnapshot._fields])
+		self._query = f'SELECT {columns} FROM wallet JOIN status ON status.id = wallet.id'
+
+	#снимок wallet; баланс берётся из журнала, поэтому клики не сбрасывают кэш
+	def wallet(self):
+		wallet, _ = self._load()
+		balance = LEDGER.balance()
+		return wallet._replace(balance=balance, all_moneys=balance)
+
+	#снимок status с актуальным балансом из журнала
+	def status(self):
+		_, status = self._load()
+		balance = LEDGER.balance()
+		return status._replace(balance=balance, all_money=balance)
+
+	#сброс кэша после записи в wallet или status
+	def invalidate(self):
+		with self._lock:
+			self._wallet = None
+			self._status = None
+
+	def _load(self):
+		with self._lock:
+			if self._wallet is None:
+				row = DB.fetchone(self.path, self._query)
+				split = len(WalletSnapshot._fields)
+				self._wallet = WalletSnapshot(*row[:split])
+				self._status = StatusSnapshot(*row[split:])
+			return self._wallet, self._status
+
+SNAPSHOTS = SnapshotCache()
+
+#доход за seconds секунд при ставке rate_per_hour в час
+def hourly_income(rate_per_hour, seconds):
+	return rate_per_hour * seconds / 3600
+
+#итог начисления по часам экономики
+class ClockReport(NamedTuple):
+	elapsed: float
+	income: float
+
+#часы экономики - единственный источник времени для дохода: за фактически прошедшее время
+#продвигают подключённую экономику бизнесов и начисляют аренду по ставке из wallet -
+#и в игре, и за время, пока игра была закрыта. Состояние экономики сохраняется вместе с отметкой времени,
+#поэтому после перезапуска она продолжается ровно с того момента
+class GameClock:
+	def __init__(self, ledger=LEDGER):
+		self.ledger = ledger
+		self.economy = None
+		self._last_tick = None
+		self._advancing = False
+
+	#подключение экономики бизнесов (объект с advance(seconds) -> доход и save_state())
+	def attach(self, economy):
+		self.economy = economy
+
+	#начисление дохода с прошлого тика до now
+	def advance(self, now=None):
+		# вызов изнутри продвижения (например, из вложенного цикла событий) ничего не начисляет:
+		# экономика уже ушла вперед по своему времени, и промежуток посчитался бы дважды
+		if self._advancing:
+			return ClockReport(0.0, 0.0)
+		now = time.time() if now is None else now
+		if self._last_tick is None:
+			last_tick = self.ledger.last_tick()
+			# первый запуск: начислять пока нечего
+			self._last_tick = now if last_tick is None else last_tick
+		elapsed = max(0.0, now - self._last_tick)
+		self._last_tick = now
+		# доход бизнесов (и исследования, обучение, ресурсы) считает экономика, она же зачисляет его в журнал;
+		# ставка moneys_in_hour здесь не начисляется, иначе бизнес-доход учитывался бы дважды
+		self._advancing = True
+		try:
+			income = self.economy.advance(elapsed) if self.economy is not None else 0.0
+		finally:
+			self._advancing = False
+		rent = hourly_income(SNAPSHOTS.wallet().moneys_rent_in_hour, elapsed)
+		if rent:
+			self.ledger.credit(rent)
+		self.ledger.stamp(now, None if self.economy is None else self.economy.save_state())
+		return ClockReport(elapsed, income + rent)
+
+CLOCK = GameClock()
 
 #класс для обновления в базе данных	
 class UpdateDB:
+	#создание не обращается к базе: баланс обновляется явным вызовом update_balance_and_condition
 	def __init__(self):
 		self.export = ExportDB()
-		self.update_balance_and_condition()
+		self.ledger = LEDGER
 	
-	#обновляем данные о балансе в базе данных
+	#обновляем данные о балансе (запись в базу выполняет журнал кошелька)
 	def update_balance_and_condition(self):
-		balance = self.export.balance()
-		balance += self.export.earn_one_click()
-		with sqlite3.connect('data/data.db') as connection:
-			cursor = connection.cursor()
-			cursor.execute('UPDATE wallet SET balance = ?', (balance,))
-			cursor.execute('UPDATE status SET balance = ?', (balance,))
-			cursor.execute('UPDATE status SET all_money = ?', (balance,))
-			cursor.execute('UPDATE wallet SET all_moneys = ?', (balance,))
-			connection.commit()
+		return self.ledger.credit(self.export.earn_one_click())
+
+#товар магазина
+@dataclass(slots=True)
+class Product:
+	id: int
+	name: str
+	price: int
+	description: str
+	category: str
+	stats: str = ""
+
+#таблицы white_shop.db: ключ категории -> (таблица, название категории, столбец имени, столбец цены, столбцы характеристик)
+SHOP_TABLES = {
+	'islands': ('island', 'Острова', 'name_island', 'price_island', ()),
+	'boosters': ('boosters', 'Бустеры', 'name_boosters', 'price_boosters', ('time_boosters', 'increase_income')),
+	'nft': ('NFT', 'NFT', 'name_NFT', 'price_NFT', ()),
+	'cars': ('cars', 'Машины', 'name_cars', 'price_cars', ('type', 'max_speed')),
+	'unique': ('unique_items', 'Уникальные предметы', 'name_unique_items', 'price_unique_items', ()),
+	'yachts': ('yacht', 'Яхты', 'name_yacht', 'price_yacht', ()),
+	'planes': ('airplanes', 'Самолёты', 'name_airplanes', 'price_airplanes', ()),
+	'jewelry': ('jewelry', 'Ювелирные изделия', 'name_jewelry', 'price_jewelry', ()),
+}
+
+#каталог магазина: все таблицы читаются за один проход, товары индексируются по категории и id,
+#при изменении базы обновляются только изменившиеся записи
+class ShopCatalog:
+	def __init__(self, path=WHITE_SHOP_DB, tables=SHOP_TABLES):
+		self.path = path
+		self.tables = tables
+		self._products = {}
+		self._rows = {}
+		self._db_state = None
+		self._version_connection = None
+		self._lock = threading.RLock()
+
+	#загрузка всех категорий (один раз при старте)
+	def load(self):
+		with self._lock:
+			if self._db_state is None:
+				self._db_state = self._current_state()
+				for category in self.tables:
+					self._sync(category)
+			return self
+
+	#повторное чтение, если база менялась; возвращает список изменившихся категорий
+	def refresh(self):
+		with self._lock:
+			if self._db_state is None:
+				self.load()
+				return list(self.tables)
+			state = self._current_state()
+			if state == self._db_state:
+				return []
+			self._db_state = state
+			return [category for category in self.tables if self._sync(category)]
+
+	#все товары категории
+	def products(self, category):
+		with self._lock:
+			self.load()
+			return list(self._products.get(category, {}).values())
+
+	#товар по категории и id
+	def get(self, category, product_id):
+		with self._lock:
+			self.load()
+			return self._products.get(category, {}).get(product_id)
+
+	#ленивый обход категории: из кэша, а если каталог ещё не загружен - порциями прямо из базы
+	def iter_products(self, category, batch_size=100):
+		if self._db_state is not None:
+			yield from self.products(category)
+			return
+		cursor = DB.get(self.path).execute(self._query(category))
+		while True:
+			rows = cursor.fetchmany(batch_size)
+			if not rows:
+				break
+			for row in rows:
+				yield self._make_product(category, row)
+
+	def _query(self, category):
+		table, _, name_column, price_column, stats_columns = self.tables[category]
+		columns = ', '.join(('id', name_column, price_column, 'description') + stats_columns)
+		return f'SELECT {columns} FROM {table}'
+
+	def _make_product(self, category, row):
+		stats = ', '.join(str(value) for value in row[4:])
+		return Product(row[0], row[1], row[2], row[3], self.tables[category][1], stats)
+
+	#сверка категории с базой: пересоздаются только новые и изменённые товары
+	def _sync(self, category):
+		rows = {row[0]: row for row in DB.fetchall(self.path, self._query(category))}
+		old_rows = self._rows.get(category, {})
+		if rows == old_rows:
+			return False
+		old_products = self._products.get(category, {})
+		products = {}
+		for product_id, row in rows.items():
+			if old_rows.get(product_id) == row:
+				products[product_id] = old_products[product_id]
+			else:
+				products[product_id] = self._make_product(category, row)
+		self._rows[category] = rows
+		self._products[category] = products
+		return True
+
+	#data_version считается отдельно для каждого соединения, поэтому версия всегда читается через одно
+	#собственное соединение каталога (load идёт в потоке запуска, refresh - в главном; доступ под self._lock).
+	#Это соединение ничего не пишет, так что версия меняется после любой записи в базу
+	def _current_state(self):
+		if self._version_connection is None:
+			self._version_connection = sqlite3.connect(self.path, check_same_thread=False)
+		return self._version_connection.execute('PRAGMA data_version').fetchone()[0]
+
+CATALOG = ShopCatalog()
+
+#столбцы таблицы businesses, из которых собирается словарь бизнеса
+BUSINESS_COLUMNS = ('id', 'name', 'icon', 'level', 'income_per_hour', 'workers', 'workload', 'primary_action',
+	'type', 'risk', 'price', 'can_go_dark', 'ev_production', 'bio_prosthetics', 'neuro_chips', 'servers',
+	'data_center', 'heat_recovery', 'botnet_active', 'trust_level', 'max_launder_amount', 'crypto_reserve_usage')
+BUSINESS_FLAG_COLUMNS = {'can_go_dark', 'ev_production', 'bio_prosthetics', 'neuro_chips', 'data_center',
+	'heat_recovery', 'botnet_active'}
+
+#поля бизнеса, от которых зависят столбцы EconomyEngine
+ECONOMY_KEYS = frozenset({'income_per_hour'})
+
+#характеристики бизнеса, которые считаются из базы и стека модификаторов
+DERIVED_STATS = ('income_per_hour', 'risk', 'workers')
+
+#слои модификаторов в порядке применения
+MODIFIER_LAYERS = ('upgrades', 'specialization', 'research', 'operations', 'synergies', 'events', 'boosters')
+_LAYER_ORDER = {layer: order for order, layer in enumerate(MODIFIER_LAYERS)}
+
+#границы, за которые модификаторы не выводят характеристику (если база уже за границей, граница сдвигается к ней)
+STAT_LIMITS = {
+	'income_per_hour': (0, float('inf')),
+	'risk': (5, float('inf')),
+	'workers': (1, float('inf')),
+}
+
+#модификатор характеристики: значение умножается на factor, затем к нему прибавляется offset
+class Modifier(NamedTuple):
+	factor: float = 1.0
+	offset: float = 0.0
+
+#производные характеристики бизнеса: база и упорядоченный по слоям стек модификаторов.
+#Значение считается при первом чтении и кэшируется до смены базы или модификатора этой характеристики;
+#пересчёт всегда идёт от базы, поэтому округление выполняется один раз и не накапливается
+class StatSheet:
+	__slots__ = ('base', '_modifiers', '_cache')
+
+	def __init__(self):
+		self.base = {}
+		self._modifiers = {}
+		self._cache = {}
+
+	def value(self, stat):
+		try:
+			return self._cache[stat]
+		except KeyError:
+			pass
+		if stat not in self.base:
+			raise AttributeError(stat)
+		value = self._cache[stat] = self._compute(stat)
+		return value
+
+	def set_base(self, stat, value):
+		self.base[stat] = value
+		self._invalidate(stat)
+
+	def del_base(self, stat):
+		del self.base[stat]
+		self._invalidate(stat)
+
+	#поставить модификатор source в слое layer (нейтральный модификатор снимается)
+	def set_modifier(self, layer, source, stat, factor=1.0, offset=0.0):
+		if layer not in _LAYER_ORDER:
+			raise ValueError(f"Неизвестный слой модификаторов: {layer}")
+		if factor == 1.0 and offset == 0.0:
+			self.remove_modifier(layer, source, stat)
+			return
+		modifiers = self._modifiers.setdefault(stat, {})
+		modifier = Modifier(factor, offset)
+		if modifiers.get((layer, source)) != modifier:
+			modifiers[(layer, source)] = modifier
+			self._invalidate(stat)
+
+	def remove_modifier(self, layer, source, stat):
+		modifiers = self._modifiers.get(stat)
+		if modifiers and modifiers.pop((layer, source), None) is not None:
+			self._invalidate(stat)
+
+	#стек модификаторов характеристики в порядке применения: [(слой, источник, Modifier)]
+	def modifiers(self, stat):
+		items = self._modifiers.get(stat, {}).items()
+		return [(layer, source, modifier) for (layer, source), modifier in sorted(items, key=_modifier_order)]
+
+	def copy(self):
+		sheet = StatSheet()
+		sheet.base = dict(self.base)
+		sheet._modifiers = {stat: dict(modifiers) for stat, modifiers in self._modifiers.items()}
+		return sheet
+
+	def _invalidate(self, stat):
+		self._cache.pop(stat, None)
+		if stat in ECONOMY_KEYS:
+			BusinessState.revision += 1
+
+	def _compute(self, stat):
+		base = value = self.base[stat]
+		if not self._modifiers.get(stat):
+			return base
+		for layer, source, modifier in self.modifiers(stat):
+			value = value * modifier.factor + modifier.offset
+		low, high = STAT_LIMITS.get(stat, (float('-inf'), float('inf')))
+		return round(min(max(high, base), max(min(low, base), value)))
+
+#модификаторы сортируются по слою; внутри слоя сохраняется порядок установки
+def _modifier_order(item):
+	return _LAYER_ORDER[item[0][0]]
+
+#свойство BusinessState для производной характеристики: чтение - из StatSheet, запись - в базу
+def _derived_stat(stat):
+	def get(self):
+		return self.stats.value(stat)
+
+	def set(self, value):
+		self.stats.set_base(stat, value)
+
+	def delete(self):
+		if stat not in self.stats.base:
+			raise AttributeError(stat)
+		self.stats.del_base(stat)
+
+	return property(get, set, delete)
+
+#рабочая модель бизнеса для экономики: частые поля хранятся в слотах и читаются как атрибуты,
+#редкие флаги фич и данные конкретных бизнесов - в разреженном словаре extra.
+#Доступ business['key'] / business.get() / update() сохранён, поэтому модель заменяет прежние словари
+class BusinessState(MutableMapping):
+	id: int
+	name: str
+	icon: str
+	type: str
+	category: str
+	description: str
+	primary_action: str
+	price: int
+	level: int
+	experience: int
+	is_owned: bool
+	income_per_hour: float
+	base_income: float
+	risk: float
+	base_risk: float
+	workers: int
+	base_workers: int
+	workload: int
+	base_upgrade_cost: int
+	can_go_dark: bool
+	special_mechanics: dict
+	unique_features: list
+	unlocked_features: list
+	upgrade_system: object
+	specialization: object
+	resource_system: object
+	current_research: str
+	current_training: str
+
+	FIELDS = tuple(__annotations__)
+	__slots__ = tuple(name for name in FIELDS if name not in DERIVED_STATS) + ('extra', 'stats')
+
+	#доход, риск и работники - производные характеристики (база и модификаторы лежат в stats)
+	income_per_hour = _derived_stat('income_per_hour')
+	risk = _derived_stat('risk')
+	workers = _derived_stat('workers')
+
+	#счётчик изменений полей из ECONOMY_KEYS у всех бизнесов (по нему EconomyEngine пересобирает столбцы)
+	revision = 0
+
+	def __init__(self, data=(), **fields):
+		self.extra = {}
+		self.stats = StatSheet()
+		self.update(data, **fields)
+
+	#бизнес из строки таблицы businesses (столбцы BUSINESS_COLUMNS); редкие флаги уходят в extra
+	@classmethod
+	def from_db_row(cls, row):
+		business = cls()
+		for column, value in zip(BUSINESS_COLUMNS, row):
+			business[column] = bool(value) if column in BUSINESS_FLAG_COLUMNS else value
+		return business
+
+	def __getitem__(self, key):
+		if key in _BUSINESS_SLOTS:
+			try:
+				return getattr(self, key)
+			except AttributeError:
+				raise KeyError(key) from None
+		return self.extra[key]
+
+	def __setitem__(self, key, value):
+		if key in ECONOMY_KEYS:
+			BusinessState.revision += 1
+		if key in _BUSINESS_SLOTS:
+			setattr(self, key, value)
+		else:
+			self.extra[key] = value
+
+	def __delitem__(self, key):
+		if key in ECONOMY_KEYS:
+			BusinessState.revision += 1
+		if key in _BUSINESS_SLOTS:
+			try:
+				delattr(self, key)
+			except AttributeError:
+				raise KeyError(key) from None
+		else:
+			del self.extra[key]
+
+	def __contains__(self, key):
+		if key in _BUSINESS_SLOTS:
+			return hasattr(self, key)
+		return key in self.extra
+
+	def __iter__(self):
+		for name in self.FIELDS:
+			if hasattr(self, name):
+				yield name
+		yield from self.extra
+
+	def __len__(self):
+		return sum(1 for name in self.FIELDS if hasattr(self, name)) + len(self.extra)
+
+	def get(self, key, default=None):
+		if key in _BUSINESS_SLOTS:
+			return getattr(self, key, default)
+		return self.extra.get(key, default)
+
+	#поверхностная копия, как у dict.copy(); производные характеристики копируются вместе с модификаторами
+	def copy(self):
+		business = BusinessState()
+		for name in self.FIELDS:
+			if name not in DERIVED_STATS and hasattr(self, name):
+				setattr(business, name, getattr(self, name))
+		business.extra = dict(self.extra)
+		business.stats = self.stats.copy()
+		return business
+
+	def __repr__(self):
+		return f"BusinessState({dict(self)!r})"
+
+_BUSINESS_SLOTS = frozenset(BusinessState.FIELDS)
+
+#реестр собственных бизнесов: список в порядке покупки и индексы по id, имени и категории.
+#Индексы поддерживаются при покупке и продаже, поэтому поиск на тике экономики и при отрисовке - O(1)
+class BusinessRegistry:
+	def __init__(self, businesses=()):
+		self._items = []
+		self._by_id = {}
+		self._by_name = {}
+		self._by_category = {}
+		for business in businesses:
+			self.add(business)
+
+	#добавить бизнес (словарь приводится к BusinessState)
+	def add(self, business):
+		if not isinstance(business, BusinessState):
+			business = BusinessState(business)
+		if business['id'] in self._by_id:
+			raise ValueError(f"Бизнес {business['id']} уже есть в реестре")
+		self._items.append(business)
+		self._by_id[business['id']] = business
+		self._by_name[business['name']] = business
+		self._by_category.setdefault(business.get('category'), []).append(business)
+		# состав бизнесов изменился: столбцы EconomyEngine нужно пересобрать
+		BusinessState.revision += 1
+		return business
+
+	#убрать бизнес по id; возвращает его или None
+	def remove(self, business_id):
+		business = self._by_id.pop(business_id, None)
+		if business is None:
+			return None
+		self._items.remove(business)
+		if self._by_name.get(business['name']) is business:
+			del self._by_name[business['name']]
+		self._by_category[business.get('category')].remove(business)
+		BusinessState.revision += 1
+		return business
+
+	def by_id(self, business_id):
+		return self._by_id.get(business_id)
+
+	def by_name(self, name):
+		return self._by_name.get(name)
+
+	#бизнесы категории в порядке покупки
+	def in_category(self, category):
+		return tuple(self._by_category.get(category, ()))
+
+	def count(self, category):
+		return len(self._by_category.get(category, ()))
+
+	#множество id купленных бизнесов (представление ключей индекса, без копирования)
+	@property
+	def owned_ids(self):
+		return self._by_id.keys()
+
+	def __contains__(self, business_id):
+		return business_id in self._by_id
+
+	def __iter__(self):
+		return iter(self._items)
+
+	def __len__(self):
+		return len(self._items)
+
+#ресурсы, которые расходуются и восстанавливаются со временем: имя -> (скорость в секунду, минимум, максимум)
+RESOURCE_RATES = {
+	'energy': (-0.1, 0.0, float('inf')),
+	'bandwidth': (-0.1, 0.0, float('inf')),
+	'client_base': (0.05, float('-inf'), 100.0),
+	'reputation': (0.05, float('-inf'), 100.0),
+}
+
+#уровень ресурса через seconds секунд: расход/восстановление линейные с ограничением,
+#поэтому результат не зависит от того, считать одним шагом или по 5 секунд
+def resource_level(name, value, seconds):
+	if name not in RESOURCE_RATES:
+		return value
+	rate, low, high = RESOURCE_RATES[name]
+	return min(high, max(low, value + rate * seconds))
+
+#векторизованный тик экономики (нужен numpy): доход и уровни ресурсов всех бизнесов лежат в столбцах
+#и пересчитываются несколькими операциями над массивами.
+#Столбцы пересобираются только при изменении состава бизнесов или полей из ECONOMY_KEYS
+class EconomyEngine:
+	def __init__(self):
+		self.available = np is not None
+		self._businesses = None
+		self._count = 0
+		self._revision = None
+		self._resource_refs = []
+
+	#принудительная пересборка столбцов на следующем тике
+	def invalidate(self):
+		self.sync()
+		self._businesses = None
+
+	#продвинуть экономику на dt секунд; возвращает доход за этот промежуток
+	def tick(self, businesses, dt):
+		if (businesses is not self._businesses or len(businesses) != self._count
+				or BusinessState.revision != self._revision):
+			self._rebuild(businesses)
+		income = float(self._income.sum()) * dt / 3600
+		values = self._resource_values
+		values += self._resource_rate * dt
+		np.clip(values, self._resource_low, self._resource_high, out=values)
+		return income
+
+	#запись уровней ресурсов обратно в BusinessResourceSystem.resources
+	def sync(self):
+		if self._resource_refs:
+			for (resources, name), value in zip(self._resource_refs, self._resource_values.tolist()):
+				resources[name] = value
+
+	def _rebuild(self, businesses):
+		self.sync()
+		self._businesses = businesses
+		self._count = len(businesses)
+		self._revision = BusinessState.revision
+		self._income = np.fromiter((business.get('income_per_hour', 0) for business in businesses), float, self._count)
+		refs, rates = [], []
+		for business in businesses:
+			resource_system = business.get('resource_system')
+			if resource_system is None:
+				continue
+			for name in resource_system.resources:
+				if name in RESOURCE_RATES:
+					refs.append((resource_system.resources, name))
+					rates.append(RESOURCE_RATES[name])
+		self._resource_refs = refs
+		self._resource_values = np.array([resources[name] for resources, name in refs], dtype=float)
+		rates = np.array(rates, dtype=float).reshape(-1, 3)
+		self._resource_rate, self._resource_low, self._resource_high = rates[:, 0], rates[:, 1], rates[:, 2]
+
+#единицы длительности в строках вида '6ч', '30мин', '2д'
+DURATION_UNITS = {'с': 1, 'мин': 60, 'м': 60, 'ч': 3600, 'д': 86400}
+_DURATION_PATTERN = re.compile(r'(\d+(?:[.,]\d+)?)\s*(мин|с|м|ч|д)')
+
+#длительность из строки ('6ч', '1.5ч', '30мин') в секундах
+def parse_duration(text):
+	match = _DURATION_PATTERN.search(str(text))
+	if match is None:
+		raise ValueError(f"Неизвестная длительность: {text!r}")
+	return float(match.group(1).replace(',', '.')) * DURATION_UNITS[match.group(2)]
+
+#оставшееся время для подписей: '2 ч 05 мин', '12 мин' (неполная минута округляется вверх)
+def format_duration(seconds):
+	hours, minutes = divmod(-int(-seconds // 60), 60)
+	return f"{hours} ч {minutes:02d} мин" if hours else f"{minutes} мин"
+
+#запланированное событие: срок, время запуска, ключ и данные владельца
+class Deadline(NamedTuple):
+	due: float
+	started: float
+	key: tuple
+	payload: object
+
+#планировщик сроков: запуск исследования, обучения, кулдауна или бустера кладёт срок завершения в кучу,
+#тик снимает только наступившие события, а процент выполнения считается по запросу.
+#Перепланирование и отмена кучу не трогают: устаревшие записи отбрасываются, когда доходят до вершины
+class DeadlineScheduler:
+	def __init__(self):
+		self._heap = []
+		self._entries = {}
+		self._order = itertools.count()
+
+	#запланировать событие key через seconds секунд (прежний срок того же ключа отменяется)
+	def schedule(self, key, seconds, payload=None, now=None):
+		now = time.time() if now is None else now
+		deadline = Deadline(now + seconds, now, key, payload)
+		self._entries[key] = deadline
+		heapq.heappush(self._heap, (deadline.due, next(self._order), deadline))
+		self._compact()
+		return deadline
+
+	def cancel(self, key):
+		deadline = self._entries.pop(key, None)
+		self._compact()
+		return deadline
+
+	#отменённых и перезапланированных записей стало больше живых - пересобираем кучу
+	def _compact(self):
+		if len(self._heap) > 2 * len(self._entries) + 16:
+			self._heap = [item for item in self._heap if self._entries.get(item[2].key) is item[2]]
+			heapq.heapify(self._heap)
+
+	def get(self, key):
+		return self._entries.get(key)
+
+	def __contains__(self, key):
+		return key in self._entries
+
+	def __len__(self):
+		return len(self._entries)
+
+	#действующие события в порядке сроков
+	def __iter__(self):
+		return iter(sorted(self._entries.values(), key=lambda deadline: deadline.due))
+
+	#снять события, срок которых наступил к now, в порядке сроков
+	def pop_due(self, now=None):
+		now = time.time() if now is None else now
+		heap, entries, due = self._heap, self._entries, []
+		while heap and heap[0][0] <= now:
+			deadline = heapq.heappop(heap)[2]
+			if entries.get(deadline.key) is deadline:
+				del entries[deadline.key]
+				due.append(deadline)
+		return due
+
+	#ближайший срок среди действующих событий (None, если событий нет)
+	def next_due(self):
+		heap, entries = self._heap, self._entries
+		while heap and entries.get(heap[0][2].key) is not heap[0][2]:
+			heapq.heappop(heap)
+		return heap[0][0] if heap else None
+
+	#секунд до срока key (0, если события нет или срок уже наступил)
+	def remaining(self, key, now=None):
+		deadline = self._entries.get(key)
+		if deadline is None:
+			return 0.0
+		now = time.time() if now is None else now
+		return max(0.0, deadline.due - now)
+
+	#процент выполнения key от запуска до срока (0, если события нет)
+	def progress(self, key, now=None):
+		deadline = self._entries.get(key)
+		if deadline is None:
+			return 0.0
+		now = time.time() if now is None else now
+		span = deadline.due - deadline.started
+		if span <= 0:
+			return 100.0
+		return min(100.0, max(0.0, (now - deadline.started) / span * 100))
+
+#ребро графа синергий: пара бизнесов (по имени), требуемые уровни в том же порядке и множители эффектов
+class SynergyEdge(NamedTuple):
+	name: str
+	members: tuple
+	levels: tuple
+	effects: dict
+
+#инкрементальные синергии: рёбра индексируются по бизнесам, и при изменении уровня или владения
+#пересчитываются только рёбра этого бизнеса. Эффекты не записываются в бизнес, а хранятся
+#производными множителями: повторная оценка ничего не накапливает
+class SynergyEngine:
+	def __init__(self):
+		self.edges = []
+		self._edge_keys = set()
+		self._edges_of = {}
+		self._levels = {}
+		self._active = set()
+		self._dirty = set()
+		self._multipliers = {}
+
+	#добавить ребро; пара, уже заданная другим источником, не дублируется
+	def add(self, name, members, levels=None, effects=None):
+		key = frozenset(members)
+		if key in self._edge_keys:
+			return
+		self._edge_keys.add(key)
+		index = len(self.edges)
+		self.edges.append(SynergyEdge(name, tuple(members), tuple(levels or (1,) * len(members)), dict(effects or {})))
+		for member in members:
+			self._edges_of.setdefault(member, []).append(index)
+			self._dirty.add(member)
+
+	#пары из таблицы business_synergies: без требований к уровню и без множителей
+	def add_catalog(self, path=BUSINESSES_DB):
+		query = ('SELECT businesses.name, business_synergies.synergy_name FROM business_synergies '
+			'JOIN businesses ON businesses.id = business_synergies.business_id')
+		for name, partner in DB.fetchall(path, query):
+			self.add(f"{name} + {partner}", (name, partner))
+
+	#бизнес куплен или сменил уровень
+	def set_level(self, business_name, level):
+		if self._levels.get(business_name) != level:
+			self._levels[business_name] = level
+			self._dirty.add(business_name)
+
+	#бизнес больше не принадлежит игроку
+	def discard(self, business_name):
+		if self._levels.pop(business_name, None) is not None:
+			self._dirty.add(business_name)
+
+	#пересчитать рёбра изменившихся бизнесов; возвращает (включённые, выключенные) рёбра
+	def update(self):
+		if not self._dirty:
+			return [], []
+		changed = {index for name in self._dirty for index in self._edges_of.get(name, ())}
+		self._dirty.clear()
+		activated, deactivated, touched = [], [], set()
+		for index in changed:
+			edge = self.edges[index]
+			active = all(self._levels.get(member, 0) >= level for member, level in zip(edge.members, edge.levels))
+			if active == (index in self._active):
+				continue
+			if active:
+				self._active.add(index)
+				activated.append(edge)
+			else:
+				self._active.discard(index)
+				deactivated.append(edge)
+			touched.update(edge.members)
+		for member in touched:
+			self._rebuild_multipliers(member)
+		return activated, deactivated
+
+	#множитель эффекта бизнеса от действующих синергий (1.0, если их нет)
+	def multiplier(self, business_name, effect):
+		return self._multipliers.get(business_name, {}).get(effect, 1.0)
+
+	#действующие синергии бизнеса или все действующие
+	def active(self, business_name=None):
+		indexes = self._active if business_name is None else self._active.intersection(self._edges_of.get(business_name, ()))
+		return [self.edges[index] for index in sorted(indexes)]
+
+	def _rebuild_multipliers(self, member):
+		multipliers = {}
+		for index in self._edges_of[member]:
+			if index in self._active:
+				for effect, value in self.edges[index].effects.items():
+					multipliers[effect] = multipliers.get(effect, 1.0) * value
+		if multipliers:
+			self._multipliers[member] = multipliers
+		else:
+			self._multipliers.pop(member, None)
+
+#загрузка бизнесов: каждая дочерняя таблица читается одним запросом и группируется по business_id,
+#так что полная загрузка занимает 6 запросов вместо 1 + 5 на каждый бизнес
+class BusinessLoader:
+	def __init__(self, path=BUSINESSES_DB):
+		self.path = path
+		self._children = None
+
+	#все бизнесы с ролями, режимами, синергиями, тёмными действиями и улучшениями
+	def load_all(self):
+		self._children = None
+		query = f"SELECT {', '.join(BUSINESS_COLUMNS)} FROM businesses"
+		return [self.hydrate(row) for row in DB.fetchall(self.path, query)]
+
+	#бизнес из строки businesses (данные дочерних таблиц берутся из общего кэша)
+	def hydrate(self, row):
+		business = BusinessState.from_db_row(row)
+		roles, modes, synergies, dark_actions, upgrades = self._load_children()
+		business_id = business['id']
+		business['available_roles'] = roles.get(business_id, [])
+		business['special_modes'] = modes.get(business_id, [])
+		business['synergies'] = synergies.get(business_id, [])
+		business['dark_actions'] = dark_actions.get(business_id, [])
+		for upgrade_type, level in upgrades.get(business_id, ()):
+			business[f'upgrade_{upgrade_type}'] = level
+		return business
+
+	#сброс кэша дочерних таблиц после записи в них
+	def invalidate(self):
+		self._children = None
+
+	def _load_children(self):
+		if self._children is None:
+			self._children = (
+				self._group('SELECT business_id, name, cost, effect FROM business_roles ORDER BY business_id, id',
+					lambda r: {'name': r[1], 'cost': r[2], 'effect': r[3]}),
+				self._group('SELECT business_id, name, cooldown, cost, effect FROM special_modes ORDER BY business_id, id',
+					lambda r: {'name': r[1], 'cooldown': r[2], 'cost': r[3], 'effect': r[4]}),
+				self._group('SELECT business_id, synergy_name FROM business_synergies ORDER BY business_id, id',
+					lambda r: r[1]),
+				self._group('SELECT business_id, name, income_multiplier, risk_increase FROM dark_actions ORDER BY business_id, id',
+					lambda r: {'name': r[1], 'income_multiplier': r[2], 'risk_increase': r[3]}),
+				self._group('SELECT business_id, upgrade_type, level FROM business_upgrades ORDER BY business_id, id',
+					lambda r: (r[1], r[2])),
+			)
+		return self._children
+
+	def _group(self, query, make):
+		grouped = {}
+		for row in DB.fetchall(self.path, query):
+			grouped.setdefault(row[0], []).append(make(row))
+		return grouped
+
+#хранилище config.json в памяти: файл читается один раз и перечитывается,
+#только если его изменили извне (по mtime); запись атомарная через временный файл
+class ConfigStore:
+	def __init__(self, path=CONFIG_PATH, check_interval=1.0):
+		self.path = path
+		#не чаще раза в check_interval секунд проверяем, не изменили ли файл извне
+		self.check_interval = check_interval
+		self._config = None
+		self._mtime = None
+		self._checked = None
+		self._batch_depth = 0
+		self._dirty = False
+		self._lock = threading.RLock()
+
+	#значение по ключу
+	def get(self, key):
+		with self._lock:
+			return self._data()[key]
+
+	#изменение значения; внутри batch() запись откладывается до выхода из блока
+	def set(self, key, value):
+		with self._lock:
+			self._data()[key] = value
+			self._dirty = True
+			if not self._batch_depth:
+				self.save()
+
+	#группировка нескольких изменений в одну запись файла
+	@contextmanager
+	def batch(self):
+		with self._lock:
+			self._batch_depth += 1
+			try:
+				yield self
+			finally:
+				self._batch_depth -= 1
+				if not self._batch_depth and self._dirty:
+					self.save()
+
+	#атомарная запись: временный файл в той же папке + os.replace
+	def save(self):
+		with self._lock:
+			directory = os.path.dirname(os.path.abspath(self.path))
+			fd, temp_path = tempfile.mkstemp(prefix='.config-', suffix='.json', dir=directory)
+			try:
+				with os.fdopen(fd, 'w', encoding='utf-8') as file:
+					json.dump(self._config, file, ensure_ascii=False, indent=4)
+				# mkstemp создаёт файл с правами 0600, сохраняем права исходного
+				if os.path.exists(self.path):
+					os.chmod(temp_path, os.stat(self.path).st_mode & 0o777)
+				os.replace(temp_path, self.path)
+			except BaseException:
+				os.unlink(temp_path)
+				raise
+			self._mtime = os.stat(self.path).st_mtime_ns
+			self._dirty = False
+
+	#повторное чтение файла, если его изменили извне
+	def reload_if_changed(self):
+		with self._lock:
+			if self._dirty:
+				return False
+			self._checked = time.monotonic()
+			mtime = os.stat(self.path).st_mtime_ns
+			if mtime == self._mtime:
+				return False
+			with open(self.path, 'r', encoding='utf-8') as file:
+				self._config = json.load(file)
+			self._mtime = mtime
+			return True
+
+	#на горячих путях stat файла не делается: проверка по таймеру check_interval
+	def _data(self):
+		if self._config is None or time.monotonic() - self._checked >= self.check_interval:
+			self.reload_if_changed()
+		return self._config
+
+CONFIG = ConfigStore()
 
 class Settings:
 	def __init__(self):
+		self.config = CONFIG
 		# Сохраняем полученные значения в атрибуты объекта
 		self.current_theme = self.get_current_theme()
 		self.current_state = self.get_window_state()
@@ -278,145 +1307,90 @@ class Settings:
 		self.languages = self.show_langs()
 		self.state = self.show_states()
 
+	#несколько set_current_* подряд сохраняются одной записью файла
+	def batch(self):
+		return self.config.batch()
+
 	#импортирование текущей темы
 	def get_current_theme(self):
-		with open("data/config.json", 'r', encoding='utf-8') as file:
-			config_current_theme = json.load(file)
-		return config_current_theme["current_theme"]
+		return self.config.get("current_theme")
 	
 	def get_current_volume(self):
-		with open("data/config.json", 'r', encoding='utf-8') as file:
-			config_current_volume = json.load(file)
-		return config_current_volume["current_volume"]
+		return self.config.get("current_volume")
 	
 	def get_window_state(self):
-		with open("data/config.json", 'r', encoding='utf-8') as file:
-			config_current_state = json.load(file)
-		state = config_current_state["current_state"]
+		state = self.config.get("current_state")
 		if isinstance(state, list) and len(state) > 0:
 			state = state[0]
 		return state
 	
 	def get_current_quality(self):
-		with open("data/config.json", 'r', encoding='utf-8') as file:
-			config_current_quality = json.load(file)
-		quality = config_current_quality["current_quality"]
+		quality = self.config.get("current_quality")
 		if isinstance(quality, list) and len(quality) > 0:
 			quality = quality[0]
 		return quality 
     #импортирование текущей размера экрана
 	def get_current_window_size(self):
-		with open("data/config.json", 'r', encoding='utf-8') as file:
-			config_current_window_size = json.load(file)
-		return config_current_window_size["current_window_size"]
+		return self.config.get("current_window_size")
     
     #импортирование текущего фпс
 	def get_current_fps(self):
-		with open("data/config.json", 'r', encoding='utf-8') as file:
-			config_current_fps = json.load(file)
-		return config_current_fps["current_fps"]
+		return self.config.get("current_fps")
     
     #импортирование текущего языка
 	def get_current_lang(self):
-		with open("data/config.json", 'r', encoding='utf-8') as file:
-			config_current_lang = json.load(file)
-		return config_current_lang["current_lang"]
+		return self.config.get("current_lang")
     
     #установка выбранной темы
 	def set_current_theme(self, theme: str):
-		with open("data/config.json", "r+", encoding="utf-8") as file:
-			config = json.load(file)
-			config["current_theme"] = theme
-			file.seek(0)
-			json.dump(config, file, ensure_ascii=False, indent=4)
-			file.truncate()
+		self.config.set("current_theme", theme)
 		self.current_theme = theme  # Обновляем текущее значение
 		return "Done"
 
     #установка размера экрана
 	def set_current_window_size(self, height: int, width: int):
-		with open("data/config.json", "r+", encoding="utf-8") as file:
-			config = json.load(file)
-			config["current_window_size"] = [height, width]
-			file.seek(0)
-			json.dump(config, file, ensure_ascii=False, indent=4)
-			file.truncate()
+		self.config.set("current_window_size", [height, width])
 		self.current_window_size = [height, width]  # Обновляем текущее значение
 		return "Done"
 	
 	#установка размера экрана
 	def set_current_quality(self, quality: str):
-		with open("data/config.json", "r+", encoding="utf-8") as file:
-			config = json.load(file)
-			config["current_quality"] = quality
-			file.seek(0)
-			json.dump(config, file, ensure_ascii=False, indent=4)
-			file.truncate()
+		self.config.set("current_quality", quality)
 		self.current_quality = quality  # Обновляем текущее значение
 		return "Done"
 	
 	def set_current_window_state(self, state: str):
-		with open("data/config.json", "r+", encoding="utf-8") as file:
-			config = json.load(file)
-			config["current_state"] = state
-			file.seek(0)
-			json.dump(config, file, ensure_ascii=False, indent=4)
-			file.truncate()
+		self.config.set("current_state", state)
 		self.current_state = state  # Обновляем текущее значение
 		return "Done"
 
     #установка фпс
 	def set_current_fps(self, fps: int):
-		with open("data/config.json", "r+", encoding="utf-8") as file:
-			config = json.load(file)
-			config["current_fps"] = fps
-			file.seek(0)
-			json.dump(config, file, ensure_ascii=False, indent=4)
-			file.truncate()
+		self.config.set("current_fps", fps)
 		self.current_fps = fps  # Обновляем текущее значение
 		return "Done"
 
     #установка языка
 	def set_current_lang(self, lang: str):
-		with open("data/config.json", "r+", encoding="utf-8") as file:
-			config = json.load(file)
-			config["current_lang"] = lang
-			file.seek(0)
-			json.dump(config, file, ensure_ascii=False, indent=4)
-			file.truncate()
+		self.config.set("current_lang", lang)
 		self.current_lang = lang  # Обновляем текущее значение
 		return "Done"
 
     #показ всех тем
 	def show_themes(self):
-		with open("data/config.json", 'r', encoding='utf-8') as file:
-			config_themes = json.load(file)
-			result_themes = config_themes["themes"]
-		return result_themes
+		return self.config.get("themes")
 
     #показ всех размеров экрана
 	def show_window_sizes(self):
-		with open("data/config.json", 'r', encoding='utf-8') as file:
-			config_window_sizes = json.load(file)
-			result_W_S = config_window_sizes["window_size"]
-		return result_W_S
+		return self.config.get("window_size")
 
     #показ всех фпс
 	def show_fps(self):
-		with open("data/config.json", 'r', encoding='utf-8') as file:
-			config_fps = json.load(file)
-			result_fps = config_fps["FPS"]
-		return result_fps
+		return self.config.get("FPS")
     
     #показ всех языков
 	def show_langs(self):
-		with open("data/config.json", 'r', encoding='utf-8') as file:
-			config_langs = json.load(file)
-			result_langs = config_langs["languages"]
-		return result_langs
+		return self.config.get("languages")
 	
 	def show_states(self):
-		with open("data/config.json", 'r', encoding='utf-8') as file:
-			config_states = json.load(file)
-			result_states = config_states["state"]
-		return result_states
+		return self.config.get("state")
@@ -0,0 +1,995 @@
+import argparse
+import math
+import random
+import time
+from typing import NamedTuple
+
+import coreLogic
+
+# Экономика бизнесов без Qt: системы улучшений, специализаций и ресурсов и сама экономика
+# с явным шагом времени. Окно подключает ее через AdvancedBusinessManager в main.py,
+# а из консоли ее можно прокрутить вперед: python economy.py --hours 720
+
+
+class BusinessUpgradeSystem:
+    """Универсальная система улучшений для всех бизнесов"""
+    
+    UPGRADE_TYPES = {
+        1: {"name": "⚡ Производительность", "effect": "increase_speed", "icon": "⚡", "description": "Увеличивает скорость операций и доход"},
+        2: {"name": "🎯 Качество", "effect": "increase_quality", "icon": "🎯", "description": "Повышает качество продукции и снижает риски"},
+        3: {"name": "🤖 Автоматизация", "effect": "increase_automation", "icon": "🤖", "description": "Уменьшает потребность в работниках"},
+        4: {"name": "💡 Инновация", "effect": "unlock_features", "icon": "💡", "description": "Открывает уникальные возможности"},
+        5: {"name": "🛡️ Безопасность", "effect": "increase_security", "icon": "🛡️", "description": "Повышает защиту и снижает риски"}
+    }
+    
+    def __init__(self, business):
+        self.business = business
+        self.levels = {1: 1, 2: 1, 3: 1, 4: 1, 5: 1}
+        self.max_level = 5
+        
+    def get_upgrade_cost(self, upgrade_type, current_level):
+        """Расчет стоимости улучшения"""
+        base_cost = self.business.get('base_upgrade_cost', 15000)
+        return int(base_cost * (2.5 ** (current_level - 1)))
+    
+    def can_upgrade(self, upgrade_type):
+        """Можно ли улучшить"""
+        current_level = self.levels.get(upgrade_type, 1)
+        return current_level < self.max_level
+    
+    def upgrade(self, upgrade_type, player_balance):
+        """Улучшение с проверкой стоимости"""
+        if not self.can_upgrade(upgrade_type):
+            return False, "Максимальный уровень достигнут"
+            
+        current_level = self.levels[upgrade_type]
+        cost = self.get_upgrade_cost(upgrade_type, current_level)
+        
+        if player_balance < cost:
+            return False, f"Недостаточно средств. Нужно ${cost:,}"
+        
+        self.levels[upgrade_type] += 1
+        self.apply_upgrade_effect(upgrade_type, self.levels[upgrade_type])
+        return True, f"Улучшение {self.UPGRADE_TYPES[upgrade_type]['name']} повышено до уровня {self.levels[upgrade_type]}"
+    
+    def apply_upgrade_effect(self, upgrade_type, new_level):
+        """Применение эффектов улучшения"""
+        effects = {
+            1: self._apply_productivity_effect,
+            2: self._apply_quality_effect, 
+            3: self._apply_automation_effect,
+            4: self._apply_innovation_effect,
+            5: self._apply_security_effect
+        }
+        
+        if upgrade_type in effects:
+            effects[upgrade_type](new_level)
+    
+    def _apply_productivity_effect(self, level):
+        """Эффект производительности"""
+        multiplier = 1.0 + (level - 1) * 0.3  # +30% за уровень
+        self.business.stats.set_modifier('upgrades', 'productivity', 'income_per_hour', multiplier)
+        self.business['efficiency'] = multiplier
+    
+    def _apply_quality_effect(self, level):
+        """Эффект качества"""
+        quality_bonus = (level - 1) * 0.2  # +20% за уровень
+        self.business['quality_level'] = 1.0 + quality_bonus
+        self.business.stats.set_modifier('upgrades', 'quality', 'risk', offset=-(level - 1) * 5)
+    
+    def _apply_automation_effect(self, level):
+        """Эффект автоматизации"""
+        automation_rate = (level - 1) * 0.25  # +25% автоматизации за уровень
+        self.business['automation_level'] = automation_rate
+        self.business.stats.set_modifier('upgrades', 'automation', 'workers', 1 - automation_rate)
+    
+    def _apply_innovation_effect(self, level):
+        """Эффект инноваций"""
+        innovation_features = {
+            2: "basic_innovation",
+            3: "advanced_innovation", 
+            4: "premium_innovation",
+            5: "breakthrough_technology"
+        }
+        
+        if level in innovation_features:
+            feature = innovation_features[level]
+            if 'unlocked_features' not in self.business:
+                self.business['unlocked_features'] = []
+            self.business['unlocked_features'].append(feature)
+            self.unlock_business_specific_feature(feature, level)
+    
+    def _apply_security_effect(self, level):
+        """Эффект безопасности"""
+        security_bonus = (level - 1) * 0.15
+        self.business['security_level'] = security_bonus
+        self.business.stats.set_modifier('upgrades', 'security', 'risk', offset=-(level - 1) * 3)
+    
+    def unlock_business_specific_feature(self, feature, level):
+        """Разблокировка уникальных фич для каждого бизнеса"""
+        business_name = self.business['name']
+        
+        feature_map = {
+            'Биотех Лаборатория': {
+                'basic_innovation': {'research_speed': 1.2},
+                'advanced_innovation': {'clinical_trials': True},
+                'premium_innovation': {'gene_editing': True, 'income_multiplier': 1.4},
+                'breakthrough_technology': {'neuro_implants': True, 'bio_prosthetics': True, 'income_multiplier': 1.8}
+            },
+            'Автопром': {
+                'basic_innovation': {'production_speed': 1.3},
+                'advanced_innovation': {'hybrid_tech': True},
+                'premium_innovation': {'ev_platform': True, 'income_multiplier': 1.6},
+                'breakthrough_technology': {'autonomous_driving': True, 'flying_cars': True, 'income_multiplier': 2.0}
+            },
+            'AI разработки': {
+                'basic_innovation': {'training_speed': 1.25},
+                'advanced_innovation': {'neural_networks': True},
+                'premium_innovation': {'quantum_computing': True, 'income_multiplier': 1.7},
+                'breakthrough_technology': {'agi_development': True, 'income_multiplier': 2.2}
+            }
+        }
+        
+        if business_name in feature_map and feature in feature_map[business_name]:
+            feature_data = feature_map[business_name][feature]
+            self.business.update(feature_data)
+            
+            # Применяем множитель дохода если есть
+            if 'income_multiplier' in feature_data:
+                multiplier = feature_data['income_multiplier']
+                self.business.stats.set_modifier('upgrades', 'innovation', 'income_per_hour', multiplier)
+
+class BusinessSpecialization:
+    """Система специализации бизнесов"""
+    
+    SPECIALIZATIONS = {
+        'tech': {
+            'name': 'Технологическая специализация',
+            'icon': '💻',
+            'effects': {'research_bonus': 0.3, 'innovation_speed': 1.4}
+        },
+        'production': {
+            'name': 'Производственная специализация', 
+            'icon': '🏭',
+            'effects': {'production_bonus': 0.4, 'cost_reduction': 0.2}
+        },
+        'service': {
+            'name': 'Сервисная специализация',
+            'icon': '🛎️',
+            'effects': {'client_retention': 0.35, 'premium_pricing': 1.3}
+        },
+        'research': {
+            'name': 'Исследовательская специализация',
+            'icon': '🔬',
+            'effects': {'breakthrough_chance': 0.25, 'patent_income': 1.5}
+        }
+    }
+    
+    def __init__(self, business):
+        self.business = business
+        self.current_specialization = None
+        self.specialization_level = 0
+    
+    def set_specialization(self, specialization_type):
+        """Установка специализации"""
+        if specialization_type in self.SPECIALIZATIONS:
+            self.current_specialization = specialization_type
+            self.specialization_level = 1
+            self.apply_specialization_effects()
+            return True
+        return False
+    
+    def apply_specialization_effects(self):
+        """Применение эффектов специализации"""
+        if self.current_specialization:
+            effects = self.SPECIALIZATIONS[self.current_specialization]['effects']
+            self.business.update(effects)
+
+class BusinessResourceSystem:
+    """Система управления ресурсами бизнеса"""
+    
+    def __init__(self, business):
+        self.business = business
+        self.resources = {}
+        self.supply_chain = []
+        self.init_resources()
+    
+    def init_resources(self):
+        """Инициализация ресурсов в зависимости от типа бизнеса"""
+        business_type = self.business['type']
+        
+        resource_templates = {
+            'tech': {'servers': 0, 'bandwidth': 100, 'compute_power': 50},
+            'manufacturing': {'raw_materials': 100, 'energy': 80, 'logistics': 70},
+            'research': {'lab_equipment': 50, 'research_data': 30, 'talent': 80},
+            'service': {'client_base': 100, 'service_capacity': 70, 'reputation': 60}
+        }
+        
+        self.resources = resource_templates.get(business_type, {})
+    
+    def update_resources(self, delta_time):
+        """Обновление ресурсов за delta_time секунд (любой промежуток - одной формулой)"""
+        for resource, value in self.resources.items():
+            self.resources[resource] = coreLogic.resource_level(resource, value, delta_time)
+
+class Wallet:
+    """Баланс в памяти с интерфейсом журнала кошелька coreLogic.LEDGER: для прокрутки экономики без базы"""
+    
+    def __init__(self, balance=0.0):
+        self._balance = balance
+    
+    def balance(self):
+        return self._balance
+    
+    def credit(self, amount):
+        self._balance += amount
+        return self._balance
+    
+    def debit(self, amount):
+        """Списание; False и без изменений, если денег не хватает"""
+        if amount > self._balance:
+            return False
+        self._balance -= amount
+        return True
+
+
+class EconomyEvent(NamedTuple):
+    """Событие экономики для подписчиков: вид, игровое время и данные"""
+    kind: str
+    time: float
+    data: dict
+
+
+class BusinessEconomy:
+    """Экономика бизнесов без Qt: время продвигается явным dt, о событиях узнают подписчики.
+    
+    События экономики: 'income' (amount; одно на вызов advance), 'research_completed' (business, project, multiplier),
+    'training_completed' (business, model, multiplier), 'global_event_started' / 'global_event_ended' (event),
+    'booster_expired' (name).
+    
+    save_state() и restore_state() переводят купленные бизнесы, сроки и ресурсы игрока в JSON-совместимый
+    словарь и обратно: игра хранит его рядом с отметкой времени часов и после запуска продвигает
+    восстановленную экономику на время отсутствия.
+    """
+    
+    EVENT_ROLL_INTERVAL = 5.0  # Период, для которого задан шанс глобального события, секунды
+    GLOBAL_EVENT_CHANCE = 0.01  # Шанс глобального события за период
+    # Слои модификаторов, которые сохраняются; синергии и события пересчитываются при восстановлении
+    SAVED_LAYERS = ('upgrades', 'specialization', 'research', 'operations', 'boosters')
+    # Поля бизнеса, которые не сохраняются как есть: системы восстанавливаются отдельно
+    SYSTEM_FIELDS = ('upgrade_system', 'specialization', 'resource_system')
+    
+    def __init__(self, now=None, rng=None, synergy_catalog=coreLogic.BUSINESSES_DB, wallet=None):
+        self.now = time.time() if now is None else now  # Игровое время экономики
+        self.random = rng if rng is not None else random.Random()
+        self.subscribers = []
+        self.my_businesses = coreLogic.BusinessRegistry()  # Купленные бизнесы с индексами по id, имени и категории
+        self.available_businesses = self.create_business_templates()
+        self.templates = {template['id']: template for template in self.available_businesses}
+        self.synergies = {}
+        self.synergy_engine = coreLogic.SynergyEngine()  # Граф синергий с производными множителями
+        self.global_events = []
+        self.market_conditions = {'demand': 1.0, 'competition': 1.0, 'regulation': 1.0}
+        self.economy_engine = coreLogic.EconomyEngine()
+        self.deadlines = coreLogic.DeadlineScheduler()  # Сроки исследований, обучений, событий и бустеров
+        
+        # Игровые ресурсы; деньги - только в кошельке (в игре это журнал coreLogic.LEDGER)
+        self.wallet = wallet if wallet is not None else Wallet(1000000)
+        self.crypto_balance = 50000
+        self.reputation = 100
+        self.risk_level = 0
+        self.innovation_points = 0
+        
+        self.init_synergies(synergy_catalog)
+        self.init_global_events()
+        self.schedule_event_roll()
+    
+    @property
+    def player_balance(self):
+        return self.wallet.balance()
+    
+    def subscribe(self, callback):
+        """Подписка на события экономики: callback(EconomyEvent)"""
+        self.subscribers.append(callback)
+    
+    def unsubscribe(self, callback):
+        self.subscribers.remove(callback)
+    
+    def emit(self, kind, **data):
+        event = EconomyEvent(kind, self.now, data)
+        for callback in list(self.subscribers):
+            callback(event)
+    
+    def create_business_templates(self):
+        """Создание шаблонов всех бизнесов с глубокими механиками"""
+        businesses = []
+        
+        # 1. БИОТЕХ ЛАБОРАТОРИЯ
+        businesses.append({
+            'id': 1, 'name': 'Биотех Лаборатория', 'icon': '🔬', 'type': 'research',
+            'base_income': 12000, 'base_risk': 30, 'base_workers': 15,
+            'price': 200000, 'base_upgrade_cost': 25000,
+            'category': 'light', 'can_go_dark': True,
+            'description': 'Передовые исследования в генной инженерии и биотехнологиях',
+            'primary_action': 'Запустить исследование',
+            'special_mechanics': {
+                'research_projects': [
+                    {'name': 'Генная терапия', 'cost': 80000, 'duration': 48, 'reward': 1.6},
+                    {'name': 'Синтетическая биология', 'cost': 120000, 'duration': 72, 'reward': 2.2},
+                    {'name': 'Нейроимпланты', 'cost': 200000, 'duration': 96, 'reward': 3.0}
+                ],
+                'clinical_trials': True,
+                'patent_system': True
+            },
+            'unique_features': ['gene_sequencing', 'crispr_tech', 'bio_printing'],
+            'upgrade_system': None,
+            'specialization': None,
+            'resource_system': None,
+            'current_research': None,
+            'patents': [],
+            'unlocked_features': []
+        })
+        
+        # 2. АВТОПРОМ (EV ФОКУС)
+        businesses.append({
+            'id': 2, 'name': 'Автопром', 'icon': '🚗', 'type': 'manufacturing',
+            'base_income': 15000, 'base_risk': 25, 'base_workers': 20,
+            'price': 250000, 'base_upgrade_cost': 30000,
+            'category': 'light', 'can_go_dark': False,
+            'description': 'Производство электромобилей и автономного транспорта',
+            'primary_action': 'Запустить производство', 
+            'special_mechanics': {
+                'production_lines': [
+                    {'type': 'ICE', 'efficiency': 1.0, 'cost': 50000},
+                    {'type': 'Hybrid', 'efficiency': 1.4, 'cost': 100000},
+                    {'type': 'EV', 'efficiency': 2.0, 'cost': 200000},
+                    {'type': 'Autonomous', 'efficiency': 3.0, 'cost': 500000}
+                ],
+                'battery_tech': True,
+                'charging_network': True
+            },
+            'unique_features': ['ev_platform', 'battery_production', 'autonomous_ai'],
+            'upgrade_system': None,
+            'specialization': None,
+            'resource_system': None,
+            'current_production': 'ICE',
+            'battery_level': 1,
+            'charging_stations': 0,
+            'unlocked_features': []
+        })
+        
+        # 3. AI РАЗРАБОТКИ
+        businesses.append({
+            'id': 3, 'name': 'AI разработки', 'icon': '🤖', 'type': 'tech',
+            'base_income': 18000, 'base_risk': 35, 'base_workers': 12,
+            'price': 300000, 'base_upgrade_cost': 35000,
+            'category': 'light', 'can_go_dark': True,
+            'description': 'Разработка искусственного интеллекта и машинного обучения',
+            'primary_action': 'Запустить обучение',
+            'special_mechanics': {
+                'ai_models': [
+                    {'name': 'Компьютерное зрение', 'cost': 60000, 'training_time': 36},
+                    {'name': 'Обработка языка', 'cost': 80000, 'training_time': 48},
+                    {'name': 'Преобразующее обучение', 'cost': 150000, 'training_time': 72}
+                ],
+                'data_centers': True,
+                'cloud_services': True
+            },
+            'unique_features': ['neural_networks', 'deep_learning', 'quantum_ai'],
+            'upgrade_system': None,
+            'specialization': None,
+            'resource_system': None,
+            'current_training': None,
+            'servers': 0,
+            'data_centers': 0,
+            'unlocked_features': []
+        })
+        
+        # 4. КОСМИЧЕСКИЙ ТУРИЗМ
+        businesses.append({
+            'id': 4, 'name': 'Космический туризм', 'icon': '🚀', 'type': 'service',
+            'base_income': 25000, 'base_risk': 40, 'base_workers': 8,
+            'price': 500000, 'base_upgrade_cost': 50000,
+            'category': 'light', 'can_go_dark': False,
+            'description': 'Орбитальные полеты и космические отели',
+            'primary_action': 'Запустить полет',
+            'special_mechanics': {
+                'spacecrafts': [
+                    {'type': 'Суборбитальный', 'capacity': 6, 'cost': 300000},
+                    {'type': 'Орбитальный', 'capacity': 4, 'cost': 800000},
+                    {'type': 'Лунный', 'capacity': 2, 'cost': 2000000}
+                ],
+                'space_stations': True,
+                'zeroG_experiences': True
+            },
+            'unique_features': ['reusable_rockets', 'space_hotels', 'mars_missions'],
+            'upgrade_system': None,
+            'specialization': None,
+            'resource_system': None,
+            'current_craft': None,
+            'flights_completed': 0,
+            'space_stations': 0,
+            'unlocked_features': []
+        })
+        
+        # 5. ВИРТУАЛЬНАЯ РЕАЛЬНОСТЬ
+        businesses.append({
+            'id': 5, 'name': 'Виртуальная реальность', 'icon': '🥽', 'type': 'tech',
+            'base_income': 14000, 'base_risk': 20, 'base_workers': 10,
+            'price': 180000, 'base_upgrade_cost': 22000,
+            'category': 'light', 'can_go_dark': True,
+            'description': 'Иммерсивные VR/AR решения и метавселенные',
+            'primary_action': 'Запустить платформу',
+            'special_mechanics': {
+                'vr_platforms': [
+                    {'name': 'Социальная VR', 'cost': 40000, 'users': 10000},
+                    {'name': 'Образовательная VR', 'cost': 60000, 'users': 5000},
+                    {'name': 'Корпоративная VR', 'cost': 80000, 'users': 2000}
+                ],
+                'metaverse': True,
+                'haptic_tech': True
+            },
+            'unique_features': ['full_immersion', 'brain_computer', 'digital_twins'],
+            'upgrade_system': None,
+            'specialization': None,
+            'resource_system': None,
+            'active_platforms': [],
+            'user_base': 0,
+            'metaverse_development': 0,
+            'unlocked_features': []
+        })
+        
+        # 6. КРИПТО-МАЙНИНГ
+        businesses.append({
+            'id': 6, 'name': 'Крипто-майнинг', 'icon': '⛏️', 'type': 'tech',
+            'base_income': 16000, 'base_risk': 45, 'base_workers': 5,
+            'price': 150000, 'base_upgrade_cost': 20000,
+            'category': 'dark', 'can_go_dark': False,
+            'description': 'Добыча криптовалюты с передовыми фермами',
+            'primary_action': 'Запустить майнинг',
+            'special_mechanics': {
+                'mining_rigs': [
+                    {'type': 'GPU Ферма', 'hashrate': 500, 'cost': 50000},
+                    {'type': 'ASIC Майнер', 'hashrate': 2000, 'cost': 100000},
+                    {'type': 'Квантовый Майнер', 'hashrate': 10000, 'cost': 500000}
+                ],
+                'heat_recovery': True,
+                'green_mining': True
+            },
+            'unique_features': ['quantum_mining', 'decentralized_finance', 'smart_contracts'],
+            'upgrade_system': None,
+            'specialization': None,
+            'resource_system': None,
+            'mining_rigs': [],
+            'total_hashrate': 0,
+            'energy_efficiency': 1.0,
+            'unlocked_features': []
+        })
+        
+        # 7. КИБЕРБЕЗОПАСНОСТЬ
+        businesses.append({
+            'id': 7, 'name': 'Кибербезопасность', 'icon': '🛡️', 'type': 'tech',
+            'base_income': 17000, 'base_risk': 15, 'base_workers': 15,
+            'price': 220000, 'base_upgrade_cost': 28000,
+            'category': 'light', 'can_go_dark': True,
+            'description': 'Защита от кибератак и консалтинг по безопасности',
+            'primary_action': 'Запустить защиту', 
+            'special_mechanics': {
+                'security_services': [
+                    {'name': 'Pentesting', 'cost': 30000, 'clients': 10},
+                    {'name': 'SOC Мониторинг', 'cost': 50000, 'clients': 5},
+                    {'name': 'Криптография', 'cost': 80000, 'clients': 3}
+                ],
+                'threat_intelligence': True,
+                'zero_trust': True
+            },
+            'unique_features': ['quantum_encryption', 'ai_threat_detection', 'blockchain_security'],
+            'upgrade_system': None,
+            'specialization': None,
+            'resource_system': None,
+            'security_contracts': [],
+            'threat_level': 0,
+            'client_trust': 100,
+            'unlocked_features': []
+        })
+        
+        # Инициализация систем для каждого бизнеса (словари шаблонов -> BusinessState)
+        businesses = [coreLogic.BusinessState(business) for business in businesses]
+        for business in businesses:
+            business['upgrade_system'] = BusinessUpgradeSystem(business)
+            business['specialization'] = BusinessSpecialization(business)
+            business['resource_system'] = BusinessResourceSystem(business)
+            business['income_per_hour'] = business['base_income']
+            business['risk'] = business['base_risk']
+            business['workers'] = business['base_workers']
+            business['level'] = 1
+            business['experience'] = 0
+            
+        return businesses
+    
+    def init_synergies(self, catalog=coreLogic.BUSINESSES_DB):
+        """Инициализация синергий между бизнесами (catalog - база с business_synergies или None)"""
+        self.synergies = {
+            ('Биотех Лаборатория', 'AI разработки'): {
+                'name': 'Био-ИИ Синергия',
+                'description': 'AI ускоряет генетические исследования',
+                'bonus': 1.4,
+                'requirements': {'biotech_level': 3, 'ai_level': 3},
+                'effects': {'research_speed': 1.5, 'breakthrough_chance': 0.3}
+            },
+            ('Автопром', 'Крипто-майнинг'): {
+                'name': 'Зеленая энергия',
+                'description': 'Тепло от майнинга питает EV заводы',
+                'bonus': 1.3,
+                'requirements': {'auto_level': 2, 'mining_level': 4},
+                'effects': {'energy_costs': 0.7, 'production_speed': 1.25}
+            },
+            ('Космический туризм', 'Виртуальная реальность'): {
+                'name': 'Космическая VR',
+                'description': 'VR симуляции космических полетов',
+                'bonus': 1.6,
+                'requirements': {'space_level': 3, 'vr_level': 4},
+                'effects': {'customer_demand': 1.8, 'premium_pricing': 1.4}
+            },
+            ('Кибербезопасность', 'Крипто-майнинг'): {
+                'name': 'Безопасный майнинг',
+                'description': 'Повышенная защита крипто-операций',
+                'bonus': 1.35,
+                'requirements': {'security_level': 4, 'mining_level': 3},
+                'effects': {'security_bonus': 0.5, 'risk_reduction': 0.4}
+            }
+        }
+        
+        # Требования перечислены в порядке пары: первое относится к первому бизнесу, второе - ко второму.
+        # Бонус синергии - множитель дохода обоих бизнесов
+        for pair, synergy in self.synergies.items():
+            effects = dict(synergy['effects'], income_per_hour=synergy['bonus'])
+            self.synergy_engine.add(synergy['name'], pair, tuple(synergy['requirements'].values()), effects)
+        if catalog is not None:
+            self.synergy_engine.add_catalog(catalog)
+    
+    def init_global_events(self):
+        """Инициализация глобальных событий"""
+        self.global_events = [
+            {
+                'name': 'Технологический прорыв',
+                'description': 'Новые открытия ускоряют развитие',
+                'duration': 24,
+                'effects': {'research_speed': 1.3, 'innovation_chance': 0.2},
+                'active': False
+            },
+            {
+                'name': 'Экономический кризис',
+                'description': 'Рынки нестабильны, риски повышены',
+                'duration': 48,
+                'effects': {'demand': 0.7, 'risk': 1.4},
+                'active': False
+            },
+            {
+                'name': 'Регуляторные изменения',
+                'description': 'Новые законы влияют на бизнес',
+                'duration': 36,
+                'effects': {'compliance_costs': 1.3, 'innovation_speed': 0.8},
+                'active': False
+            }
+        ]
+    
+    def start_research(self, business_id, research_project):
+        """Запуск исследовательского проекта"""
+        business = self.get_business_by_id(business_id)
+        if not business or business['type'] != 'research':
+            return False, "Бизнес не поддерживает исследования"
+        
+        project_data = next((p for p in business['special_mechanics']['research_projects'] 
+                           if p['name'] == research_project), None)
+        
+        if not project_data:
+            return False, "Проект не найден"
+        
+        if business.get('current_research'):
+            return False, f"Исследование '{business['current_research']}' ещё идёт"
+        
+        if not self.wallet.debit(project_data['cost']):
+            return False, f"Недостаточно средств. Нужно ${project_data['cost']:,}"
+        
+        business['current_research'] = research_project
+        business['research_cost'] = project_data['cost']
+        business['research_duration'] = project_data['duration']
+        business['research_reward'] = project_data['reward']
+        self.deadlines.schedule(('research', business_id), project_data['duration'] * 3600, business, self.now)
+        
+        return True, f"Исследование '{research_project}' начато"
+    
+    def start_ai_training(self, business_id, model_name):
+        """Запуск обучения AI модели"""
+        business = self.get_business_by_id(business_id)
+        if not business or business['name'] != 'AI разработки':
+            return False, "Только AI бизнес может обучать модели"
+        
+        model_data = next((m for m in business['special_mechanics']['ai_models'] 
+                         if m['name'] == model_name), None)
+        
+        if not model_data:
+            return False, "Модель не найдена"
+        
+        if business.get('current_training'):
+            return False, f"Модель '{business['current_training']}' ещё обучается"
+        
+        if not self.wallet.debit(model_data['cost']):
+            return False, f"Недостаточно средств. Нужно ${model_data['cost']:,}"
+        
+        business['current_training'] = model_name
+        business['training_cost'] = model_data['cost']
+        business['training_duration'] = model_data['training_time']
+        self.deadlines.schedule(('training', business_id), model_data['training_time'] * 3600, business, self.now)
+        
+        return True, f"Обучение модели '{model_name}' начато"
+    
+    def upgrade_production_line(self, business_id, line_type):
+        """Обновление производственной линии"""
+        business = self.get_business_by_id(business_id)
+        if not business or business['name'] != 'Автопром':
+            return False, "Только автопром может обновлять линии"
+        
+        line_data = next((l for l in business['special_mechanics']['production_lines'] 
+                        if l['type'] == line_type), None)
+        
+        if not line_data:
+            return False, "Тип линии не найден"
+        
+        if not self.wallet.debit(line_data['cost']):
+            return False, f"Недостаточно средств. Нужно ${line_data['cost']:,}"
+        
+        business['current_production'] = line_type
+        business['production_efficiency'] = line_data['efficiency']
+        business.stats.set_modifier('operations', 'production_line', 'income_per_hour', line_data['efficiency'])
+        
+        return True, f"Производственная линия обновлена до {line_type}"
+    
+    def buy_mining_rig(self, business_id, rig_type):
+        """Покупка майнинг-рига"""
+        business = self.get_business_by_id(business_id)
+        if not business or business['name'] != 'Крипто-майнинг':
+            return False, "Только майнинг бизнес может покупать риги"
+        
+        rig_data = next((r for r in business['special_mechanics']['mining_rigs'] 
+                       if r['type'] == rig_type), None)
+        
+        if not rig_data:
+            return False, "Тип рига не найден"
+        
+        if not self.wallet.debit(rig_data['cost']):
+            return False, f"Недостаточно средств. Нужно ${rig_data['cost']:,}"
+        
+        if 'mining_rigs' not in business:
+            business['mining_rigs'] = []
+        
+        business['mining_rigs'].append(rig_data)
+        business['total_hashrate'] += rig_data['hashrate']
+        business.stats.set_modifier('operations', 'mining_rigs', 'income_per_hour', 1 + business['total_hashrate'] / 1000)
+        
+        return True, f"Майнинг-риг {rig_type} приобретен"
+    
+    def advance(self, dt):
+        """Продвинуть экономику на dt секунд игрового времени; возвращает начисленный доход.
+        
+        Сроки внутри промежутка обрабатываются в свой момент, а доход и ресурсы между ними
+        считаются одной формулой, поэтому один шаг на час дает тот же итог, что 720 шагов по 5 секунд.
+        """
+        end = self.now + dt
+        income = 0.0
+        while True:
+            due = self.deadlines.next_due()
+            if due is None or due > end:
+                break
+            income += self.accrue(due - self.now)
+            self.now = max(self.now, due)
+            for deadline in self.deadlines.pop_due(self.now):
+                self.complete(deadline)
+        income += self.accrue(end - self.now)
+        self.now = max(self.now, end)
+        self.apply_synergies()
+        # Одно событие дохода на весь промежуток, а не на каждый отрезок между сроками
+        if income:
+            self.emit('income', amount=income)
+        return income
+    
+    def accrue(self, seconds):
+        """Доход и ресурсы за seconds секунд без смены ставок; возвращает доход"""
+        if seconds <= 0:
+            return 0.0
+        if self.economy_engine.available:
+            income = self.economy_engine.tick(self.my_businesses, seconds)
+        else:
+            for business in self.my_businesses:
+                if business.resource_system:
+                    business.resource_system.update_resources(seconds)
+            total_income = sum(business.income_per_hour for business in self.my_businesses)
+            income = coreLogic.hourly_income(total_income, seconds)
+        if income:
+            self.wallet.credit(income)
+        return income
+    
+    def complete(self, deadline):
+        """Обработка наступившего срока"""
+        kind = deadline.key[0]
+        if kind == 'research':
+            self.complete_research(deadline.payload)
+        elif kind == 'training':
+            self.complete_training(deadline.payload)
+        elif kind == 'event':
+            self.end_global_event(deadline.payload)
+        elif kind == 'event_roll':
+            self.start_global_event()
+            self.schedule_event_roll()
+        elif kind == 'booster':
+            self.emit('booster_expired', name=deadline.key[1])
+    
+    def get_progress(self, business, kind):
+        """Процент выполнения исследования ('research') или обучения ('training'), считается по запросу"""
+        return self.deadlines.progress((kind, business['id']), self.now)
+    
+    def activate_boost(self, name, duration):
+        """Запуск бустера на duration секунд; False, если он ещё действует"""
+        key = ('booster', name)
+        if self.deadlines.remaining(key, self.now) > 0:
+            return False
+        self.deadlines.schedule(key, duration, name, self.now)
+        return True
+    
+    def boost_remaining(self, name):
+        """Сколько секунд ещё действует бустер"""
+        return self.deadlines.remaining(('booster', name), self.now)
+    
+    def complete_research(self, business):
+        """Завершение исследования"""
+        reward_multiplier = business['research_reward']
+        business.stats.set_modifier('research', self.completion_source(business, business['current_research']),
+                                    'income_per_hour', reward_multiplier)
+        
+        # Начисление инновационных очков
+        self.innovation_points += 50
+        
+        project = business['current_research']
+        business['current_research'] = None
+        self.emit('research_completed', business=business, project=project, multiplier=reward_multiplier)
+    
+    def completion_source(self, business, name):
+        """Источник модификатора для очередного завершения name: повторные исследования и обучения складываются"""
+        completions = business.setdefault('completions', {})
+        completions[name] = completions.get(name, 0) + 1
+        return f"{name} #{completions[name]}"
+    
+    def complete_training(self, business):
+        """Завершение обучения AI модели"""
+        model_name = business['current_training']
+        
+        # Увеличение дохода в зависимости от модели
+        income_boost = 1.0
+        if model_name == 'Компьютерное зрение':
+            income_boost = 1.4
+        elif model_name == 'Обработка языка':
+            income_boost = 1.6
+        elif model_name == 'Преобразующее обучение':
+            income_boost = 2.0
+        
+        business.stats.set_modifier('research', self.completion_source(business, model_name),
+                                    'income_per_hour', income_boost)
+        self.innovation_points += 30
+        
+        business['current_training'] = None
+        self.emit('training_completed', business=business, model=model_name, multiplier=income_boost)
+    
+    def apply_synergies(self):
+        """Применение синергий: пересчитываются только пары бизнесов, у которых сменился уровень или владелец"""
+        activated, deactivated = self.synergy_engine.update()
+        for name in {member for edge in activated + deactivated for member in edge.members}:
+            business = self.get_business_by_name(name)
+            if business is not None:
+                for stat in coreLogic.DERIVED_STATS:
+                    business.stats.set_modifier('synergies', 'synergies', stat,
+                                                self.synergy_engine.multiplier(name, stat))
+    
+    def get_effect(self, business, effect):
+        """Значение эффекта бизнеса с учетом действующих синергий (None, если у бизнеса нет такого эффекта)"""
+        value = business.get(effect)
+        if value is None or effect in coreLogic.DERIVED_STATS:
+            return value  # Доход, риск и работники уже включают синергии через стек модификаторов
+        return value * self.synergy_engine.multiplier(business['name'], effect)
+    
+    def schedule_event_roll(self):
+        """Срок следующего глобального события.
+        
+        Шанс GLOBAL_EVENT_CHANCE за каждые EVENT_ROLL_INTERVAL секунд: число периодов до события
+        распределено геометрически и разыгрывается сразу, а не бросками на каждом тике.
+        """
+        periods = 1 + int(math.log(1.0 - self.random.random()) / math.log(1.0 - self.GLOBAL_EVENT_CHANCE))
+        self.deadlines.schedule(('event_roll',), periods * self.EVENT_ROLL_INTERVAL, None, self.now)
+    
+    def start_global_event(self):
+        """Начало случайного глобального события"""
+        event = self.random.choice(self.global_events)
+        if event['active']:
+            return
+        event['active'] = True
+        event['start_time'] = self.now
+        self.deadlines.schedule(('event', event['name']), event['duration'] * 3600, event, self.now)
+        for business in self.my_businesses:
+            self.apply_event_modifiers(business, event)
+        self.emit('global_event_started', event=event)
+    
+    def end_global_event(self, event):
+        """Окончание глобального события: его модификаторы снимаются"""
+        event['active'] = False
+        for business in self.my_businesses:
+            self.apply_event_modifiers(business, event)
+        self.emit('global_event_ended', event=event)
+    
+    def apply_event_modifiers(self, business, event):
+        """Модификаторы события для характеристик бизнеса (снимаются, если событие неактивно)"""
+        for stat, factor in event['effects'].items():
+            if stat in coreLogic.DERIVED_STATS:
+                business.stats.set_modifier('events', event['name'], stat, factor if event['active'] else 1.0)
+    
+    def get_business_by_id(self, business_id):
+        """Поиск бизнеса по ID"""
+        return self.my_businesses.by_id(business_id)
+    
+    def get_business_by_name(self, business_name):
+        """Поиск бизнеса по имени"""
+        return self.my_businesses.by_name(business_name)
+    
+    def buy_business(self, business_template):
+        """Покупка бизнеса"""
+        if business_template['id'] in self.my_businesses:
+            return False, f"Бизнес '{business_template['name']}' уже куплен"
+        if self.wallet.debit(business_template['price']):
+            new_business = coreLogic.BusinessState(business_template)
+            new_business['is_owned'] = True
+            new_business['level'] = 1
+            new_business['experience'] = 0
+            
+            # Инициализация систем
+            new_business['upgrade_system'] = BusinessUpgradeSystem(new_business)
+            new_business['specialization'] = BusinessSpecialization(new_business)
+            new_business['resource_system'] = BusinessResourceSystem(new_business)
+            
+            self.add_business(new_business)
+            return True, f"Бизнес '{business_template['name']}' успешно приобретен!"
+        else:
+            return False, f"Недостаточно средств. Нужно ${business_template['price']:,}"
+    
+    def add_business(self, business):
+        """Регистрация купленного или восстановленного бизнеса: события и синергии применяются к нему сразу"""
+        self.my_businesses.add(business)
+        for event in self.global_events:
+            if event['active']:
+                self.apply_event_modifiers(business, event)
+        self.synergy_engine.set_level(business['name'], business['level'])
+        self.apply_synergies()
+    
+    def save_state(self):
+        """Состояние экономики в JSON-совместимом виде (см. restore_state)"""
+        return {
+            'now': self.now,
+            'crypto_balance': self.crypto_balance,
+            'reputation': self.reputation,
+            'risk_level': self.risk_level,
+            'innovation_points': self.innovation_points,
+            'businesses': [self.save_business(business) for business in self.my_businesses],
+            'active_events': [event['name'] for event in self.global_events if event['active']],
+            # Ключ, срок и момент запуска; бросок глобального события разыгрывается заново
+            'deadlines': [[list(deadline.key), deadline.due, deadline.started]
+                          for deadline in self.deadlines if deadline.key[0] != 'event_roll'],
+        }
+    
+    def save_business(self, business):
+        """Отличия от шаблона, базовые характеристики, системы и сохраняемые модификаторы купленного бизнеса"""
+        template = self.templates[business['id']]
+        fields = {key: business[key] for key in business
+                  if key not in self.SYSTEM_FIELDS and key not in coreLogic.DERIVED_STATS
+                  and (key not in template or template[key] != business[key])}
+        fields.update(business.stats.base)
+        specialization = business['specialization']
+        return {
+            'id': business['id'],
+            'fields': fields,
+            'upgrades': business['upgrade_system'].levels,
+            'specialization': [specialization.current_specialization, specialization.specialization_level],
+            'resources': business['resource_system'].resources,
+            'modifiers': [[layer, source, stat, modifier.factor, modifier.offset]
+                          for stat in coreLogic.DERIVED_STATS
+                          for layer, source, modifier in business.stats.modifiers(stat)
+                          if layer in self.SAVED_LAYERS],
+        }
+    
+    def restore_state(self, state):
+        """Восстановление экономики из save_state(): бизнесы, сроки, активные события и ресурсы игрока"""
+        self.now = state['now']
+        self.crypto_balance = state['crypto_balance']
+        self.reputation = state['reputation']
+        self.risk_level = state['risk_level']
+        self.innovation_points = state['innovation_points']
+        
+        events = {event['name']: event for event in self.global_events}
+        for name in state['active_events']:
+            events[name]['active'] = True
+        for saved in state['businesses']:
+            self.add_business(self.restore_business(saved))
+        
+        self.deadlines = coreLogic.DeadlineScheduler()
+        for key, due, started in state['deadlines']:
+            key = tuple(key)
+            kind = key[0]
+            if kind in ('research', 'training'):
+                payload = self.get_business_by_id(key[1])
+            elif kind == 'event':
+                payload = events[key[1]]
+                payload['start_time'] = started
+            else:
+                payload = key[1]
+            self.deadlines.schedule(key, due - started, payload, started)
+        self.schedule_event_roll()
+    
+    def restore_business(self, saved):
+        """Бизнес из записи save_business()"""
+        business = coreLogic.BusinessState(self.templates[saved['id']], **saved['fields'])
+        upgrade_system = BusinessUpgradeSystem(business)
+        upgrade_system.levels = {int(upgrade_type): level for upgrade_type, level in saved['upgrades'].items()}
+        specialization = BusinessSpecialization(business)
+        specialization.current_specialization, specialization.specialization_level = saved['specialization']
+        resource_system = BusinessResourceSystem(business)
+        resource_system.resources = saved['resources']
+        business['upgrade_system'] = upgrade_system
+        business['specialization'] = specialization
+        business['resource_system'] = resource_system
+        for layer, source, stat, factor, offset in saved['modifiers']:
+            business.stats.set_modifier(layer, source, stat, factor, offset)
+        return business
+
+def fast_forward(economy, seconds, step):
+    """Прокрутка экономики на seconds секунд шагами по step секунд; возвращает число шагов"""
+    ticks = math.ceil(seconds / step)
+    for tick in range(ticks):
+        economy.advance(min(step, seconds - tick * step))
+    return ticks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Прокрутка экономики бизнесов без окна")
+    parser.add_argument('--hours', type=float, default=24.0, help="сколько игровых часов прокрутить")
+    parser.add_argument('--step', type=float, default=5.0,
+                        help="шаг тика в секундах; 0 - весь промежуток одним шагом")
+    parser.add_argument('--seed', type=int, default=None, help="зерно случайных событий")
+    args = parser.parse_args(argv)
+    
+    economy = BusinessEconomy(now=0.0, rng=random.Random(args.seed))
+    counts = {}
+    economy.subscribe(lambda event: counts.__setitem__(event.kind, counts.get(event.kind, 0) + 1))
+    
+    # Все бизнесы куплены, исследование и обучение запущены
+    economy.wallet.credit(sum(template['price'] for template in economy.available_businesses))
+    for template in economy.available_businesses:
+        economy.buy_business(template)
+    economy.start_research(1, 'Генная терапия')
+    economy.start_ai_training(3, 'Компьютерное зрение')
+    start_balance = economy.player_balance
+    
+    seconds = args.hours * 3600
+    started = time.perf_counter()
+    if args.step > 0:
+        ticks = fast_forward(economy, seconds, args.step)
+    else:
+        economy.advance(seconds)
+        ticks = 1
+    elapsed = time.perf_counter() - started
+    
+    print(f"Бизнесов: {len(economy.my_businesses)}, игровое время: {args.hours:g} ч")
+    print(f"Шагов: {ticks:,} за {elapsed * 1000:.1f} мс ({ticks / elapsed:,.0f} шагов/с)")
+    print(f"Доход: ${economy.player_balance - start_balance:,.0f}")
+    for kind, count in sorted(counts.items()):
+        print(f"  {kind}: {count}")
+
+
+if __name__ == "__main__":
+    main()
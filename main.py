@@ -4,11 +4,18 @@ import math
 import random
 import time
 import json
-import sqlite3
+import traceback
 import coreLogic
+import economy
+from _database_file.database_init import BusinessDatabaseInitializer, DATA_MIGRATIONS, migrate
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Optional, Tuple
+from array import array
+from typing import List, Dict, Optional, Tuple, NamedTuple
+try:
+    import numpy as np
+except ImportError:  # numpy необязателен: без него звезды считаются обычным циклом
+    np = None
 from PyQt6.QtWidgets import (               #pyright: ignore[reportMissingImports]
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QStackedWidget, QFrame, QScrollArea, 
@@ -16,17 +23,18 @@ from PyQt6.QtWidgets import (               #pyright: ignore[reportMissingImport
     QGroupBox, QTabWidget, QTextEdit, QListWidget, QListWidgetItem,
     QDialog, QMessageBox, QSplitter, QToolBar, QStatusBar,
     QSizePolicy, QSpacerItem, QButtonGroup, QRadioButton,
-    QCheckBox, QDoubleSpinBox, QSpinBox, QFormLayout
+    QCheckBox, QDoubleSpinBox, QSpinBox, QFormLayout,
+    QListView, QStyledItemDelegate, QAbstractItemView
 )
 from PyQt6.QtCore import (                  #pyright: ignore[reportMissingImports]
-    Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve, 
-    QRect, QPoint, QSize, QDateTime, QSequentialAnimationGroup, 
-    QParallelAnimationGroup, qInstallMessageHandler
+    Qt, QObject, QEvent, QTimer, QThread, pyqtSignal, QAbstractListModel, QModelIndex, QRectF, QPropertyAnimation, QEasingCurve, 
+    QRect, QPointF, QSize, QDateTime, QSequentialAnimationGroup, 
+    qInstallMessageHandler
 )
 from PyQt6.QtGui import (                   #pyright: ignore[reportMissingImports]
     QFont, QPalette, QColor, QPainter, QLinearGradient, 
     QRadialGradient, QPen, QBrush, QFontDatabase, QPixmap,
-    QGuiApplication,QIcon, QMovie, QKeyEvent, QCursor
+    QGuiApplication,QIcon, QMovie, QKeyEvent, QCursor, QPolygonF
 )
 
 class OpenType:
@@ -103,6 +111,221 @@ CARD_BG = QColor(11, 17, 23)
 ACCENT1 = QColor(106, 44, 255)
 ACCENT2 = QColor(20, 231, 209)
 TEXT_MUTED = QColor(159, 176, 195)
+DANGER = QColor(220, 38, 38)
+RISK = QColor(239, 68, 68)
+
+# Палитры тем: имя темы из config.json -> цвета для шаблона стилей.
+# Темы без своей палитры пока используют темную.
+DARK_PALETTE = {
+    'DARK_BG': DARK_BG, 'PANEL_BG': PANEL_BG, 'CARD_BG': CARD_BG,
+    'DEEP_PURPLE': DEEP_PURPLE, 'PURPLE_PRIMARY': PURPLE_PRIMARY,
+    'PURPLE_ACCENT': PURPLE_ACCENT, 'LIGHT_PURPLE': LIGHT_PURPLE,
+    'TEXT_PRIMARY': TEXT_PRIMARY, 'TEXT_SECONDARY': TEXT_SECONDARY,
+    'TEXT_TERTIARY': TEXT_TERTIARY, 'ACCENT2': ACCENT2,
+    'DANGER': DANGER, 'RISK': RISK,
+}
+THEME_PALETTES = {
+    'Темная': DARK_PALETTE,
+}
+
+# Роли текста карточек, которые рисует CardDelegate: роль -> (размер шрифта
+# в пикселях, жирный, цвет палитры). Цвет берется из текущей темы.
+CARD_ROLES = {
+    'card-title': (16, True, 'TEXT_PRIMARY'),
+    'card-level': (12, True, 'ACCENT2'),
+    'card-text': (11, False, 'TEXT_SECONDARY'),
+    'card-row-text': (14, False, 'TEXT_SECONDARY'),
+    'card-stat-name': (10, False, 'TEXT_SECONDARY'),
+    'card-stat-value': (10, True, 'TEXT_PRIMARY'),
+    'card-risk': (10, True, 'RISK'),
+    'card-button': (11, True, 'TEXT_PRIMARY'),
+}
+
+# Общая таблица стилей приложения. Виджеты выбираются по динамическим
+# свойствам role (вид виджета) и состояниям вроде owned/category/flash,
+# поэтому смена темы или состояния не требует setStyleSheet у виджетов.
+APP_STYLESHEET = """
+    QPushButton[role="button"] {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {DEEP_PURPLE}, stop:1 {PURPLE_PRIMARY});
+        border: 2px solid {PURPLE_ACCENT};
+        border-radius: 15px;
+        color: {TEXT_PRIMARY};
+        font-size: 16px;
+        font-weight: bold;
+        padding: 10px 20px;
+    }}
+    QPushButton[role="button"]:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {PURPLE_PRIMARY}, stop:1 {PURPLE_ACCENT});
+        border: 2px solid {LIGHT_PURPLE};
+    }}
+    QPushButton[role="button"]:pressed {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {DEEP_PURPLE}, stop:1 {PURPLE_PRIMARY});
+    }}
+    QPushButton[role="button-locked"] {{
+        background-color: {TEXT_TERTIARY};
+        color: {TEXT_SECONDARY};
+        border: 2px solid {TEXT_TERTIARY};
+        border-radius: 8px;
+        font-size: 11px;
+        font-weight: bold;
+    }}
+    
+    QPushButton[role="menu-button"] {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {PURPLE_PRIMARY}, stop:1 {DEEP_PURPLE});
+        border: 3px solid {PURPLE_ACCENT};
+        border-radius: 35px;
+        color: {TEXT_PRIMARY};
+        font-size: 20px;
+        font-weight: bold;
+        padding: 15px 30px;
+    }}
+    QPushButton[role="menu-button"]:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {PURPLE_ACCENT}, stop:1 {PURPLE_PRIMARY});
+        border: 3px solid {LIGHT_PURPLE};
+    }}
+    QPushButton[role="menu-button"]:pressed {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {DEEP_PURPLE}, stop:1 {PURPLE_PRIMARY});
+    }}
+    
+    QPushButton[role="click-button"] {{
+        background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
+                                  stop:0 rgba(122, 47, 255, 0.18),
+                                  stop:1 rgba(58, 14, 88, 0.12));
+        border-radius: 40px;
+        border: 1px solid rgba(255, 255, 255, 0.02);
+        color: white;
+        font-size: 32px;
+        font-weight: bold;
+    }}
+    QPushButton[role="click-button"]:hover {{
+        background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
+                                  stop:0 rgba(122, 47, 255, 0.22),
+                                  stop:1 rgba(58, 14, 88, 0.16));
+        border: 1px solid rgba(255, 255, 255, 0.04);
+    }}
+    QPushButton[role="click-button"]:pressed,
+    QPushButton[role="click-button"][flash="true"] {{
+        background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
+                                  stop:0 rgba(122, 47, 255, 0.25),
+                                  stop:1 rgba(58, 14, 88, 0.18));
+        border: 1px solid rgba(255, 255, 255, 0.03);
+    }}
+    
+    
+    QFrame[role="metric-card"],
+    QFrame[role="metric-card"] QFrame {{
+        background-color: {CARD_BG};
+        border: 1px solid {PURPLE_PRIMARY};
+        border-radius: 6px;
+        padding: 10px;
+    }}
+    QLabel[role="metric-title"] {{ color: {TEXT_SECONDARY}; font-size: 10px; }}
+    QLabel[role="metric-value"] {{ font-size: 12px; font-weight: bold; }}
+    QLabel[role="metric-description"] {{ color: {TEXT_TERTIARY}; font-size: 8px; }}
+    
+    QFrame[role="profile-panel"],
+    QFrame[role="profile-panel"] QFrame {{
+        background-color: {PANEL_BG};
+        border: 2px solid {PURPLE_PRIMARY};
+        border-radius: 15px;
+        padding: 20px;
+    }}
+    QLabel[role="profile-title"] {{ color: {TEXT_PRIMARY}; font-size: 32px; font-weight: bold; }}
+    QLabel[role="profile-avatar"] {{ font-size: 64px; }}
+    QLabel[role="profile-name"] {{ color: {TEXT_PRIMARY}; font-size: 24px; font-weight: bold; }}
+    QLabel[role="profile-level"] {{ color: {TEXT_SECONDARY}; font-size: 16px; }}
+    QLabel[role="profile-balance"] {{ color: {ACCENT2}; font-size: 18px; font-weight: bold; }}
+    QLabel[role="profile-stat-name"] {{ color: {TEXT_SECONDARY}; font-size: 14px; }}
+    QLabel[role="profile-stat-value"] {{ color: {TEXT_PRIMARY}; font-size: 14px; font-weight: bold; }}
+"""
+
+
+class ThemeRegistry:
+    """Реестр тем: таблица стилей каждой темы собирается из палитры один раз.
+    
+    Стили применяются на уровне приложения, виджеты только помечаются
+    свойством role, поэтому смена темы - один setStyleSheet на все окно.
+    Контейнеры с собственными общими правилами (например, прозрачный фон
+    для всех потомков) подключаются через attach: их правила перекрывают
+    правила приложения, поэтому тема добавляется в их таблицу.
+    """
+    
+    def __init__(self, palettes, template, roles=None, default='Темная'):
+        self.palettes = palettes
+        self.template = template
+        self.roles = roles or {}
+        self.default = default
+        self.cache = {}
+        self.fonts = {}
+        self.theme = default
+        self.current = None
+        self.roots = []  # (виджет, его собственные правила)
+    
+    def palette(self, theme):
+        return self.palettes.get(theme, self.palettes[self.default])
+    
+    def color(self, name):
+        """Цвет текущей темы (для виджетов, которые рисуют себя сами)"""
+        return self.palette(self.theme)[name]
+    
+    def role(self, name):
+        """Шрифт и цвет текстовой роли (для виджетов, которые рисуют себя сами)"""
+        size, bold, color = self.roles[name]
+        font = self.fonts.get(name)
+        if font is None:
+            font = self.fonts[name] = QFont()
+            font.setPixelSize(size)
+            font.setBold(bold)
+        return font, self.color(color)
+    
+    def stylesheet(self, theme):
+        """Таблица стилей темы (собирается при первом обращении)"""
+        palette = self.palette(theme)
+        key = id(palette)
+        if key not in self.cache:
+            self.cache[key] = self.template.format(**{name: color.name() for name, color in palette.items()})
+        return self.cache[key]
+    
+    def apply(self, theme):
+        """Применяет тему ко всему приложению"""
+        self.theme = theme
+        stylesheet = self.stylesheet(theme)
+        if stylesheet is self.current:
+            return
+        self.current = stylesheet
+        app = QApplication.instance()
+        if app is not None:
+            app.setStyleSheet(stylesheet)
+        for root, base in self.roots:
+            root.setStyleSheet(base + stylesheet)
+    
+    def attach(self, root, base):
+        """Подключает контейнер со своими правилами base к текущей и будущим темам"""
+        self.roots.append((root, base))
+        root.destroyed.connect(lambda: self.roots.remove((root, base)))
+        root.setStyleSheet(base + (self.current or ""))
+    
+    @staticmethod
+    def set_role(widget, role):
+        widget.setProperty("role", role)
+        return widget
+    
+    @staticmethod
+    def set_state(widget, name, value):
+        """Меняет динамическое свойство и заново применяет к виджету правила темы"""
+        widget.setProperty(name, value)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+
+THEMES = ThemeRegistry(THEME_PALETTES, APP_STYLESHEET, CARD_ROLES)
 
 class ScreenState(Enum):
     LOADING = 0
@@ -128,38 +351,146 @@ class GameConfig:
             "title": 36
         }
 
+class FrameSubscription:
+    """Подписка на кадры планировщика"""
+    
+    __slots__ = ('callback', 'widget', 'interval', 'last_call', 'active', '__weakref__')
+    
+    def __init__(self, callback, widget, interval, now):
+        self.callback = callback
+        self.widget = widget
+        self.interval = interval
+        self.last_call = now
+        self.active = True
+    
+    def cancel(self):
+        self.active = False
+
+class FrameScheduler(QObject):
+    """Единый таймер кадров приложения.
+    
+    Все анимации и периодические обновления подписываются сюда вместо своих
+    QTimer. Таймер идет с частотой current_fps из config.json; подписчики,
+    привязанные к скрытому виджету (например, неактивной странице
+    content_stack), пропускаются. Пропущенные кадры считаются и сообщаются
+    сигналом framesDropped.
+    
+    Если покадровых подписчиков на экране нет (окно свернуто или все
+    анимированные виджеты скрыты), таймер переходит на редкий фоновый ритм,
+    на котором работают только периодические подписки вроде экономики.
+    """
+    
+    framesDropped = pyqtSignal(int)
+    
+    IDLE_INTERVAL = 1.0  # Период таймера в фоне, секунды
+    
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        """Общий планировщик (создается после QApplication при первом обращении)"""
+        if cls._instance is None:
+            cls._instance = cls(Settings.get_current_fps())
+        return cls._instance
+    
+    def __init__(self, fps=60):
+        super().__init__()
+        self.subscriptions = []
+        self.dropped_frames = 0
+        self.frame_count = 0
+        self.last_frame = None
+        self.idle = False
+        self.suspended = False
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+        self.set_fps(fps)
+    
+    def set_fps(self, fps):
+        """Смена частоты кадров на лету"""
+        self.fps = max(1, int(fps))
+        self.frame_interval = 1 / self.fps
+        if not self.idle:
+            self.timer.start(max(1, round(1000 / self.fps)))
+    
+    def set_suspended(self, suspended):
+        """Окно свернуто: покадровые подписки на паузе, периодические продолжают работать"""
+        self.suspended = suspended
+        self.set_idle(suspended)
+    
+    def wake(self):
+        """Немедленный возврат к покадровому ритму (например, после смены экрана)"""
+        if not self.suspended:
+            self.set_idle(False)
+    
+    def set_idle(self, idle):
+        """Переключение между покадровым и фоновым ритмом таймера"""
+        if idle == self.idle:
+            return
+        self.idle = idle
+        self.last_frame = None  # Смена ритма - не пропуск кадров
+        if idle:
+            self.timer.start(round(self.IDLE_INTERVAL * 1000))
+        else:
+            self.timer.start(max(1, round(1000 / self.fps)))
+    
+    def subscribe(self, callback, widget=None, interval=0.0):
+        """Подписка callback(dt) на кадры.
+        
+        widget - пока он скрыт, вызовы приостанавливаются;
+        interval - минимальный промежуток между вызовами в секундах (0 - каждый кадр).
+        """
+        subscription = FrameSubscription(callback, widget, interval, time.perf_counter())
+        self.subscriptions.append(subscription)
+        if widget is not None:
+            widget.destroyed.connect(subscription.cancel)
+        return subscription
+    
+    def tick(self):
+        """Один кадр: вызывает всех активных подписчиков"""
+        now = time.perf_counter()
+        if self.last_frame is not None and not self.idle:
+            elapsed = now - self.last_frame
+            if elapsed > self.frame_interval * 1.5:
+                dropped = round(elapsed / self.frame_interval) - 1
+                self.dropped_frames += dropped
+                self.framesDropped.emit(dropped)
+        self.last_frame = now
+        self.frame_count += 1
+        
+        self.subscriptions = [s for s in self.subscriptions if s.active]
+        needs_frames = False
+        for subscription in list(self.subscriptions):
+            if subscription.widget is not None and (self.suspended or not subscription.widget.isVisible()):
+                # Скрытый виджет на паузе: после показа время считается заново
+                subscription.last_call = now
+                continue
+            if not subscription.interval:
+                needs_frames = True
+            dt = now - subscription.last_call
+            if dt < subscription.interval:
+                continue
+            subscription.last_call = now
+            subscription.callback(dt)
+        
+        if not self.suspended:
+            self.set_idle(not needs_frames)
+
 class AnimatedButton(QPushButton):
     """Анимированная кнопка с эффектами"""
     
+    role = "button"  # Правила темы для кнопки (см. APP_STYLESHEET)
+    
     def __init__(self, text, icon=None, parent=None):
         super().__init__(text, parent)
         self.setFixedHeight(50)
-        
-        self.setStyleSheet(self.get_normal_style())
-        
-    def get_normal_style(self):
-        return f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {DEEP_PURPLE.name()}, stop:1 {PURPLE_PRIMARY.name()});
-                border: 2px solid {PURPLE_ACCENT.name()};
-                border-radius: 15px;
-                color: {TEXT_PRIMARY.name()};
-                font-size: 16px;
-                font-weight: bold;
-                padding: 10px 20px;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {PURPLE_PRIMARY.name()}, stop:1 {PURPLE_ACCENT.name()});
-                border: 2px solid {LIGHT_PURPLE.name()};
-            }}
-            QPushButton:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {DEEP_PURPLE.name()}, stop:1 {PURPLE_PRIMARY.name()});
-            }}
-        """
+        self.setProperty("role", self.role)
     
+    def setStyleSheet(self, styleSheet):
+        # Собственный стиль кнопки полностью заменяет стиль темы, а не дополняет его
+        self.setProperty("role", None if styleSheet else self.role)
+        super().setStyleSheet(styleSheet)
+        
     def enterEvent(self, event):
         self.animate_hover()
         super().enterEvent(event)
@@ -185,33 +516,11 @@ class AnimatedButton(QPushButton):
 class MenuButton(AnimatedButton):
     """Специальная кнопка для главного меню"""
     
+    role = "menu-button"
+    
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         self.setFixedSize(300, 70)
-        self.setStyleSheet(self.get_menu_style())
-        
-    def get_menu_style(self):
-        return f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {PURPLE_PRIMARY.name()}, stop:1 {DEEP_PURPLE.name()});
-                border: 3px solid {PURPLE_ACCENT.name()};
-                border-radius: 35px;
-                color: {TEXT_PRIMARY.name()};
-                font-size: 20px;
-                font-weight: bold;
-                padding: 15px 30px;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {PURPLE_ACCENT.name()}, stop:1 {PURPLE_PRIMARY.name()});
-                border: 3px solid {LIGHT_PURPLE.name()};
-            }}
-            QPushButton:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {DEEP_PURPLE.name()}, stop:1 {PURPLE_PRIMARY.name()});
-            }}
-        """
 
 class NavigationButton(AnimatedButton):
     """Кнопка навигации в левой панели"""
@@ -233,64 +542,203 @@ class NavigationButton(AnimatedButton):
         }
         return icons.get(self.icon_name, "●")
 
+class Starfield:
+    """Звездное поле в виде столбцов (struct-of-arrays) с пакетной отрисовкой.
+    
+    Звезды группируются по ступени размера и яркости, и каждая группа рисуется
+    одним вызовом drawPoints с заранее созданным QPen.
+    """
+    
+    ALPHA_LEVELS = 8  # Ступени яркости при отрисовке
+    SIZE_STEP = 0.5  # Шаг ступеней размера
+    
+    def __init__(self, count=100):
+        self.count = count
+        self.width = 0
+        self.height = 0
+        self.pens = {}
+        self.reset(0, 0)
+    
+    def reset(self, width, height):
+        """Заполняет поле случайными звездами для заданного размера"""
+        self.width, self.height = width, height
+        n = self.count
+        if np is not None:
+            rng = np.random.default_rng()
+            self.x = rng.integers(0, width + 1, n).astype(float)
+            self.y = rng.integers(0, height + 1, n).astype(float)
+            self.size = rng.uniform(0.5, 3, n)
+            self.speed = rng.uniform(0.1, 2, n)
+            self.alpha = rng.integers(50, 256, n).astype(float)
+            self.twinkle_speed = rng.uniform(0.02, 0.1, n)
+            self.twinkle_direction = np.ones(n)
+            self.size_level = np.rint(self.size / self.SIZE_STEP).astype(int)
+        else:
+            self.x = array('d', (random.randint(0, width) for _ in range(n)))
+            self.y = array('d', (random.randint(0, height) for _ in range(n)))
+            self.size = array('d', (random.uniform(0.5, 3) for _ in range(n)))
+            self.speed = array('d', (random.uniform(0.1, 2) for _ in range(n)))
+            self.alpha = array('d', (random.randint(50, 255) for _ in range(n)))
+            self.twinkle_speed = array('d', (random.uniform(0.02, 0.1) for _ in range(n)))
+            self.twinkle_direction = array('d', [1.0] * n)
+            self.size_level = array('i', (round(size / self.SIZE_STEP) for size in self.size))
+    
+    def advance(self, step=1.0):
+        """Движение вниз и мерцание всех звезд; step - число тиков по 50 мс"""
+        if np is not None:
+            self.y += self.speed * step
+            self.alpha += self.twinkle_speed * self.twinkle_direction * step
+            self.twinkle_direction[self.alpha >= 255] = -1
+            self.twinkle_direction[self.alpha <= 50] = 1
+            np.clip(self.alpha, 50, 255, out=self.alpha)
+            
+            # Звезды, ушедшие за нижнюю границу, появляются сверху
+            wrapped = self.y > self.height
+            if wrapped.any():
+                self.y[wrapped] = 0
+                self.x[wrapped] = np.random.randint(0, self.width + 1, int(wrapped.sum()))
+            return
+        
+        for i in range(self.count):
+            self.y[i] += self.speed[i] * step
+            alpha = self.alpha[i] + self.twinkle_speed[i] * self.twinkle_direction[i] * step
+            if alpha >= 255:
+                alpha = 255
+                self.twinkle_direction[i] = -1
+            elif alpha <= 50:
+                alpha = 50
+                self.twinkle_direction[i] = 1
+            self.alpha[i] = alpha
+            if self.y[i] > self.height:
+                self.y[i] = 0
+                self.x[i] = random.randint(0, self.width)
+    
+    def draw(self, painter):
+        """Рисует звезды пакетами, затем свечение больших звезд"""
+        groups = self.groups()
+        for (size_level, alpha_level), points in groups:
+            painter.setPen(self.pen(size_level, alpha_level, False))
+            painter.drawPoints(points)
+        for (size_level, alpha_level), points in groups:
+            # Свечение для звезд крупнее 1.5
+            if size_level * self.SIZE_STEP > 1.5:
+                painter.setPen(self.pen(size_level, alpha_level, True))
+                painter.drawPoints(points)
+    
+    def groups(self):
+        """Список ((ступень размера, ступень яркости), QPolygonF) для текущего кадра"""
+        scale = (self.ALPHA_LEVELS - 1) / 205
+        if np is not None:
+            alpha_level = np.rint((self.alpha - 50) * scale).astype(int)
+            keys = self.size_level * self.ALPHA_LEVELS + alpha_level
+            order = np.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+            starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+            ends = np.r_[starts[1:], len(order)]
+            groups = []
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                indexes = order[start:end]
+                key = int(sorted_keys[start])
+                groups.append((divmod(key, self.ALPHA_LEVELS), self.polygon(self.x[indexes], self.y[indexes])))
+            return groups
+        
+        buckets = {}
+        for i in range(self.count):
+            key = (self.size_level[i], round((self.alpha[i] - 50) * scale))
+            buckets.setdefault(key, []).append(QPointF(self.x[i], self.y[i]))
+        return [(key, QPolygonF(points)) for key, points in buckets.items()]
+    
+    @staticmethod
+    def polygon(xs, ys):
+        """QPolygonF, заполненный напрямую через буфер numpy без создания QPointF"""
+        polygon = QPolygonF()
+        polygon.fill(QPointF(), len(xs))
+        buffer = polygon.data()
+        buffer.setsize(len(xs) * 16)
+        points = np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2)
+        points[:, 0] = xs
+        points[:, 1] = ys
+        return polygon
+    
+    def pen(self, size_level, alpha_level, glow):
+        """Перо для группы звезд (создается один раз)"""
+        key = (size_level, alpha_level, glow)
+        pen = self.pens.get(key)
+        if pen is None:
+            alpha = 50 + alpha_level * 205 / (self.ALPHA_LEVELS - 1)
+            size = size_level * self.SIZE_STEP
+            if glow:
+                pen = QPen(QColor(255, 255, 255, int(alpha * 0.3)), size * 2)
+            else:
+                pen = QPen(QColor(255, 255, 255, int(alpha)), size)
+            self.pens[key] = pen
+        return pen
+
 class GradientWidget(QWidget):
-    """Виджет с анимированным градиентным фоном и падающими звездами"""
+    """Виджет с анимированным градиентным фоном и падающими звездами.
+    
+    Один экземпляр - центральный виджет MainWindow: экраны прозрачны
+    и рисуются поверх него, поэтому фон считается и заливается один раз за кадр.
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.stars = []
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.update_stars)
-        self.animation_timer.start(50)  # Обновление каждые 50ms
+        self.stars = Starfield()
+        # Кэш статичного фона: (ширина, высота, DPR) -> QPixmap
+        self.background_cache = None
+        self.background_key = None
+        self.animation = FrameScheduler.instance().subscribe(self.update_stars, self)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.init_stars()
         
     def init_stars(self):
         """Инициализация звезд"""
-        for _ in range(100):  # Увеличил количество звезд
-            star = {
-                'x': random.randint(0, self.width()),
-                'y': random.randint(0, self.height()),
-                'size': random.uniform(0.5, 3),
-                'speed': random.uniform(0.1, 2),
-                'alpha': random.randint(50, 255),
-                'twinkle_speed': random.uniform(0.02, 0.1),
-                'twinkle_direction': 1
-            }
-            self.stars.append(star)
+        self.stars.reset(self.width(), self.height())
     
-    def update_stars(self):
-        """Обновление позиций и анимации звезд"""
-        for star in self.stars:
-            # Движение вниз
-            star['y'] += star['speed']
-            
-            # Мерцание
-            star['alpha'] += star['twinkle_speed'] * star['twinkle_direction']
-            if star['alpha'] >= 255:
-                star['alpha'] = 255
-                star['twinkle_direction'] = -1
-            elif star['alpha'] <= 50:
-                star['alpha'] = 50
-                star['twinkle_direction'] = 1
-            
-            # Если звезда ушла за нижнюю границу, создаем новую сверху
-            if star['y'] > self.height():
-                star['y'] = 0
-                star['x'] = random.randint(0, self.width())
-        
+    def update_stars(self, dt=0.05):
+        """Обновление позиций и анимации звезд (скорости заданы на тик в 50 мс)"""
+        self.stars.advance(dt / 0.05)
         self.update()
     
     def resizeEvent(self, a0):
         """Пересоздаем звезды при изменении размера окна"""
         super().resizeEvent(a0)
-        self.stars.clear()
         self.init_stars()
+        self.invalidate_background()
+    
+    def invalidate_background(self):
+        """Сбрасывает кэш статичного фона (при смене размера или темы)"""
+        self.background_cache = None
+        self.background_key = None
+        self.update()
+    
+    def background_pixmap(self):
+        """Статичный фон, отрисованный один раз для текущего размера и DPR"""
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        if self.background_cache is None or self.background_key != key:
+            pixmap = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self.draw_background(painter)
+            painter.end()
+            self.background_cache = pixmap
+            self.background_key = key
+        return self.background_cache
     
     def paintEvent(self, a0):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
+        # Статичный слой берется из кэша, каждый кадр рисуются только звезды
+        painter.drawPixmap(0, 0, self.background_pixmap())
+        
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.draw_stars(painter)
+    
+    def draw_background(self, painter):
+        """Рисует статичный фон: градиент, туманности и затемнение"""
         # Улучшенный градиентный фон
         gradient = QLinearGradient(0, 0, self.width(), self.height())
         gradient.setColorAt(0, QColor(2, 2, 15))  # Более темный синий
@@ -303,10 +751,7 @@ class GradientWidget(QWidget):
         # Добавляем туманность/небулярность
         self.draw_nebula(painter)
         
-        # Рисуем звезды
-        self.draw_stars(painter)
-        
-        # Добавляем легкий градиент поверх для глубины
+        # Добавляем легкий градиент для глубины
         overlay_gradient = QLinearGradient(0, 0, 0, self.height())
         overlay_gradient.setColorAt(0, QColor(0, 0, 0, 80))
         overlay_gradient.setColorAt(1, QColor(80, 20, 120, 40))
@@ -336,18 +781,7 @@ class GradientWidget(QWidget):
     
     def draw_stars(self, painter):
         """Рисует анимированные звезды"""
-        for star in self.stars:
-            star_color = QColor(255, 255, 255, int(star['alpha']))
-            painter.setPen(QPen(star_color, star['size']))
-            
-            # Основная точка звезды
-            painter.drawPoint(int(star['x']), int(star['y']))
-            
-            # Добавляем свечение для больших звезд
-            if star['size'] > 1.5:
-                glow_color = QColor(255, 255, 255, int(star['alpha'] * 0.3))
-                painter.setPen(QPen(glow_color, star['size'] * 2))
-                painter.drawPoint(int(star['x']), int(star['y']))
+        self.stars.draw(painter)
 
 class MainMenuScreen(QWidget):
     """Главное меню игры"""
@@ -366,11 +800,7 @@ class MainMenuScreen(QWidget):
         layout.setSpacing(0)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        # Фоновый виджет с градиентом
-        background = GradientWidget(self)
-        layout.addWidget(background)
-        
-        # Основной контент поверх фона
+        # Основной контент поверх общего фона окна
         content_layout = QVBoxLayout()
         content_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         content_layout.setSpacing(40)
@@ -502,43 +932,61 @@ class MainMenuScreen(QWidget):
         footer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         content_layout.addWidget(footer_label)
         
-        # Устанавливаем layout для background
-        background_layout = QVBoxLayout()
-        background_layout.addLayout(content_layout)
-        background.setLayout(background_layout)
-
+        layout.addLayout(content_layout)
         self.setLayout(layout)
 
 class LoadingScreen(QWidget):
-    """Экран загрузки с улучшенной анимацией"""
+    """Экран загрузки с улучшенной анимацией.
+    
+    Полоса показывает реальный ход запуска: set_progress задает долю
+    выполненных этапов, а полоса плавно догоняет ее. loadingFinished
+    испускается, когда после finish полоса дошла до конца.
+    """
     
     loadingFinished = pyqtSignal()
     
     def __init__(self):
         super().__init__()
         self.progress = 0
+        self.target = 0
+        self.stage = ""
+        self.finished = False
         self.dots = 0
         self.rotation_angle = 0
         
-        # Используем один таймер для всех анимаций
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.update_animations)
-        self.animation_timer.start(30)  # 30 FPS для плавной анимации
+        self.elapsed = 0.0
         
-    def update_animations(self):
-        """Обновление всех анимаций"""
-        # Прогресс загрузки
-        if self.progress < 100:
-            self.progress += 2 # Замедляем загрузку для демонстрации
-        else:
-            self.animation_timer.stop()
+        # Все анимации экрана идут от общего планировщика кадров
+        self.animation = FrameScheduler.instance().subscribe(self.update_animations, self)
+    
+    def set_progress(self, value, stage=""):
+        """Доля выполненной работы (0-100) и название текущего этапа"""
+        self.target = max(self.target, min(100, value))
+        self.stage = stage
+    
+    def finish(self):
+        """Вся работа выполнена: полоса дойдет до 100% и загрузка завершится"""
+        self.target = 100
+        self.stage = ""
+        self.finished = True
+        
+    def update_animations(self, dt=0.03):
+        """Обновление всех анимаций (скорости заданы на шаг в 30 мс)"""
+        step = dt / 0.03
+        self.elapsed += dt
+        
+        # Прогресс загрузки догоняет выполненную работу
+        if self.progress < self.target:
+            self.progress = min(self.target, self.progress + 4 * step)
+        elif self.finished:
+            self.animation.cancel()
             self.loadingFinished.emit()
         
         # Вращение
-        self.rotation_angle = (self.rotation_angle + 3) % 360
+        self.rotation_angle = (self.rotation_angle + 3 * step) % 360
         
         # Мерцание точек
-        self.dots = (self.dots + 1) % 4
+        self.dots = int(self.elapsed / 0.03) % 4
         
         self.update()
     
@@ -546,13 +994,7 @@ class LoadingScreen(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Фон как в GradientWidget
-        gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0, QColor(2, 2, 15))
-        gradient.setColorAt(0.3, QColor(8, 8, 40))
-        gradient.setColorAt(0.7, QColor(15, 5, 35))
-        gradient.setColorAt(1, QColor(2, 2, 15))
-        painter.fillRect(self.rect(), gradient)
+        # Фон рисует общий GradientWidget окна
         
         # Вращающийся логотип
         painter.save()
@@ -624,9 +1066,16 @@ class LoadingScreen(QWidget):
         # Процент
         painter.setPen(QPen(TEXT_SECONDARY))
         painter.setFont(QFont("Arial", 14))
-        percent_text = f"{self.progress}%"
+        percent_text = f"{int(self.progress)}%"
         painter.drawText(bar_x, bar_y + bar_height + 30, bar_width, 30, 
                         Qt.AlignmentFlag.AlignCenter, percent_text)
+        
+        # Текущий этап
+        if self.stage:
+            painter.setPen(QPen(TEXT_TERTIARY))
+            painter.setFont(QFont("Arial", 12))
+            painter.drawText(bar_x, bar_y + bar_height + 60, bar_width, 30,
+                            Qt.AlignmentFlag.AlignCenter, self.stage)
 
 class NavigationPanel(QWidget):
     """Панель навигации"""
@@ -693,6 +1142,98 @@ class NavigationPanel(QWidget):
         if action in self.buttons:
             self.buttons[action].setChecked(True)
 
+class FloatingTextOverlay(QWidget):
+    """Прозрачный слой всплывающих надписей "+$" поверх кликера.
+    
+    Надписи хранятся в кольцевом буфере фиксированного размера и рисуются
+    в одном paintEvent: клик не создает ни виджетов, ни стилей, а при
+    переполнении самая старая надпись просто перезаписывается.
+    """
+    
+    CAPACITY = 64  # Хватает на ~50 кликов/с при времени жизни 1.2 с
+    LIFETIME = 1.2  # Время жизни надписи, секунды
+    RISE = 80  # Подъем надписи за время жизни, пиксели
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        
+        self.xs = [0.0] * self.CAPACITY
+        self.ys = [0.0] * self.CAPACITY
+        self.values = [0.0] * self.CAPACITY
+        self.born = [-1.0] * self.CAPACITY  # -1 - слот свободен
+        self.head = 0
+        self.live = 0
+        
+        self.font = QFont()
+        self.font.setPixelSize(28)
+        self.font.setBold(True)
+        self.color = QColor("#bda8ff")
+        self.box = QRect(-50, -20, 100, 40)  # Область одной надписи относительно точки клика
+        self.dirty = QRect()
+        self.animation = None
+    
+    def spawn(self, pos, value):
+        """Добавляет надпись +$value в точке pos (координаты слоя)"""
+        index = self.head
+        if self.born[index] < 0:
+            self.live += 1
+        self.xs[index] = pos.x()
+        self.ys[index] = pos.y()
+        self.values[index] = value
+        self.born[index] = time.perf_counter()
+        self.head = (index + 1) % self.CAPACITY
+        
+        # Подписка на кадры только пока есть живые надписи
+        if self.animation is None or not self.animation.active:
+            self.animation = FrameScheduler.instance().subscribe(self.advance, self)
+        self.advance()
+    
+    def advance(self, dt=0.0):
+        """Кадр: гасит истекшие надписи и перерисовывает только занятую ими область"""
+        now = time.perf_counter()
+        area = QRect()
+        for i in range(self.CAPACITY):
+            born = self.born[i]
+            if born < 0:
+                continue
+            if now - born >= self.LIFETIME:
+                self.born[i] = -1.0
+                self.live -= 1
+                continue
+            area = area.united(self.box.translated(int(self.xs[i]), int(self.ys[i]) - self.RISE)
+                               .united(self.box.translated(int(self.xs[i]), int(self.ys[i]))))
+        
+        self.update(self.dirty.united(area))
+        self.dirty = area
+        if not self.live and self.animation is not None:
+            self.animation.cancel()
+            self.animation = None
+    
+    def paintEvent(self, a0):
+        if not self.live:
+            return
+        now = time.perf_counter()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setFont(self.font)
+        painter.setPen(self.color)
+        flags = Qt.AlignmentFlag.AlignCenter
+        # Обход от самой старой надписи к самой новой, чтобы новые были сверху
+        for step in range(self.CAPACITY):
+            i = (self.head + step) % self.CAPACITY
+            born = self.born[i]
+            if born < 0:
+                continue
+            t = min(1.0, (now - born) / self.LIFETIME)
+            painter.setOpacity(1.0 - t ** 3)  # InCubic
+            rise = self.RISE * (1.0 - (1.0 - t) ** 3)  # OutCubic
+            painter.drawText(self.box.translated(int(self.xs[i]), int(self.ys[i] - rise)),
+                             flags, f"+${self.values[i]:.2f}")
+        painter.end()
+
+
 class ClickerGame(QWidget):
     """Игровой кликер"""
     
@@ -702,16 +1243,16 @@ class ClickerGame(QWidget):
     
     def __init__(self):
         super().__init__()
-        self.money = 0
         self.per_click = 1
         self.total_clicks = 0
         self.config = GameConfig()
         
-        # Список для хранения активных анимаций
-        self.active_animations = []
-        
         self.init_ui()
         
+        # Слой всплывающих надписей поверх всего экрана
+        self.effects = FloatingTextOverlay(self)
+        self.effects.raise_()
+        
     def init_ui(self):
         main_layout = QHBoxLayout()
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -801,7 +1342,7 @@ class ClickerGame(QWidget):
         # НОВАЯ КНОПКА КЛИКА С ИМПОРТИРОВАННЫМ СТИЛЕМ
         self.click_button = AnimatedButton("𓀐𓂸ඞ НАЖМИ ЕСЛИ СОСАЛ")
         self.click_button.setFixedSize(600, 600)
-        self.apply_imported_button_style()
+        self.click_button.setProperty("role", "click-button")
         self.click_button.clicked.connect(self.handle_click)
         center_layout.addWidget(self.click_button, alignment=Qt.AlignmentFlag.AlignCenter)
         
@@ -869,164 +1410,69 @@ class ClickerGame(QWidget):
         self.pulse_animation.setEasingCurve(QEasingCurve.Type.InOutSine)
         self.pulse_animation.start()
         
-    def apply_imported_button_style(self):
-        """Применяет импортированный стиль к кнопке"""
-        self.click_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
-                                          stop:0 rgba(122, 47, 255, 0.18),
-                                          stop:1 rgba(58, 14, 88, 0.12));
-                border-radius: 40px;
-                border: 1px solid rgba(255, 255, 255, 0.02);
-                color: white;
-                font-size: 32px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
-                                          stop:0 rgba(122, 47, 255, 0.22),
-                                          stop:1 rgba(58, 14, 88, 0.16));
-                border: 1px solid rgba(255, 255, 255, 0.04);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
-                                          stop:0 rgba(122, 47, 255, 0.25),
-                                          stop:1 rgba(58, 14, 88, 0.18));
-                border: 1px solid rgba(255, 255, 255, 0.03);
-            }
-        """)
+    def clear_click_flash(self):
+        THEMES.set_state(self.click_button, "flash", False)
         
     def handle_click(self):
-        self.money += self.per_click
+        # Зачисляем ровно ту сумму, что покажет всплывающая надпись
+        # (журнал кошелька - единственный баланс, запись в БД идёт пачками в фоне)
+        earned = self.per_click
+        balance = coreLogic.LEDGER.credit(earned)
         self.total_clicks += 1
 
         # Увеличения дохода за клик на 0.1%
         self.per_click *= 1.001
 
         self.update_display()
-        self.moneyChanged.emit(self.money)
+        self.moneyChanged.emit(int(balance))
         
         # Анимация клика с новым стилем
-        self.animate_click_imported()
+        self.animate_click_imported(earned)
         
-    def animate_click_imported(self):
+    def animate_click_imported(self, earned):
         """Анимация клика с импортированным стилем"""
-        # Анимация нажатия кнопки
-        self.click_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
-                                          stop:0 rgba(122, 47, 255, 0.25),
-                                          stop:1 rgba(58, 14, 88, 0.18));
-                border-radius: 40px;
-                border: 1px solid rgba(255, 255, 255, 0.03);
-                color: white;
-                font-size: 32px;
-                font-weight: bold;
-            }
-        """)
-        
-        # Таймер для возврата обычного стиля
-        QTimer.singleShot(150, self.apply_imported_button_style)
+        # Подсветка нажатия через свойство flash, без повторного разбора стилей
+        THEMES.set_state(self.click_button, "flash", True)
+        QTimer.singleShot(150, self.clear_click_flash)
         
         # Показываем эффект клика
-        self.show_click_effect()
+        self.show_click_effect(earned)
         
     def handle_upgrade(self, action):
-        cost = 0
+        # Улучшения оплачиваются из того же журнала кошелька, что и клики
+        ledger = coreLogic.LEDGER
         if action == "increase_income":
-            cost = self.per_click * 10
-            if self.money >= cost:
-                self.money -= cost
+            if ledger.debit(self.per_click * 10):
                 self.per_click += 1
-                self.update_display()
         elif action == "speed_boost":
-            cost = 500
-            if self.money >= cost:
-                self.money -= cost
-                # Логика ускорения кликов
+            if ledger.debit(500):
+                pass  # Логика ускорения кликов
         elif action == "invest":
-            cost = 1000
-            if self.money >= cost:
-                self.money -= cost
-                # Логика инвестиций
+            if ledger.debit(1000):
+                pass  # Логика инвестиций
         
         self.update_display()
-        self.moneyChanged.emit(self.money)
+        self.moneyChanged.emit(int(ledger.balance()))
+        
+    def on_shown(self):
+        """Экран кликера открыт: баланс мог измениться в фоне"""
+        self.update_display()
         
     def update_display(self):
-        self.money_label.setText(f"Капитал: ${self.money:.1f}")
+        # Один снимок кошелька на кадр вместо отдельных запросов на каждое поле
+        wallet = ExportDB.wallet_snapshot()
+        self.money_label.setText(f"Капитал: ${wallet.balance:.1f}")
         self.per_click_label.setText(f"Доход за клик: ${self.per_click:.1f}")
         self.clicks_label.setText(f"Всего кликов: {self.total_clicks}")
         
     # Остальные методы остаются без изменений
-    def show_click_effect(self):
-        """Визуальный эффект при клике с плавным исчезновением и движением вверх"""
-        # Получаем позицию курсора относительно кнопки
-        cursor_pos = self.click_button.mapFromGlobal(QCursor.pos())
-        
-        # Создаем эффектную метку
-        effect_label = QLabel(f"+${self.per_click:.2f}", self)
-        effect_label.setStyleSheet(f"""
-            QLabel {{
-                color: #bda8ff;
-                font-size: 28px;
-                font-weight: bold;
-                background: transparent;
-                border: none;
-                padding: 0px;
-                min-width: 100px;
-                max-width: 105px;
-            }}
-        """)
-        effect_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Устанавливаем позицию в точке клика
-        global_pos = self.click_button.mapTo(self, cursor_pos)
-        effect_label.move(global_pos.x() - 40, global_pos.y() - 20)
-        effect_label.resize(80, 40)
-        effect_label.show()
-        effect_label.raise_()
-        
-        # Создаем анимационную группу для плавного исчезновения
-        animation_group = QParallelAnimationGroup()
-        
-        # Анимация движения вверх
-        move_animation = QPropertyAnimation(effect_label, b"pos")
-        move_animation.setDuration(1200)
-        move_animation.setStartValue(effect_label.pos())
-        move_animation.setEndValue(QPoint(
-            effect_label.x(),
-            effect_label.y() - 80  # Двигаемся выше
-        ))
-        move_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
-        # Анимация прозрачности (исчезновение)
-        fade_animation = QPropertyAnimation(effect_label, b"windowOpacity")
-        fade_animation.setDuration(1200)
-        fade_animation.setStartValue(1.0)
-        fade_animation.setEndValue(0.0)
-        fade_animation.setEasingCurve(QEasingCurve.Type.InCubic)
-        
-        # Добавляем анимации в группу
-        animation_group.addAnimation(move_animation)
-        animation_group.addAnimation(fade_animation)
-        
-        # Удаление лейбла после завершения анимации
-        animation_group.finished.connect(lambda: effect_label.deleteLater())
-        
-        # Запускаем анимацию
-        animation_group.start()
-        
-        # Сохраняем ссылку на анимацию
-        self.active_animations.append(animation_group)
-        
-    def remove_effect_label(self, label):
-        """Безопасное удаление лейбла эффекта"""
-        if label:
-            label.deleteLater()
-        # Удаляем завершенные анимации из списка
-        self.active_animations = [anim for anim in self.active_animations 
-                                if anim.state() != QPropertyAnimation.State.Stopped]
+    def show_click_effect(self, earned):
+        """Всплывающая надпись дохода за клик в точке курсора"""
+        self.effects.spawn(self.mapFromGlobal(QCursor.pos()), earned)
+    
+    def resizeEvent(self, a0):
+        super().resizeEvent(a0)
+        self.effects.setGeometry(self.rect())
         
     def keyPressEvent(self, a0):
         if a0 is not None and a0.key() == Qt.Key.Key_Space:
@@ -1051,37 +1497,370 @@ class ClickerGame(QWidget):
     def exit_to_menu(self):
         self.navigationRequested.emit("main_menu")
 
-@dataclass
-class Product:
-    id: int
-    name: str
-    price: int
-    description: str
-    category: str
-    stats: str = ""
+Product = coreLogic.Product
+
+class CardContent(NamedTuple):
+    """Содержимое карточки списка: что рисует CardDelegate"""
+    title: str
+    subtitle: str = ""
+    stats: tuple = ()  # Пары (название, значение)
+    badge: str = ""
+    warning: str = ""
+    action: str = ""  # Текст кнопки; пусто - без кнопки
+    enabled: bool = True
+    owned: bool = False  # Фон собственного объекта
+    dark: bool = False  # Красная рамка темного бизнеса
+
+CARD_CONTENT_ROLE = Qt.ItemDataRole.UserRole
+CARD_ITEM_ROLE = Qt.ItemDataRole.UserRole + 1
+
+class CardListModel(QAbstractListModel):
+    """Модель списка карточек.
+    
+    Хранит только исходные объекты; CardContent строится функцией describe
+    при первой отрисовке карточки и кэшируется по ключу элемента, поэтому
+    считаются только видимые карточки, а после смены фильтра или покупки
+    оставшиеся карточки не пересчитываются. Доступность кнопки, зависящая
+    от баланса, задается функцией enabled и проверяется при отрисовке.
+    Строка модели - ряд из columns карточек: представление остается простым
+    вертикальным списком строк одной высоты.
+    """
+    
+    contentsChanged = pyqtSignal()  # Содержимое карточек нужно перерисовать
+    
+    def __init__(self, describe, key=lambda item: item, columns=1, enabled=None, parent=None):
+        super().__init__(parent)
+        self.describe = describe
+        self.key = key
+        self.columns = columns
+        self.enabled = enabled
+        self.items = []
+        self.keys = []
+        self.contents = {}  # ключ -> (элемент, CardContent)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return (len(self.items) + self.columns - 1) // self.columns
+    
+    def content(self, position):
+        """CardContent элемента с порядковым номером position"""
+        item = self.items[position]
+        key = self.keys[position]
+        cached = self.contents.get(key)
+        # Элемент с тем же ключом мог измениться (например, товар после правки в базе)
+        if cached is None or not (cached[0] is item or cached[0] == item):
+            cached = self.contents[key] = (item, self.describe(item))
+        content = cached[1]
+        if self.enabled is not None:
+            enabled = self.enabled(item)
+            if enabled != content.enabled:
+                content = content._replace(enabled=enabled)
+        return content
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        first = index.row() * self.columns
+        positions = range(first, min(first + self.columns, len(self.items)))
+        if role == CARD_ITEM_ROLE:
+            return [self.items[position] for position in positions]
+        if role == CARD_CONTENT_ROLE:
+            return [self.content(position) for position in positions]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return ", ".join(self.content(position).title for position in positions)
+        return None
+    
+    def set_items(self, items):
+        """Сверяет список с новым по ключам.
+        
+        Содержимое карточек, оставшихся в списке, берется из кэша, ушедшие
+        карточки из него удаляются. Ряды одинаковые, поэтому меняется только
+        их число: недостающие добавляются, лишние удаляются в конце списка,
+        без сброса модели - представление сохраняет прокрутку и раскладку.
+        """
+        items = list(items)
+        keys = [self.key(item) for item in items]
+        if keys != self.keys:
+            present = set(keys)
+            self.contents = {key: cached for key, cached in self.contents.items() if key in present}
+        old_rows = self.rowCount()
+        new_rows = (len(items) + self.columns - 1) // self.columns
+        if new_rows > old_rows:
+            self.beginInsertRows(QModelIndex(), old_rows, new_rows - 1)
+            self.items, self.keys = items, keys
+            self.endInsertRows()
+        elif new_rows < old_rows:
+            self.beginRemoveRows(QModelIndex(), new_rows, old_rows - 1)
+            self.items, self.keys = items, keys
+            self.endRemoveRows()
+        else:
+            self.items, self.keys = items, keys
+        self.contentsChanged.emit()
+    
+    def refresh(self):
+        """Перестраивает содержимое всех карточек.
+        
+        dataChanged по диапазону заставляет QListView заново раскладывать все
+        строки, а размеры рядов не меняются - достаточно перерисовки.
+        """
+        self.contents.clear()
+        self.contentsChanged.emit()
+
+class CardDelegate(QStyledItemDelegate):
+    """Рисует ряд карточек CardContent и обрабатывает нажатия на их кнопки.
+    
+    compact - карточка-строка: текст слева, кнопка справа.
+    """
+    
+    actionTriggered = pyqtSignal(object)  # Исходный объект карточки
+    
+    PADDING = 14
+    GAP = 20  # Промежуток между карточками ряда
+    
+    def __init__(self, compact=False, parent=None):
+        super().__init__(parent)
+        self.compact = compact
+        self.size = QSize(200, 80 if compact else 230)  # Ширину задает представление
+        self.text_role = 'card-row-text' if compact else 'card-text'
+    
+    @staticmethod
+    def use_role(painter, name):
+        """Переключает шрифт и цвет пера на текстовую роль темы"""
+        font, color = THEMES.role(name)
+        painter.setFont(font)
+        painter.setPen(color)
+    
+    def sizeHint(self, option, index):
+        return self.size
+    
+    def card_rects(self, option, count, columns):
+        """Прямоугольники карточек ряда"""
+        rect = QRectF(option.rect)
+        width = (rect.width() - self.GAP * (columns - 1)) / columns
+        return [QRectF(rect.left() + column * (width + self.GAP), rect.top(), width, rect.height())
+                .adjusted(1.5, 1.5, -1.5, -1.5) for column in range(count)]
+    
+    def action_rect(self, rect):
+        if self.compact:
+            return QRectF(rect.right() - self.PADDING - 120, rect.center().y() - 17.5, 120, 35)
+        return QRectF(rect.left() + self.PADDING, rect.bottom() - self.PADDING - 30,
+                      rect.width() - 2 * self.PADDING, 30)
+    
+    def paint(self, painter, option, index):
+        contents = index.data(CARD_CONTENT_ROLE)
+        if not contents:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        hover_pos = getattr(option.widget, 'hover_pos', None)
+        columns = index.model().columns
+        for rect, content in zip(self.card_rects(option, len(contents), columns), contents):
+            self.paint_card(painter, rect, content, hover_pos is not None and rect.contains(hover_pos))
+        painter.restore()
+    
+    def paint_card(self, painter, rect, content, hovered):
+        if self.compact:
+            painter.setBrush(THEMES.color('CARD_BG'))
+            painter.setPen(QPen(THEMES.color('PURPLE_ACCENT' if hovered else 'PURPLE_PRIMARY'), 1))
+            painter.drawRoundedRect(rect, 10, 10)
+        else:
+            gradient = QLinearGradient(rect.topLeft(), rect.bottomLeft())
+            top = 'PURPLE_PRIMARY' if hovered else 'PANEL_BG' if content.owned else 'CARD_BG'
+            gradient.setColorAt(0, THEMES.color(top))
+            gradient.setColorAt(1, THEMES.color('DEEP_PURPLE'))
+            painter.setBrush(QBrush(gradient))
+            if hovered:
+                border = THEMES.color('PURPLE_ACCENT')
+            else:
+                border = THEMES.color('DANGER' if content.dark else 'PURPLE_PRIMARY')
+            painter.setPen(QPen(border, 3))
+            painter.drawRoundedRect(rect, 15, 15)
+        
+        inner = rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        if content.action:
+            action = self.action_rect(rect)
+            if self.compact:
+                inner.setRight(action.left() - self.PADDING)
+        
+        if self.compact:
+            self.paint_row_text(painter, inner, content)
+        else:
+            self.paint_card_text(painter, inner, content)
+        
+        if content.action:
+            self.paint_button(painter, action, content)
+    
+    def paint_row_text(self, painter, inner, content):
+        text_width = inner.width()
+        if content.badge:
+            self.use_role(painter, 'card-level')
+            painter.drawText(inner, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, content.badge)
+            text_width -= painter.fontMetrics().horizontalAdvance(content.badge) + self.PADDING
+        
+        self.use_role(painter, 'card-title')
+        title = painter.fontMetrics().elidedText(content.title, Qt.TextElideMode.ElideRight, int(text_width))
+        painter.drawText(QRectF(inner.left(), inner.top(), text_width, inner.height() / 2),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title)
+        
+        self.use_role(painter, self.text_role)
+        subtitle = painter.fontMetrics().elidedText(content.subtitle, Qt.TextElideMode.ElideRight, int(text_width))
+        painter.drawText(QRectF(inner.left(), inner.center().y(), text_width, inner.height() / 2),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, subtitle)
+    
+    def paint_card_text(self, painter, inner, content):
+        top = inner.top()
+        
+        # Заголовок и значок справа
+        title_width = inner.width()
+        if content.badge:
+            self.use_role(painter, 'card-level')
+            painter.drawText(QRectF(inner.left(), top, inner.width(), 24),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, content.badge)
+            title_width -= painter.fontMetrics().horizontalAdvance(content.badge) + 8
+        self.use_role(painter, 'card-title')
+        title = painter.fontMetrics().elidedText(content.title, Qt.TextElideMode.ElideRight, int(title_width))
+        painter.drawText(QRectF(inner.left(), top, title_width, 24),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title)
+        top += 30
+        
+        # Описание (до двух строк)
+        self.use_role(painter, self.text_role)
+        painter.drawText(QRectF(inner.left(), top, inner.width(), 30),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+                         content.subtitle)
+        top += 36
+        
+        # Характеристики в две колонки
+        column_width = inner.width() / 2
+        for i, (name, value) in enumerate(content.stats):
+            x = inner.left() + (i % 2) * column_width
+            y = top + (i // 2) * 18
+            self.use_role(painter, 'card-stat-name')
+            painter.drawText(QRectF(x, y, column_width, 16), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, name)
+            name_width = painter.fontMetrics().horizontalAdvance(name) + 6
+            self.use_role(painter, 'card-stat-value')
+            painter.drawText(QRectF(x + name_width, y, column_width - name_width, 16),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, value)
+        top += ((len(content.stats) + 1) // 2) * 18 + 6
+        
+        # Предупреждение (риск темных бизнесов)
+        if content.warning:
+            warning_rect = QRectF(inner.left(), top, inner.width(), 22)
+            font, color = THEMES.role('card-risk')
+            background = QColor(color)
+            background.setAlpha(51)
+            painter.setPen(QPen(color, 1))
+            painter.setBrush(background)
+            painter.drawRoundedRect(warning_rect, 6, 6)
+            painter.setFont(font)
+            painter.drawText(warning_rect.adjusted(8, 0, -8, 0),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, content.warning)
+    
+    def paint_button(self, painter, rect, content):
+        if content.enabled:
+            gradient = QLinearGradient(rect.topLeft(), rect.bottomLeft())
+            gradient.setColorAt(0, THEMES.color('DEEP_PURPLE'))
+            gradient.setColorAt(1, THEMES.color('PURPLE_PRIMARY'))
+            painter.setBrush(QBrush(gradient))
+            painter.setPen(QPen(THEMES.color('PURPLE_ACCENT'), 2))
+        else:
+            painter.setBrush(THEMES.color('TEXT_TERTIARY'))
+            painter.setPen(QPen(THEMES.color('TEXT_TERTIARY'), 2))
+        painter.drawRoundedRect(rect, 8, 8)
+        self.use_role(painter, 'card-button')
+        if not content.enabled:
+            painter.setPen(THEMES.color('TEXT_SECONDARY'))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, content.action)
+    
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            contents = index.data(CARD_CONTENT_ROLE) or []
+            items = index.data(CARD_ITEM_ROLE) or []
+            pos = event.position()
+            for rect, content, item in zip(self.card_rects(option, len(contents), model.columns), contents, items):
+                if content.action and content.enabled and self.action_rect(rect).contains(pos):
+                    self.actionTriggered.emit(item)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+class CardGridView(QListView):
+    """Виртуализированный список карточек: рисуются только видимые ряды.
+    
+    Ряды одной высоты и растягиваются на ширину видимой области, поэтому
+    прокрутка и изменение размера не зависят от числа элементов; первичная
+    раскладка идет порциями, не блокируя интерфейс.
+    """
+    
+    BATCH_SIZE = 200
+    
+    def __init__(self, model, delegate, spacing=10, parent=None):
+        super().__init__(parent)
+        self.hover_pos = None
+        # Представление владеет моделью и делегатом, если их не держит кто-то другой
+        if model.parent() is None:
+            model.setParent(self)
+        delegate.setParent(self)
+        self.setModel(model)
+        self.setItemDelegate(delegate)
+        model.contentsChanged.connect(self.viewport().update)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(self.BATCH_SIZE)
+        self.setSpacing(spacing)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setMouseTracking(True)
+        self.setStyleSheet("""
+            QListView {
+                border: none;
+                background: transparent;
+            }
+            QScrollBar:vertical {
+                background: rgba(255,255,255,0.1);
+                width: 12px;
+                margin: 0px;
+            }
+            QScrollBar::handle:vertical {
+                background: rgba(120, 20, 220, 0.6);
+                border-radius: 6px;
+                min-height: 20px;
+            }
+            QScrollBar::handle:vertical:hover {
+                background: rgba(160, 60, 255, 0.8);
+            }
+        """)
+    
+    def mouseMoveEvent(self, e):
+        # Подсветка отдельной карточки внутри ряда: перерисовываются только затронутые ряды
+        previous = self.indexAt(self.hover_pos.toPoint()) if self.hover_pos is not None else QModelIndex()
+        self.hover_pos = e.position()
+        current = self.indexAt(self.hover_pos.toPoint())
+        for index in {previous, current}:
+            if index.isValid():
+                self.viewport().update(self.visualRect(index))
+        super().mouseMoveEvent(e)
+    
+    def leaveEvent(self, e):
+        if self.hover_pos is not None:
+            index = self.indexAt(self.hover_pos.toPoint())
+            self.hover_pos = None
+            if index.isValid():
+                self.viewport().update(self.visualRect(index))
+        super().leaveEvent(e)
 
 class ShopSystem:
     def __init__(self):
         self.export = coreLogic.ExportDB()
+        self.catalog = coreLogic.CATALOG.load()
         
     def load_products(self, category):
-        """Загрузка товаров по категории"""
-        products = []
-        
-        if category == "islands":
-            data = self.export.get_shop_islands()
-            if data is not None:
-                products.append(Product(data[0], data[1], data[2], data[3], "Острова"))
-        elif category == "boosters":
-            data = self.export.get_shop_boosters()
-            if data is not None:
-                products.append(Product(data[0], data[1], data[2], data[3], "Бустеры"))
-        elif category == "cars":
-            data = self.export.get_shop_cars()
-            if data is not None:
-                products.append(Product(data[0], data[1], data[2], data[3], "Машины", data[4]))
-            
-        return products
+        """Загрузка товаров по категории из каталога (база перечитывается только при изменениях)"""
+        self.catalog.refresh()
+        return self.catalog.products(category)
 
 class InvestmentMenu(QWidget):
     """Меню инвестиций"""
@@ -1188,80 +1967,22 @@ class InvestmentMenu(QWidget):
         return widget
         
     def create_stocks_tab(self):
-        widget = QWidget()
-        layout = QVBoxLayout()
-        
-        stocks = self.export.get_actives()
-        for stock in stocks:
-            stock_widget = self.create_investment_item(stock, "Акция", "📈")
-            layout.addWidget(stock_widget)
-        
-        layout.addStretch()
-        widget.setLayout(layout)
-        return widget
+        return self.create_investment_list(self.export.get_actives(), "Акция", "📈")
         
     def create_real_estate_tab(self):
-        widget = QWidget()
-        layout = QVBoxLayout()
-        
-        properties = self.export.get_homes()
-        for prop in properties:
-            prop_widget = self.create_investment_item(prop, "Недвижимость", "🏠")
-            layout.addWidget(prop_widget)
-        
-        layout.addStretch()
-        widget.setLayout(layout)
-        return widget
+        return self.create_investment_list(self.export.get_homes(), "Недвижимость", "🏠")
         
     def create_crypto_tab(self):
-        widget = QWidget()
-        layout = QVBoxLayout()
+        return self.create_investment_list(self.export.get_crypto(), "Криптовалюта", "₿")
         
-        cryptos = self.export.get_crypto()
-        for crypto in cryptos:
-            crypto_widget = self.create_investment_item(crypto, "Криптовалюта", "₿")
-            layout.addWidget(crypto_widget)
+    def create_investment_list(self, names, type, icon):
+        """Список инвестиций: строки рисуются делегатом, виджеты на элементы не создаются"""
+        model = CardListModel(lambda name: self.describe_investment(name, type, icon))
+        model.set_items(names)
+        return CardGridView(model, CardDelegate(compact=True), spacing=5)
         
-        layout.addStretch()
-        widget.setLayout(layout)
-        return widget
-        
-    def create_investment_item(self, name, type, icon):
-        widget = QFrame()
-        widget.setStyleSheet(f"""
-            QFrame {{
-                background-color: {CARD_BG.name()};
-                border: 1px solid {PURPLE_PRIMARY.name()};
-                border-radius: 10px;
-                padding: 15px;
-                margin: 5px;
-            }}
-        """)
-        
-        layout = QHBoxLayout()
-        
-        # Информация
-        info_layout = QVBoxLayout()
-        
-        name_label = QLabel(f"{icon} {name}")
-        name_label.setStyleSheet(f"color: {TEXT_PRIMARY.name()}; font-size: 16px; font-weight: bold;")
-        
-        type_label = QLabel(type)
-        type_label.setStyleSheet(f"color: {TEXT_SECONDARY.name()}; font-size: 14px;")
-        
-        info_layout.addWidget(name_label)
-        info_layout.addWidget(type_label)
-        
-        layout.addLayout(info_layout)
-        layout.addStretch()
-        
-        # Кнопка действия
-        action_btn = AnimatedButton("Инвестировать")
-        action_btn.setFixedSize(120, 35)
-        layout.addWidget(action_btn)
-        
-        widget.setLayout(layout)
-        return widget
+    def describe_investment(self, name, type, icon):
+        return CardContent(title=f"{icon} {name}", subtitle=type, action="Инвестировать")
         
     def keyPressEvent(self, a0):
         if a0 is not None and a0.key() == Qt.Key.Key_Escape:
@@ -1437,6 +2158,12 @@ class LightShopMenu(QWidget):
                 row += 1
         
         layout.addLayout(categories_layout)
+        
+        # Товары выбранной категории
+        self.products_model = CardListModel(self.describe_product, key=lambda product: product.id)
+        self.products_view = CardGridView(self.products_model, CardDelegate(compact=True), spacing=5)
+        self.products_view.hide()
+        layout.addWidget(self.products_view, 1)
         layout.addStretch()
         
         self.setLayout(layout)
@@ -1448,7 +2175,12 @@ class LightShopMenu(QWidget):
         return btn
         
     def open_category(self, category):
-        print(f"Открыта категория: {category}")
+        products = self.shop_system.load_products(category)
+        self.products_model.set_items(products)
+        self.products_view.setVisible(bool(products))
+        
+    def describe_product(self, product):
+        return CardContent(title=product.name, subtitle=product.description or "", badge=f"${product.price:,.0f}")
         
     def keyPressEvent(self, a0):
         if a0 is not None and a0.key() == Qt.Key.Key_Escape:
@@ -1459,75 +2191,17 @@ class LightShopMenu(QWidget):
 class BusinessManager:
     def __init__(self):
         self.my_businesses = []
+        self.loader = coreLogic.BusinessLoader()
         self.business_data = self.load_business_data()
         self.crypto_balance = 50000  # Начальный баланс крипты для трейдинга
         self.reputation = 100  # Репутация игрока
         self.risk_level = 0  # Уровень риска
         self.player_balance = 1000000  # Баланс игрока
+        self.deadlines = coreLogic.DeadlineScheduler()  # Кулдауны специальных режимов
         
     def load_business_data(self):
-        """Загрузка данных о бизнесах из базы данных"""
-        conn = sqlite3.connect("data/businesses.db")
-        cursor = conn.cursor()
-        
-        businesses = []
-        
-        # Загружаем основные данные бизнесов
-        cursor.execute('SELECT * FROM businesses')
-        business_rows = cursor.fetchall()
-        
-        for row in business_rows:
-            business = {
-                'id': row[0],
-                'name': row[1],
-                'icon': row[2],
-                'level': row[3],
-                'income_per_hour': row[4],
-                'workers': row[5],
-                'workload': row[6],
-                'primary_action': row[7],
-                'type': row[8],
-                'risk': row[9],
-                'price': row[10],
-                'can_go_dark': bool(row[11]),
-                'ev_production': bool(row[12]),
-                'bio_prosthetics': bool(row[13]),
-                'neuro_chips': bool(row[14]),
-                'servers': row[15],
-                'data_center': bool(row[16]),
-                'heat_recovery': bool(row[17]),
-                'botnet_active': bool(row[18]),
-                'trust_level': row[19],
-                'max_launder_amount': row[20],
-                'crypto_reserve_usage': row[21]
-            }
-            
-            # Загружаем роли
-            cursor.execute('SELECT name, cost, effect FROM business_roles WHERE business_id = ?', (business['id'],))
-            business['available_roles'] = [{'name': r[0], 'cost': r[1], 'effect': r[2]} for r in cursor.fetchall()]
-            
-            # Загружаем специальные режимы
-            cursor.execute('SELECT name, cooldown, cost, effect FROM special_modes WHERE business_id = ?', (business['id'],))
-            business['special_modes'] = [{'name': r[0], 'cooldown': r[1], 'cost': r[2], 'effect': r[3]} for r in cursor.fetchall()]
-            
-            # Загружаем синергии
-            cursor.execute('SELECT synergy_name FROM business_synergies WHERE business_id = ?', (business['id'],))
-            business['synergies'] = [r[0] for r in cursor.fetchall()]
-            
-            # Загружаем темные действия
-            cursor.execute('SELECT name, income_multiplier, risk_increase FROM dark_actions WHERE business_id = ?', (business['id'],))
-            business['dark_actions'] = [{'name': r[0], 'income_multiplier': r[1], 'risk_increase': r[2]} for r in cursor.fetchall()]
-            
-            # Загружаем улучшения
-            cursor.execute('SELECT upgrade_type, level FROM business_upgrades WHERE business_id = ?', (business['id'],))
-            upgrades = cursor.fetchall()
-            for upgrade_type, level in upgrades:
-                business[f'upgrade_{upgrade_type}'] = level
-            
-            businesses.append(business)
-        
-        conn.close()
-        return businesses
+        """Загрузка данных о бизнесах из базы данных (постоянное число запросов)"""
+        return self.loader.load_all()
     
     def buy_business(self, business_data):
         """Покупка бизнеса с проверкой баланса"""
@@ -1544,59 +2218,7 @@ class BusinessManager:
     
     def create_business_from_db_row(self, row):
         """Создание объекта бизнеса из строки базы данных"""
-        business = {
-            'id': row[0],
-            'name': row[1],
-            'icon': row[2],
-            'level': row[3],
-            'income_per_hour': row[4],
-            'workers': row[5],
-            'workload': row[6],
-            'primary_action': row[7],
-            'type': row[8],
-            'risk': row[9],
-            'price': row[10],
-            'can_go_dark': bool(row[11]),
-            'ev_production': bool(row[12]),
-            'bio_prosthetics': bool(row[13]),
-            'neuro_chips': bool(row[14]),
-            'servers': row[15],
-            'data_center': bool(row[16]),
-            'heat_recovery': bool(row[17]),
-            'botnet_active': bool(row[18]),
-            'trust_level': row[19],
-            'max_launder_amount': row[20],
-            'crypto_reserve_usage': row[21]
-        }
-        
-        # Загружаем дополнительные данные для бизнеса
-        conn = sqlite3.connect("data/businesses.db")
-        cursor = conn.cursor()
-        
-        # Загружаем роли
-        cursor.execute('SELECT name, cost, effect FROM business_roles WHERE business_id = ?', (business['id'],))
-        business['available_roles'] = [{'name': r[0], 'cost': r[1], 'effect': r[2]} for r in cursor.fetchall()]
-        
-        # Загружаем специальные режимы
-        cursor.execute('SELECT name, cooldown, cost, effect FROM special_modes WHERE business_id = ?', (business['id'],))
-        business['special_modes'] = [{'name': r[0], 'cooldown': r[1], 'cost': r[2], 'effect': r[3]} for r in cursor.fetchall()]
-        
-        # Загружаем синергии
-        cursor.execute('SELECT synergy_name FROM business_synergies WHERE business_id = ?', (business['id'],))
-        business['synergies'] = [r[0] for r in cursor.fetchall()]
-        
-        # Загружаем темные действия
-        cursor.execute('SELECT name, income_multiplier, risk_increase FROM dark_actions WHERE business_id = ?', (business['id'],))
-        business['dark_actions'] = [{'name': r[0], 'income_multiplier': r[1], 'risk_increase': r[2]} for r in cursor.fetchall()]
-        
-        # Загружаем улучшения
-        cursor.execute('SELECT upgrade_type, level FROM business_upgrades WHERE business_id = ?', (business['id'],))
-        upgrades = cursor.fetchall()
-        for upgrade_type, level in upgrades:
-            business[f'upgrade_{upgrade_type}'] = level
-        
-        conn.close()
-        return business
+        return self.loader.hydrate(row)
     
     def get_total_income(self):
         """Общий доход в час со всех бизнесов"""
@@ -1604,17 +2226,13 @@ class BusinessManager:
     
     def update_business_upgrade(self, business_id, upgrade_type, new_level):
         """Обновление уровня улучшения в базе данных"""
-        conn = sqlite3.connect("data/businesses.db")
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE business_upgrades 
-            SET level = ? 
-            WHERE business_id = ? AND upgrade_type = ?
-        ''', (new_level, business_id, upgrade_type))
-        
-        conn.commit()
-        conn.close()
+        with coreLogic.DB.get(coreLogic.BUSINESSES_DB) as conn:
+            conn.execute('''
+                UPDATE business_upgrades 
+                SET level = ? 
+                WHERE business_id = ? AND upgrade_type = ?
+            ''', (new_level, business_id, upgrade_type))
+        self.loader.invalidate()
         
     def upgrade_business(self, business_id, upgrade_type):
         """Улучшение бизнеса с эффектами"""
@@ -1654,15 +2272,19 @@ class BusinessManager:
         
         effect = effects[upgrade_type].get(new_level)
         if effect:
+            if upgrade_type == 4:
+                self.unlock_feature(business, effect)
+                return
+            # Множители пройденных уровней накапливаются: модификатор - их произведение
+            factor = math.prod(effects[upgrade_type][level] for level in range(2, new_level + 1))
+            source = f'upgrade_{upgrade_type}'
             if upgrade_type in [1, 2]:
-                business['income_per_hour'] = int(business['income_per_hour'] * effect)
+                business.stats.set_modifier('upgrades', source, 'income_per_hour', factor)
             elif upgrade_type == 3:
-                business['workers'] = max(1, int(business['workers'] * effect))
-            elif upgrade_type == 4:
-                self.unlock_feature(business, effect)
+                business.stats.set_modifier('upgrades', source, 'workers', factor)
             elif upgrade_type == 5:
                 if business['type'] == 'dark':
-                    business['risk'] = max(5, int(business.get('risk', 20) * effect))
+                    business.stats.set_modifier('upgrades', source, 'risk', factor)
                 else:
                     business['trust_bonus'] = effect  # Бонус к доверию
     
@@ -1670,7 +2292,7 @@ class BusinessManager:
         """Разблокировка специальных фич бизнеса"""
         if business['name'] == 'Автопром' and 'EV' in feature:
             business['ev_production'] = True
-            business['income_per_hour'] = int(business['income_per_hour'] * 1.5)
+            business.stats.set_modifier('upgrades', 'ev_production', 'income_per_hour', 1.5)
         elif business['name'] == 'Робототехника' and 'био' in feature.lower():
             business['bio_prosthetics'] = True
         elif business['name'] == 'Робототехника' and 'нейро' in feature.lower():
@@ -1679,19 +2301,24 @@ class BusinessManager:
             business['servers'] += 1
         elif business['name'] == 'AI разработки' and 'дата-центр' in feature.lower():
             business['data_center'] = True
-            business['income_per_hour'] = int(business['income_per_hour'] * 1.3)
+            business.stats.set_modifier('upgrades', 'data_center', 'income_per_hour', 1.3)
         elif business['name'] == 'Теневой майнинг' and 'рекуперация' in feature.lower():
             business['heat_recovery'] = True
-            business['income_per_hour'] = int(business['income_per_hour'] * 1.2)
+            business.stats.set_modifier('upgrades', 'heat_recovery', 'income_per_hour', 1.2)
         elif business['name'] == 'Отмывание денег' and 'доверие' in feature.lower():
             business['trust_level'] += 1
             business['max_launder_amount'] *= 2
     
     def activate_special_mode(self, business, mode_name):
-        """Активация специального режима бизнеса"""
+        """Активация специального режима бизнеса (False - режим не найден или на кулдауне)"""
+        # Истёкшие кулдауны снимаются из кучи, остальные не трогаются
+        self.deadlines.pop_due()
         for mode in business.get('special_modes', []):
             if mode['name'] == mode_name:
-                # В реальной реализации здесь была бы проверка кулдауна и стоимости
+                if self.mode_cooldown(business, mode_name) > 0:
+                    return False
+                self.deadlines.schedule(('cooldown', business['id'], mode_name),
+                                        coreLogic.parse_duration(mode['cooldown']), business)
                 # Пока просто применяем эффект
                 if 'доход' in mode['effect'].lower():
                     # Временное увеличение дохода
@@ -1702,11 +2329,15 @@ class BusinessManager:
                 return True
         return False
     
+    def mode_cooldown(self, business, mode_name):
+        """Сколько секунд осталось до повторной активации режима"""
+        return self.deadlines.remaining(('cooldown', business['id'], mode_name))
+    
     def toggle_dark_side(self, business):
         """Перевод бизнеса на темную сторону"""
         if business.get('can_go_dark', False) and business['type'] == 'light':
             business['type'] = 'dark'
-            business['income_per_hour'] = int(business['income_per_hour'] * 1.8)
+            business.stats.set_modifier('operations', 'dark_side', 'income_per_hour', 1.8)
             business['risk'] = 25  # Начальный уровень риска
             self.risk_level += 15
             self.reputation -= 20
@@ -2429,7 +3060,12 @@ class BusinessMenu(QWidget):
         
     def activate_special_mode(self, mode, business_data):
         """Активировать специальный режим"""
-        QMessageBox.information(self, "Специальный режим", f"Активирован: {mode['name']}")
+        if self.business_manager.activate_special_mode(business_data, mode['name']):
+            QMessageBox.information(self, "Специальный режим", f"Активирован: {mode['name']}")
+        else:
+            remaining = self.business_manager.mode_cooldown(business_data, mode['name'])
+            QMessageBox.warning(self, "Кулдаун", f"{mode['name']} будет доступен через "
+                                f"{coreLogic.format_duration(remaining)}")
         
     def upgrade_business(self, business_data, upgrade_type):
         """Улучшить бизнес с проверкой стоимости"""
@@ -2475,8 +3111,9 @@ class BusinessMenu(QWidget):
             business['workload'] = min(100, business['workload'] + random.randint(1, 5))
             
         # Обновляем риск для темных бизнесов
+        # Риск растет в базе, модификаторы улучшений применяются поверх
         if business.get('type') == 'dark':
-            business['risk'] = min(95, business.get('risk', 20) + random.randint(1, 3))
+            business['risk'] = min(95, business.stats.base.get('risk', 20) + random.randint(1, 3))
 
     def add_passive_income(self, business):
         """Добавление пассивного дохода от бизнеса"""
@@ -2491,7 +3128,7 @@ class BusinessMenu(QWidget):
                                    "Это даст больше дохода, но увеличит риски.")
         if reply == QMessageBox.StandardButton.Yes:
             business_data['type'] = 'dark'
-            business_data['income_per_hour'] = int(business_data['income_per_hour'] * 1.5)
+            business_data.stats.set_modifier('operations', 'dark_side', 'income_per_hour', 1.5)
             QMessageBox.information(self, "Успех", "Бизнес переведен на темную сторону! Доход увеличен.")
             self.load_my_businesses()
             
@@ -2537,18 +3174,13 @@ class BusinessMenu(QWidget):
     def save_business_to_db(self, business):
         """Сохраняем бизнес в базу данных"""
         try:
-            conn = sqlite3.connect("data/businesses.db")
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO player_businesses 
-                (business_id, level, income_per_hour, workers, workload, is_active)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (business['id'], business['level'], business['income_per_hour'], 
-                business['workers'], business.get('workload', 0), 1))
-            
-            conn.commit()
-            conn.close()
+            with coreLogic.DB.get(coreLogic.BUSINESSES_DB) as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO player_businesses 
+                    (business_id, level, income_per_hour, workers, workload, is_active)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (business['id'], business['level'], business['income_per_hour'], 
+                    business['workers'], business.get('workload', 0), 1))
         except Exception as e:
             print(f"Ошибка сохранения бизнеса: {e}")
         
@@ -2558,744 +3190,86 @@ class BusinessMenu(QWidget):
         else:
             super().keyPressEvent(a0)
 
-class BusinessUpgradeSystem:
-    """Универсальная система улучшений для всех бизнесов"""
-    
-    UPGRADE_TYPES = {
-        1: {"name": "⚡ Производительность", "effect": "increase_speed", "icon": "⚡", "description": "Увеличивает скорость операций и доход"},
-        2: {"name": "🎯 Качество", "effect": "increase_quality", "icon": "🎯", "description": "Повышает качество продукции и снижает риски"},
-        3: {"name": "🤖 Автоматизация", "effect": "increase_automation", "icon": "🤖", "description": "Уменьшает потребность в работниках"},
-        4: {"name": "💡 Инновация", "effect": "unlock_features", "icon": "💡", "description": "Открывает уникальные возможности"},
-        5: {"name": "🛡️ Безопасность", "effect": "increase_security", "icon": "🛡️", "description": "Повышает защиту и снижает риски"}
-    }
-    
-    def __init__(self, business):
-        self.business = business
-        self.levels = {1: 1, 2: 1, 3: 1, 4: 1, 5: 1}
-        self.max_level = 5
-        
-    def get_upgrade_cost(self, upgrade_type, current_level):
-        """Расчет стоимости улучшения"""
-        base_cost = self.business.get('base_upgrade_cost', 15000)
-        return int(base_cost * (2.5 ** (current_level - 1)))
-    
-    def can_upgrade(self, upgrade_type):
-        """Можно ли улучшить"""
-        current_level = self.levels.get(upgrade_type, 1)
-        return current_level < self.max_level
-    
-    def upgrade(self, upgrade_type, player_balance):
-        """Улучшение с проверкой стоимости"""
-        if not self.can_upgrade(upgrade_type):
-            return False, "Максимальный уровень достигнут"
-            
-        current_level = self.levels[upgrade_type]
-        cost = self.get_upgrade_cost(upgrade_type, current_level)
-        
-        if player_balance < cost:
-            return False, f"Недостаточно средств. Нужно ${cost:,}"
-        
-        self.levels[upgrade_type] += 1
-        self.apply_upgrade_effect(upgrade_type, self.levels[upgrade_type])
-        return True, f"Улучшение {self.UPGRADE_TYPES[upgrade_type]['name']} повышено до уровня {self.levels[upgrade_type]}"
-    
-    def apply_upgrade_effect(self, upgrade_type, new_level):
-        """Применение эффектов улучшения"""
-        effects = {
-            1: self._apply_productivity_effect,
-            2: self._apply_quality_effect, 
-            3: self._apply_automation_effect,
-            4: self._apply_innovation_effect,
-            5: self._apply_security_effect
-        }
-        
-        if upgrade_type in effects:
-            effects[upgrade_type](new_level)
-    
-    def _apply_productivity_effect(self, level):
-        """Эффект производительности"""
-        multiplier = 1.0 + (level - 1) * 0.3  # +30% за уровень
-        if 'base_income' in self.business:
-            self.business['income_per_hour'] = int(self.business['base_income'] * multiplier)
-        self.business['efficiency'] = multiplier
-    
-    def _apply_quality_effect(self, level):
-        """Эффект качества"""
-        quality_bonus = (level - 1) * 0.2  # +20% за уровень
-        self.business['quality_level'] = 1.0 + quality_bonus
-        if 'risk' in self.business:
-            self.business['risk'] = max(5, self.business['base_risk'] - (level - 1) * 5)
-    
-    def _apply_automation_effect(self, level):
-        """Эффект автоматизации"""
-        automation_rate = (level - 1) * 0.25  # +25% автоматизации за уровень
-        self.business['automation_level'] = automation_rate
-        if 'base_workers' in self.business:
-            self.business['workers'] = max(1, int(self.business['base_workers'] * (1 - automation_rate)))
-    
-    def _apply_innovation_effect(self, level):
-        """Эффект инноваций"""
-        innovation_features = {
-            2: "basic_innovation",
-            3: "advanced_innovation", 
-            4: "premium_innovation",
-            5: "breakthrough_technology"
-        }
-        
-        if level in innovation_features:
-            feature = innovation_features[level]
-            if 'unlocked_features' not in self.business:
-                self.business['unlocked_features'] = []
-            self.business['unlocked_features'].append(feature)
-            self.unlock_business_specific_feature(feature, level)
-    
-    def _apply_security_effect(self, level):
-        """Эффект безопасности"""
-        security_bonus = (level - 1) * 0.15
-        self.business['security_level'] = security_bonus
-        if 'risk' in self.business:
-            self.business['risk'] = max(5, self.business['risk'] - (level - 1) * 3)
-    
-    def unlock_business_specific_feature(self, feature, level):
-        """Разблокировка уникальных фич для каждого бизнеса"""
-        business_type = self.business['type']
-        business_name = self.business['name']
-        
-        feature_map = {
-            'Биотех Лаборатория': {
-                'basic_innovation': {'research_speed': 1.2},
-                'advanced_innovation': {'clinical_trials': True},
-                'premium_innovation': {'gene_editing': True, 'income_multiplier': 1.4},
-                'breakthrough_technology': {'neuro_implants': True, 'bio_prosthetics': True, 'income_multiplier': 1.8}
-            },
-            'Автопром': {
-                'basic_innovation': {'production_speed': 1.3},
-                'advanced_innovation': {'hybrid_tech': True},
-                'premium_innovation': {'ev_platform': True, 'income_multiplier': 1.6},
-                'breakthrough_technology': {'autonomous_driving': True, 'flying_cars': True, 'income_multiplier': 2.0}
-            },
-            'AI разработки': {
-                'basic_innovation': {'training_speed': 1.25},
-                'advanced_innovation': {'neural_networks': True},
-                'premium_innovation': {'quantum_computing': True, 'income_multiplier': 1.7},
-                'breakthrough_technology': {'agi_development': True, 'income_multiplier': 2.2}
-            }
-        }
-        
-        if business_name in feature_map and feature in feature_map[business_name]:
-            feature_data = feature_map[business_name][feature]
-            self.business.update(feature_data)
-            
-            # Применяем множитель дохода если есть
-            if 'income_multiplier' in feature_data:
-                multiplier = feature_data['income_multiplier']
-                self.business['income_per_hour'] = int(self.business['base_income'] * multiplier)
-
-class BusinessSpecialization:
-    """Система специализации бизнесов"""
-    
-    SPECIALIZATIONS = {
-        'tech': {
-            'name': 'Технологическая специализация',
-            'icon': '💻',
-            'effects': {'research_bonus': 0.3, 'innovation_speed': 1.4}
-        },
-        'production': {
-            'name': 'Производственная специализация', 
-            'icon': '🏭',
-            'effects': {'production_bonus': 0.4, 'cost_reduction': 0.2}
-        },
-        'service': {
-            'name': 'Сервисная специализация',
-            'icon': '🛎️',
-            'effects': {'client_retention': 0.35, 'premium_pricing': 1.3}
-        },
-        'research': {
-            'name': 'Исследовательская специализация',
-            'icon': '🔬',
-            'effects': {'breakthrough_chance': 0.25, 'patent_income': 1.5}
-        }
-    }
-    
-    def __init__(self, business):
-        self.business = business
-        self.current_specialization = None
-        self.specialization_level = 0
-    
-    def set_specialization(self, specialization_type):
-        """Установка специализации"""
-        if specialization_type in self.SPECIALIZATIONS:
-            self.current_specialization = specialization_type
-            self.specialization_level = 1
-            self.apply_specialization_effects()
-            return True
-        return False
-    
-    def apply_specialization_effects(self):
-        """Применение эффектов специализации"""
-        if self.current_specialization:
-            effects = self.SPECIALIZATIONS[self.current_specialization]['effects']
-            self.business.update(effects)
-
-class BusinessResourceSystem:
-    """Система управления ресурсами бизнеса"""
-    
-    def __init__(self, business):
-        self.business = business
-        self.resources = {}
-        self.supply_chain = []
-        self.init_resources()
-    
-    def init_resources(self):
-        """Инициализация ресурсов в зависимости от типа бизнеса"""
-        business_type = self.business['type']
-        
-        resource_templates = {
-            'tech': {'servers': 0, 'bandwidth': 100, 'compute_power': 50},
-            'manufacturing': {'raw_materials': 100, 'energy': 80, 'logistics': 70},
-            'research': {'lab_equipment': 50, 'research_data': 30, 'talent': 80},
-            'service': {'client_base': 100, 'service_capacity': 70, 'reputation': 60}
-        }
-        
-        self.resources = resource_templates.get(business_type, {})
-    
-    def update_resources(self, delta_time):
-        """Обновление ресурсов со временем"""
-        for resource, value in self.resources.items():
-            # Логика потребления/восстановления ресурсов
-            if resource in ['energy', 'bandwidth']:
-                self.resources[resource] = max(0, value - delta_time * 0.1)
-            elif resource in ['client_base', 'reputation']:
-                self.resources[resource] = min(100, value + delta_time * 0.05)
-
 class AdvancedBusinessManager:
-    """Продвинутый менеджер бизнесов с комплексной экономикой"""
+    """Qt-обвязка общей экономики бизнесов: сообщения о событиях. Время экономики продвигают часы игры"""
     
     def __init__(self):
-        self.my_businesses = []
-        self.available_businesses = self.create_business_templates()
-        self.synergies = {}
-        self.global_events = []
-        self.market_conditions = {'demand': 1.0, 'competition': 1.0, 'regulation': 1.0}
-        
-        # Игровые ресурсы
-        self.player_balance = 1000000
-        self.crypto_balance = 50000
-        self.reputation = 100
-        self.risk_level = 0
-        self.innovation_points = 0
-        
-        # Таймеры
-        self.economy_timer = QTimer()
-        self.economy_timer.timeout.connect(self.update_economy)
-        self.economy_timer.start(5000)  # Обновление каждые 5 секунд
-        
-        self.init_synergies()
-        self.init_global_events()
-    
-    def create_business_templates(self):
-        """Создание шаблонов всех бизнесов с глубокими механиками"""
-        businesses = []
-        
-        # 1. БИОТЕХ ЛАБОРАТОРИЯ
-        businesses.append({
-            'id': 1, 'name': 'Биотех Лаборатория', 'icon': '🔬', 'type': 'research',
-            'base_income': 12000, 'base_risk': 30, 'base_workers': 15,
-            'price': 200000, 'base_upgrade_cost': 25000,
-            'category': 'light', 'can_go_dark': True,
-            'description': 'Передовые исследования в генной инженерии и биотехнологиях',
-            'primary_action': 'Запустить исследование',
-            'special_mechanics': {
-                'research_projects': [
-                    {'name': 'Генная терапия', 'cost': 80000, 'duration': 48, 'reward': 1.6},
-                    {'name': 'Синтетическая биология', 'cost': 120000, 'duration': 72, 'reward': 2.2},
-                    {'name': 'Нейроимпланты', 'cost': 200000, 'duration': 96, 'reward': 3.0}
-                ],
-                'clinical_trials': True,
-                'patent_system': True
-            },
-            'unique_features': ['gene_sequencing', 'crispr_tech', 'bio_printing'],
-            'upgrade_system': None,
-            'specialization': None,
-            'resource_system': None,
-            'current_research': None,
-            'research_progress': 0,
-            'patents': [],
-            'unlocked_features': []
-        })
-        
-        # 2. АВТОПРОМ (EV ФОКУС)
-        businesses.append({
-            'id': 2, 'name': 'Автопром', 'icon': '🚗', 'type': 'manufacturing',
-            'base_income': 15000, 'base_risk': 25, 'base_workers': 20,
-            'price': 250000, 'base_upgrade_cost': 30000,
-            'category': 'light', 'can_go_dark': False,
-            'description': 'Производство электромобилей и автономного транспорта',
-            'primary_action': 'Запустить производство', 
-            'special_mechanics': {
-                'production_lines': [
-                    {'type': 'ICE', 'efficiency': 1.0, 'cost': 50000},
-                    {'type': 'Hybrid', 'efficiency': 1.4, 'cost': 100000},
-                    {'type': 'EV', 'efficiency': 2.0, 'cost': 200000},
-                    {'type': 'Autonomous', 'efficiency': 3.0, 'cost': 500000}
-                ],
-                'battery_tech': True,
-                'charging_network': True
-            },
-            'unique_features': ['ev_platform', 'battery_production', 'autonomous_ai'],
-            'upgrade_system': None,
-            'specialization': None,
-            'resource_system': None,
-            'current_production': 'ICE',
-            'battery_level': 1,
-            'charging_stations': 0,
-            'unlocked_features': []
-        })
-        
-        # 3. AI РАЗРАБОТКИ
-        businesses.append({
-            'id': 3, 'name': 'AI разработки', 'icon': '🤖', 'type': 'tech',
-            'base_income': 18000, 'base_risk': 35, 'base_workers': 12,
-            'price': 300000, 'base_upgrade_cost': 35000,
-            'category': 'light', 'can_go_dark': True,
-            'description': 'Разработка искусственного интеллекта и машинного обучения',
-            'primary_action': 'Запустить обучение',
-            'special_mechanics': {
-                'ai_models': [
-                    {'name': 'Компьютерное зрение', 'cost': 60000, 'training_time': 36},
-                    {'name': 'Обработка языка', 'cost': 80000, 'training_time': 48},
-                    {'name': 'Преобразующее обучение', 'cost': 150000, 'training_time': 72}
-                ],
-                'data_centers': True,
-                'cloud_services': True
-            },
-            'unique_features': ['neural_networks', 'deep_learning', 'quantum_ai'],
-            'upgrade_system': None,
-            'specialization': None,
-            'resource_system': None,
-            'current_training': None,
-            'training_progress': 0,
-            'servers': 0,
-            'data_centers': 0,
-            'unlocked_features': []
-        })
-        
-        # 4. КОСМИЧЕСКИЙ ТУРИЗМ
-        businesses.append({
-            'id': 4, 'name': 'Космический туризм', 'icon': '🚀', 'type': 'service',
-            'base_income': 25000, 'base_risk': 40, 'base_workers': 8,
-            'price': 500000, 'base_upgrade_cost': 50000,
-            'category': 'light', 'can_go_dark': False,
-            'description': 'Орбитальные полеты и космические отели',
-            'primary_action': 'Запустить полет',
-            'special_mechanics': {
-                'spacecrafts': [
-                    {'type': 'Суборбитальный', 'capacity': 6, 'cost': 300000},
-                    {'type': 'Орбитальный', 'capacity': 4, 'cost': 800000},
-                    {'type': 'Лунный', 'capacity': 2, 'cost': 2000000}
-                ],
-                'space_stations': True,
-                'zeroG_experiences': True
-            },
-            'unique_features': ['reusable_rockets', 'space_hotels', 'mars_missions'],
-            'upgrade_system': None,
-            'specialization': None,
-            'resource_system': None,
-            'current_craft': None,
-            'flights_completed': 0,
-            'space_stations': 0,
-            'unlocked_features': []
-        })
-        
-        # 5. ВИРТУАЛЬНАЯ РЕАЛЬНОСТЬ
-        businesses.append({
-            'id': 5, 'name': 'Виртуальная реальность', 'icon': '🥽', 'type': 'tech',
-            'base_income': 14000, 'base_risk': 20, 'base_workers': 10,
-            'price': 180000, 'base_upgrade_cost': 22000,
-            'category': 'light', 'can_go_dark': True,
-            'description': 'Иммерсивные VR/AR решения и метавселенные',
-            'primary_action': 'Запустить платформу',
-            'special_mechanics': {
-                'vr_platforms': [
-                    {'name': 'Социальная VR', 'cost': 40000, 'users': 10000},
-                    {'name': 'Образовательная VR', 'cost': 60000, 'users': 5000},
-                    {'name': 'Корпоративная VR', 'cost': 80000, 'users': 2000}
-                ],
-                'metaverse': True,
-                'haptic_tech': True
-            },
-            'unique_features': ['full_immersion', 'brain_computer', 'digital_twins'],
-            'upgrade_system': None,
-            'specialization': None,
-            'resource_system': None,
-            'active_platforms': [],
-            'user_base': 0,
-            'metaverse_development': 0,
-            'unlocked_features': []
-        })
-        
-        # 6. КРИПТО-МАЙНИНГ
-        businesses.append({
-            'id': 6, 'name': 'Крипто-майнинг', 'icon': '⛏️', 'type': 'tech',
-            'base_income': 16000, 'base_risk': 45, 'base_workers': 5,
-            'price': 150000, 'base_upgrade_cost': 20000,
-            'category': 'dark', 'can_go_dark': False,
-            'description': 'Добыча криптовалюты с передовыми фермами',
-            'primary_action': 'Запустить майнинг',
-            'special_mechanics': {
-                'mining_rigs': [
-                    {'type': 'GPU Ферма', 'hashrate': 500, 'cost': 50000},
-                    {'type': 'ASIC Майнер', 'hashrate': 2000, 'cost': 100000},
-                    {'type': 'Квантовый Майнер', 'hashrate': 10000, 'cost': 500000}
-                ],
-                'heat_recovery': True,
-                'green_mining': True
-            },
-            'unique_features': ['quantum_mining', 'decentralized_finance', 'smart_contracts'],
-            'upgrade_system': None,
-            'specialization': None,
-            'resource_system': None,
-            'mining_rigs': [],
-            'total_hashrate': 0,
-            'energy_efficiency': 1.0,
-            'unlocked_features': []
-        })
-        
-        # 7. КИБЕРБЕЗОПАСНОСТЬ
-        businesses.append({
-            'id': 7, 'name': 'Кибербезопасность', 'icon': '🛡️', 'type': 'tech',
-            'base_income': 17000, 'base_risk': 15, 'base_workers': 15,
-            'price': 220000, 'base_upgrade_cost': 28000,
-            'category': 'light', 'can_go_dark': True,
-            'description': 'Защита от кибератак и консалтинг по безопасности',
-            'primary_action': 'Запустить защиту', 
-            'special_mechanics': {
-                'security_services': [
-                    {'name': 'Pentesting', 'cost': 30000, 'clients': 10},
-                    {'name': 'SOC Мониторинг', 'cost': 50000, 'clients': 5},
-                    {'name': 'Криптография', 'cost': 80000, 'clients': 3}
-                ],
-                'threat_intelligence': True,
-                'zero_trust': True
-            },
-            'unique_features': ['quantum_encryption', 'ai_threat_detection', 'blockchain_security'],
-            'upgrade_system': None,
-            'specialization': None,
-            'resource_system': None,
-            'security_contracts': [],
-            'threat_level': 0,
-            'client_trust': 100,
-            'unlocked_features': []
-        })
-        
-        # Инициализация систем для каждого бизнеса
-        for business in businesses:
-            business['upgrade_system'] = BusinessUpgradeSystem(business)
-            business['specialization'] = BusinessSpecialization(business)
-            business['resource_system'] = BusinessResourceSystem(business)
-            business['income_per_hour'] = business['base_income']
-            business['risk'] = business['base_risk']
-            business['workers'] = business['base_workers']
-            business['level'] = 1
-            business['experience'] = 0
-            
-        return businesses
-    
-    def init_synergies(self):
-        """Инициализация синергий между бизнесами"""
-        self.synergies = {
-            ('Биотех Лаборатория', 'AI разработки'): {
-                'name': 'Био-ИИ Синергия',
-                'description': 'AI ускоряет генетические исследования',
-                'bonus': 1.4,
-                'requirements': {'biotech_level': 3, 'ai_level': 3},
-                'effects': {'research_speed': 1.5, 'breakthrough_chance': 0.3}
-            },
-            ('Автопром', 'Крипто-майнинг'): {
-                'name': 'Зеленая энергия',
-                'description': 'Тепло от майнинга питает EV заводы',
-                'bonus': 1.3,
-                'requirements': {'auto_level': 2, 'mining_level': 4},
-                'effects': {'energy_costs': 0.7, 'production_speed': 1.25}
-            },
-            ('Космический туризм', 'Виртуальная реальность'): {
-                'name': 'Космическая VR',
-                'description': 'VR симуляции космических полетов',
-                'bonus': 1.6,
-                'requirements': {'space_level': 3, 'vr_level': 4},
-                'effects': {'customer_demand': 1.8, 'premium_pricing': 1.4}
-            },
-            ('Кибербезопасность', 'Крипто-майнинг'): {
-                'name': 'Безопасный майнинг',
-                'description': 'Повышенная защита крипто-операций',
-                'bonus': 1.35,
-                'requirements': {'security_level': 4, 'mining_level': 3},
-                'effects': {'security_bonus': 0.5, 'risk_reduction': 0.4}
-            }
-        }
-    
-    def init_global_events(self):
-        """Инициализация глобальных событий"""
-        self.global_events = [
-            {
-                'name': 'Технологический прорыв',
-                'description': 'Новые открытия ускоряют развитие',
-                'duration': 24,
-                'effects': {'research_speed': 1.3, 'innovation_chance': 0.2},
-                'active': False
-            },
-            {
-                'name': 'Экономический кризис',
-                'description': 'Рынки нестабильны, риски повышены',
-                'duration': 48,
-                'effects': {'demand': 0.7, 'risk': 1.4},
-                'active': False
-            },
-            {
-                'name': 'Регуляторные изменения',
-                'description': 'Новые законы влияют на бизнес',
-                'duration': 36,
-                'effects': {'compliance_costs': 1.3, 'innovation_speed': 0.8},
-                'active': False
-            }
-        ]
+        self.economy = business_economy()
+        self.pending_messages = []  # (заголовок, текст) сообщений, ждущих показа
+        self.economy.subscribe(self.on_economy_event)
     
-    def start_research(self, business_id, research_project):
-        """Запуск исследовательского проекта"""
-        business = self.get_business_by_id(business_id)
-        if not business or business['type'] != 'research':
-            return False, "Бизнес не поддерживает исследования"
-        
-        project_data = next((p for p in business['special_mechanics']['research_projects'] 
-                           if p['name'] == research_project), None)
-        
-        if not project_data:
-            return False, "Проект не найден"
-        
-        if self.player_balance < project_data['cost']:
-            return False, f"Недостаточно средств. Нужно ${project_data['cost']:,}"
-        
-        business['current_research'] = research_project
-        business['research_progress'] = 0
-        business['research_cost'] = project_data['cost']
-        business['research_duration'] = project_data['duration']
-        business['research_reward'] = project_data['reward']
-        business['research_start_time'] = time.time()
-        
-        self.player_balance -= project_data['cost']
-        return True, f"Исследование '{research_project}' начато"
-    
-    def start_ai_training(self, business_id, model_name):
-        """Запуск обучения AI модели"""
-        business = self.get_business_by_id(business_id)
-        if not business or business['name'] != 'AI разработки':
-            return False, "Только AI бизнес может обучать модели"
-        
-        model_data = next((m for m in business['special_mechanics']['ai_models'] 
-                         if m['name'] == model_name), None)
-        
-        if not model_data:
-            return False, "Модель не найдена"
-        
-        if self.player_balance < model_data['cost']:
-            return False, f"Недостаточно средств. Нужно ${model_data['cost']:,}"
-        
-        business['current_training'] = model_name
-        business['training_progress'] = 0
-        business['training_cost'] = model_data['cost']
-        business['training_duration'] = model_data['training_time']
-        business['training_start_time'] = time.time()
-        
-        self.player_balance -= model_data['cost']
-        return True, f"Обучение модели '{model_name}' начато"
-    
-    def upgrade_production_line(self, business_id, line_type):
-        """Обновление производственной линии"""
-        business = self.get_business_by_id(business_id)
-        if not business or business['name'] != 'Автопром':
-            return False, "Только автопром может обновлять линии"
-        
-        line_data = next((l for l in business['special_mechanics']['production_lines'] 
-                        if l['type'] == line_type), None)
-        
-        if not line_data:
-            return False, "Тип линии не найден"
-        
-        if self.player_balance < line_data['cost']:
-            return False, f"Недостаточно средств. Нужно ${line_data['cost']:,}"
-        
-        business['current_production'] = line_type
-        business['production_efficiency'] = line_data['efficiency']
-        business['income_per_hour'] = int(business['base_income'] * line_data['efficiency'])
-        
-        self.player_balance -= line_data['cost']
-        return True, f"Производственная линия обновлена до {line_type}"
-    
-    def buy_mining_rig(self, business_id, rig_type):
-        """Покупка майнинг-рига"""
-        business = self.get_business_by_id(business_id)
-        if not business or business['name'] != 'Крипто-майнинг':
-            return False, "Только майнинг бизнес может покупать риги"
-        
-        rig_data = next((r for r in business['special_mechanics']['mining_rigs'] 
-                       if r['type'] == rig_type), None)
-        
-        if not rig_data:
-            return False, "Тип рига не найден"
-        
-        if self.player_balance < rig_data['cost']:
-            return False, f"Недостаточно средств. Нужно ${rig_data['cost']:,}"
-        
-        if 'mining_rigs' not in business:
-            business['mining_rigs'] = []
-        
-        business['mining_rigs'].append(rig_data)
-        business['total_hashrate'] += rig_data['hashrate']
-        business['income_per_hour'] = int(business['base_income'] * (1 + business['total_hashrate'] / 1000))
-        
-        self.player_balance -= rig_data['cost']
-        return True, f"Майнинг-риг {rig_type} приобретен"
+    @property
+    def my_businesses(self):
+        return self.economy.my_businesses
     
-    def update_economy(self):
-        """Обновление экономической системы"""
-        current_time = time.time()
-        
-        # Обновление прогресса исследований и тренировок
-        for business in self.my_businesses:
-            self.update_business_progress(business, current_time)
-            
-            # Обновление ресурсов
-            if business['resource_system']:
-                business['resource_system'].update_resources(5)  # 5 секунд прошло
-        
-        # Обновление глобальных событий
-        self.update_global_events()
-        
-        # Расчет пассивного дохода
-        self.calculate_passive_income()
-        
-        # Применение синергий
-        self.apply_synergies()
-    
-    def update_business_progress(self, business, current_time):
-        """Обновление прогресса бизнеса"""
-        # Исследования
-        if business.get('current_research') and business.get('research_start_time'):
-            elapsed_hours = (current_time - business['research_start_time']) / 3600
-            progress = min(100, (elapsed_hours / business['research_duration']) * 100)
-            business['research_progress'] = progress
-            
-            if progress >= 100:
-                self.complete_research(business)
-        
-        # AI тренировка
-        if business.get('current_training') and business.get('training_start_time'):
-            elapsed_hours = (current_time - business['training_start_time']) / 3600
-            progress = min(100, (elapsed_hours / business['training_duration']) * 100)
-            business['training_progress'] = progress
-            
-            if progress >= 100:
-                self.complete_training(business)
-    
-    def complete_research(self, business):
-        """Завершение исследования"""
-        reward_multiplier = business['research_reward']
-        business['income_per_hour'] = int(business['income_per_hour'] * reward_multiplier)
-        
-        # Начисление инновационных очков
-        self.innovation_points += 50
-        
-        QMessageBox.information(None, "Исследование завершено", 
-                              f"Исследование '{business['current_research']}' завершено!\n"
-                              f"Доход увеличен в {reward_multiplier}x раза")
-        
-        business['current_research'] = None
-        business['research_progress'] = 0
-    
-    def complete_training(self, business):
-        """Завершение обучения AI модели"""
-        model_name = business['current_training']
-        
-        # Увеличение дохода в зависимости от модели
-        income_boost = 1.0
-        if model_name == 'Компьютерное зрение':
-            income_boost = 1.4
-        elif model_name == 'Обработка языка':
-            income_boost = 1.6
-        elif model_name == 'Преобразующее обучение':
-            income_boost = 2.0
-        
-        business['income_per_hour'] = int(business['income_per_hour'] * income_boost)
-        self.innovation_points += 30
-        
-        QMessageBox.information(None, "Обучение завершено",
-                              f"Модель '{model_name}' обучена!\n"
-                              f"Доход увеличен в {income_boost}x раза")
-        
-        business['current_training'] = None
-        business['training_progress'] = 0
-    
-    def calculate_passive_income(self):
-        """Расчет пассивного дохода"""
-        total_income = sum(business['income_per_hour'] for business in self.my_businesses)
-        income_per_second = total_income / 3600
-        self.player_balance += income_per_second * 5  # За 5 секунд
-    
-    def apply_synergies(self):
-        """Применение синергий между бизнесами"""
-        for (biz1_name, biz2_name), synergy in self.synergies.items():
-            biz1 = self.get_business_by_name(biz1_name)
-            biz2 = self.get_business_by_name(biz2_name)
-            
-            if biz1 and biz2:
-                req = synergy['requirements']
-                if (biz1['level'] >= req.get(f'{biz1_name.lower().split()[0]}_level', 1) and 
-                    biz2['level'] >= req.get(f'{biz2_name.lower().split()[0]}_level', 1)):
-                    
-                    # Применяем эффекты синергии
-                    for effect, value in synergy['effects'].items():
-                        if effect in biz1:
-                            biz1[effect] *= value
-                        if effect in biz2:
-                            biz2[effect] *= value
-    
-    def update_global_events(self):
-        """Обновление глобальных событий"""
-        # Упрощенная логика для демонстрации
-        if random.random() < 0.01:  # 1% шанс каждые 5 секунд
-            event = random.choice(self.global_events)
-            event['active'] = True
-            event['start_time'] = time.time()
-            
-            QMessageBox.information(None, "Глобальное событие", 
-                                  f"{event['name']}\n\n{event['description']}")
+    @property
+    def available_businesses(self):
+        return self.economy.available_businesses
     
-    def get_business_by_id(self, business_id):
-        """Поиск бизнеса по ID"""
-        return next((b for b in self.my_businesses if b['id'] == business_id), None)
+    @property
+    def player_balance(self):
+        return self.economy.player_balance
     
-    def get_business_by_name(self, business_name):
-        """Поиск бизнеса по имени"""
-        return next((b for b in self.my_businesses if b['name'] == business_name), None)
+    def spend(self, amount):
+        """Оплата из кошелька; False, если денег не хватает"""
+        return self.economy.wallet.debit(amount)
+    
+    @property
+    def innovation_points(self):
+        return self.economy.innovation_points
+    
+    @property
+    def reputation(self):
+        return self.economy.reputation
+    
+    @property
+    def risk_level(self):
+        return self.economy.risk_level
     
     def buy_business(self, business_template):
-        """Покупка бизнеса"""
-        if self.player_balance >= business_template['price']:
-            new_business = business_template.copy()
-            new_business['is_owned'] = True
-            new_business['level'] = 1
-            new_business['experience'] = 0
-            
-            # Инициализация систем
-            new_business['upgrade_system'] = BusinessUpgradeSystem(new_business)
-            new_business['specialization'] = BusinessSpecialization(new_business)
-            new_business['resource_system'] = BusinessResourceSystem(new_business)
-            
-            self.my_businesses.append(new_business)
-            self.player_balance -= business_template['price']
-            return True, f"Бизнес '{business_template['name']}' успешно приобретен!"
-        else:
-            return False, f"Недостаточно средств. Нужно ${business_template['price']:,}"
+        return self.economy.buy_business(business_template)
+    
+    def activate_boost(self, name, duration):
+        return self.economy.activate_boost(name, duration)
+    
+    def boost_remaining(self, name):
+        return self.economy.boost_remaining(name)
+    
+    def on_economy_event(self, event):
+        """О завершениях и глобальных событиях сообщается игроку (доход экономика уже зачислила в журнал кошелька).
+        
+        Событие приходит изнутри продвижения экономики, поэтому диалог показывается после его
+        окончания: вложенный цикл событий модального окна не должен запускать тик часов посреди шага.
+        """
+        message = describe_economy_event(event)
+        if message is None:
+            return
+        if not self.pending_messages:
+            QTimer.singleShot(0, self.show_pending_messages)
+        self.pending_messages.append(message)
+    
+    def show_pending_messages(self):
+        # Сообщение снимается с очереди после закрытия окна: пришедшие пока оно открыто
+        # события дописываются в очередь и показываются этим же циклом
+        while self.pending_messages:
+            title, text = self.pending_messages[0]
+            QMessageBox.information(None, title, text)
+            self.pending_messages.pop(0)
+
+def describe_economy_event(event):
+    """Заголовок и текст сообщения игроку о событии экономики; None - сообщать не о чем"""
+    data = event.data
+    if event.kind == 'research_completed':
+        return ("Исследование завершено",
+                f"Исследование '{data['project']}' завершено!\n"
+                f"Доход увеличен в {data['multiplier']}x раза")
+    if event.kind == 'training_completed':
+        return ("Обучение завершено",
+                f"Модель '{data['model']}' обучена!\n"
+                f"Доход увеличен в {data['multiplier']}x раза")
+    if event.kind == 'global_event_started':
+        return "Глобальное событие", f"{data['event']['name']}\n\n{data['event']['description']}"
+    return None
 
 @dataclass
 class Business:
@@ -3323,6 +3297,8 @@ class RevolutionaryBusinessMenu(QWidget):
     exitToClicker = pyqtSignal()
     exitToMenu = pyqtSignal()
     
+    GLOBAL_BOOST_DURATION = 3600  # Длительность глобального ускорения, секунды
+    
     def __init__(self):
         super().__init__()
         self.business_manager = AdvancedBusinessManager()
@@ -3336,6 +3312,7 @@ class RevolutionaryBusinessMenu(QWidget):
         
         # Создаем бизнесы с правильным позиционированием
         self.business_templates = self.create_business_templates_with_layout()
+        self.templates_by_id = {business.id: business for business in self.business_templates}
         
         self.init_ui()
         self.setup_business_timers()
@@ -3502,7 +3479,7 @@ class RevolutionaryBusinessMenu(QWidget):
         stats_layout = QHBoxLayout()
         
         stats = [
-            (f"💰 ${self.business_manager.player_balance:,}", "Баланс"),
+            (f"💰 ${self.business_manager.player_balance:,.0f}", "Баланс"),
             (f"📈 {len(self.business_manager.my_businesses)}", "Бизнесов"),
             (f"⚡ {self.business_manager.innovation_points}", "Инновации"),
             (f"🛡️ {self.business_manager.reputation}", "Репутация"),
@@ -3681,36 +3658,30 @@ class RevolutionaryBusinessMenu(QWidget):
         layout.addWidget(empire_stats)
         
         # Контейнер для карточек бизнесов
-        self.my_businesses_scroll = QScrollArea()
-        self.my_businesses_scroll.setWidgetResizable(True)
-        self.my_businesses_scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: rgba(255,255,255,0.1);
-                width: 12px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(120, 20, 220, 0.6);
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(160, 60, 255, 0.8);
-            }
+        # Сообщение, если нет бизнесов
+        self.my_businesses_empty = QLabel("🏪 У вас пока нет бизнесов\n\nПосетите вкладку 'Каталог' для покупки!")
+        self.my_businesses_empty.setStyleSheet(f"""
+            color: {TEXT_SECONDARY.name()}; 
+            font-size: 18px; 
+            text-align: center;
+            padding: 60px;
+            background-color: {PANEL_BG.name()};
+            border-radius: 15px;
+            border: 2px dashed {PURPLE_PRIMARY.name()};
         """)
-        
-        self.my_businesses_container = QWidget()
-        self.my_businesses_layout = QGridLayout(self.my_businesses_container)
-        self.my_businesses_layout.setSpacing(20)
-        self.my_businesses_layout.setContentsMargins(20, 20, 20, 20)
-        self.my_businesses_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        self.my_businesses_scroll.setWidget(self.my_businesses_container)
-        layout.addWidget(self.my_businesses_scroll, 1)
+        self.my_businesses_empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.my_businesses_empty.setMinimumHeight(300)
+        self.my_businesses_empty.hide()
+        layout.addWidget(self.my_businesses_empty)
+        
+        # Карточки рисуются делегатом только для видимых рядов
+        self.my_businesses_model = CardListModel(
+            lambda business: self.describe_business(business, is_owned=True),
+            key=lambda business: business.id, columns=2)
+        delegate = CardDelegate()
+        delegate.actionTriggered.connect(self.show_business_details_tab)
+        self.my_businesses_view = CardGridView(self.my_businesses_model, delegate)
+        layout.addWidget(self.my_businesses_view, 1)
         
         # Загружаем бизнесы
         self.load_my_businesses()
@@ -3734,8 +3705,8 @@ class RevolutionaryBusinessMenu(QWidget):
         
         total_income = sum(b['income_per_hour'] for b in self.business_manager.my_businesses)
         total_workers = sum(b['workers'] for b in self.business_manager.my_businesses)
-        light_businesses = len([b for b in self.business_manager.my_businesses if b.get('category') == 'light'])
-        dark_businesses = len([b for b in self.business_manager.my_businesses if b.get('category') == 'dark'])
+        light_businesses = self.business_manager.my_businesses.count('light')
+        dark_businesses = self.business_manager.my_businesses.count('dark')
         
         stats = [
             (f"💰 ${total_income:,}/час", "Общий доход"),
@@ -3790,37 +3761,30 @@ class RevolutionaryBusinessMenu(QWidget):
         stats_widget = self.create_catalog_stats()
         layout.addWidget(stats_widget)
         
-        # Контейнер для карточек бизнесов
-        self.catalog_scroll = QScrollArea()
-        self.catalog_scroll.setWidgetResizable(True)
-        self.catalog_scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: rgba(255,255,255,0.1);
-                width: 12px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(120, 20, 220, 0.6);
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(160, 60, 255, 0.8);
-            }
+        # Сообщение, если все бизнесы куплены
+        self.catalog_empty = QLabel("🎊 Все доступные бизнесы приобретены!\n\nРазвивайте текущие для увеличения дохода.")
+        self.catalog_empty.setStyleSheet(f"""
+            color: {TEXT_SECONDARY.name()}; 
+            font-size: 18px; 
+            text-align: center;
+            padding: 60px;
+            background-color: {PANEL_BG.name()};
+            border-radius: 15px;
+            border: 2px dashed {ACCENT2.name()};
         """)
-        
-        self.catalog_container = QWidget()
-        self.catalog_layout = QGridLayout(self.catalog_container)
-        self.catalog_layout.setSpacing(20)
-        self.catalog_layout.setContentsMargins(20, 20, 20, 20)
-        self.catalog_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        self.catalog_scroll.setWidget(self.catalog_container)
-        layout.addWidget(self.catalog_scroll, 1)
+        self.catalog_empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.catalog_empty.setMinimumHeight(300)
+        self.catalog_empty.hide()
+        layout.addWidget(self.catalog_empty)
+        
+        # Карточки бизнесов
+        self.catalog_model = CardListModel(
+            lambda business: self.describe_business(business, is_owned=False),
+            key=lambda business: business.id, columns=2, enabled=self.can_afford)
+        delegate = CardDelegate()
+        delegate.actionTriggered.connect(self.show_business_details)
+        self.catalog_view = CardGridView(self.catalog_model, delegate)
+        layout.addWidget(self.catalog_view, 1)
         
         # Загружаем каталог
         self.load_catalog()
@@ -3903,8 +3867,8 @@ class RevolutionaryBusinessMenu(QWidget):
         layout = QHBoxLayout(widget)
         
         # Статистика
-        available_count = len([b for b in self.business_templates 
-                             if not any(owned['id'] == b.id for owned in self.business_manager.my_businesses)])
+        owned_ids = self.business_manager.my_businesses.owned_ids
+        available_count = sum(1 for b in self.business_templates if b.id not in owned_ids)
         owned_count = len(self.business_manager.my_businesses)
         total_income = sum(b['income_per_hour'] for b in self.business_manager.my_businesses)
         
@@ -3974,254 +3938,57 @@ class RevolutionaryBusinessMenu(QWidget):
         layout.addStretch()
         return widget
 
-    def create_business_card(self, business, is_owned=False, container_width=0, container_height=0):
-        """Создает карточку бизнеса с правильными размерами и позиционированием"""
-        card = QFrame()
-        
-        # Рассчитываем реальные размеры на основе процентов
-        if container_width > 0 and container_height > 0:
-            width = int(container_width * business.width_percent / 100)
-            height = int(container_height * business.height_percent / 100)
-        else:
-            # Значения по умолчанию
-            width = 400
-            height = 250
-        
-        card.setFixedSize(width, height)
-        
-        # Стиль в зависимости от типа бизнеса
-        border_color = PURPLE_PRIMARY.name() if business.category == 'light' else "#dc2626"
-        background_color = CARD_BG.name() if not is_owned else PANEL_BG.name()
-        
-        card.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {background_color}, stop:1 {DEEP_PURPLE.name()});
-                border: 3px solid {border_color};
-                border-radius: 15px;
-                padding: 15px;
-            }}
-            QFrame:hover {{
-                border: 3px solid {PURPLE_ACCENT.name()};
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {PURPLE_PRIMARY.name()}, stop:1 {DEEP_PURPLE.name()});
-            }}
-        """)
-        card.setCursor(Qt.CursorShape.PointingHandCursor)
-        
-        layout = QVBoxLayout(card)
-        layout.setSpacing(8)
-        layout.setContentsMargins(12, 12, 12, 12)
-        
-        # Заголовок с иконкой и названием
-        header_layout = QHBoxLayout()
-        
-        icon_label = QLabel(business.icon)
-        icon_label.setStyleSheet("font-size: 20px;")
-        
-        name_label = QLabel(business.name)
-        name_label.setStyleSheet(f"""
-            color: {TEXT_PRIMARY.name()}; 
-            font-size: 16px; 
-            font-weight: bold;
-        """)
-        name_label.setWordWrap(True)
-        
-        header_layout.addWidget(icon_label)
-        header_layout.addWidget(name_label)
-        header_layout.addStretch()
-        
-        # Уровень для owned бизнесов
-        if is_owned:
-            level_label = QLabel(f"🎯 Ур.1")
-            level_label.setStyleSheet(f"color: {ACCENT2.name()}; font-size: 12px; font-weight: bold;")
-            header_layout.addWidget(level_label)
-        
-        layout.addLayout(header_layout)
-        
-        # Описание
-        desc_label = QLabel(business.description)
-        desc_label.setStyleSheet(f"color: {TEXT_SECONDARY.name()}; font-size: 11px;")
-        desc_label.setWordWrap(True)
-        desc_label.setMaximumHeight(40)
-        layout.addWidget(desc_label)
-        
-        # Основная информация
-        info_layout = QGridLayout()
-        info_layout.setHorizontalSpacing(10)
-        info_layout.setVerticalSpacing(5)
-        
-        stats = [
+    def describe_business(self, business, is_owned=False):
+        """Содержимое карточки бизнеса для CardDelegate"""
+        stats = (
             ("💰 Доход/час:", f"${business.base_income:,}"),
             ("👥 Работники:", str(business.base_workers)),
             ("🎯 Тип:", business.type),
-            ("🏷️ Категория:", "💡 Светлый" if business.category == 'light' else "🌑 Темный")
-        ]
-        
-        for i, (name, value) in enumerate(stats):
-            name_label = QLabel(name)
-            name_label.setStyleSheet(f"color: {TEXT_SECONDARY.name()}; font-size: 10px;")
-            
-            value_label = QLabel(value)
-            value_label.setStyleSheet(f"color: {TEXT_PRIMARY.name()}; font-size: 10px; font-weight: bold;")
-            
-            info_layout.addWidget(name_label, i // 2, (i % 2) * 2)
-            info_layout.addWidget(value_label, i // 2, (i % 2) * 2 + 1)
-        
-        layout.addLayout(info_layout)
-        
-        # Риск для темных бизнесов
-        if business.category == 'dark':
-            risk_frame = QFrame()
-            risk_frame.setStyleSheet(f"""
-                QFrame {{
-                    background-color: rgba(239, 68, 68, 0.2);
-                    border: 1px solid #ef4444;
-                    border-radius: 6px;
-                    padding: 5px;
-                }}
-            """)
-            risk_layout = QHBoxLayout(risk_frame)
-            risk_label = QLabel(f"⚠️ Уровень риска: {business.base_risk}%")
-            risk_label.setStyleSheet("color: #ef4444; font-size: 10px; font-weight: bold;")
-            risk_layout.addWidget(risk_label)
-            layout.addWidget(risk_frame)
-        
-        layout.addStretch()
-        
-        # Кнопка действия
-        if is_owned:
-            action_btn = AnimatedButton("⚡ Управлять")
-            action_btn.setFixedHeight(30)
-            action_btn.clicked.connect(lambda: self.show_business_details_tab(business))
-        else:
-            action_btn = AnimatedButton(f"💰 ${business.price:,}")
-            action_btn.setFixedHeight(30)
-            action_btn.clicked.connect(lambda: self.show_business_details(business))
-            
+            ("🏷️ Категория:", "💡 Светлый" if business.category == 'light' else "🌑 Темный"),
+        )
+        dark = business.category == 'dark'
+        return CardContent(
+            title=f"{business.icon} {business.name}",
+            subtitle=business.description,
+            stats=stats,
+            # Уровень для owned бизнесов
+            badge="🎯 Ур.1" if is_owned else "",
+            # Риск для темных бизнесов
+            warning=f"⚠️ Уровень риска: {business.base_risk}%" if dark else "",
+            action="⚡ Управлять" if is_owned else f"💰 ${business.price:,}",
             # Проверяем, хватает ли денег
-            if self.business_manager.player_balance < business.price:
-                action_btn.setEnabled(False)
-                action_btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {TEXT_TERTIARY.name()};
-                        color: {TEXT_SECONDARY.name()};
-                        border: 2px solid {TEXT_TERTIARY.name()};
-                        border-radius: 8px;
-                        font-size: 11px;
-                        font-weight: bold;
-                    }}
-                """)
-        
-        layout.addWidget(action_btn)
-        
-        return card
+            enabled=is_owned or self.can_afford(business),
+            owned=is_owned,
+            dark=dark,
+        )
+
+    def can_afford(self, business):
+        """Хватает ли денег на покупку бизнеса"""
+        return self.business_manager.player_balance >= business.price
 
     def load_my_businesses(self):
-        """Загрузка собственных бизнесов с правильным позиционированием"""
-        if hasattr(self, 'my_businesses_layout'):
-            self.clear_layout(self.my_businesses_layout)
-            
-            if not self.business_manager.my_businesses:
-                # Сообщение, если нет бизнесов
-                empty_label = QLabel("🏪 У вас пока нет бизнесов\n\nПосетите вкладку 'Каталог' для покупки!")
-                empty_label.setStyleSheet(f"""
-                    color: {TEXT_SECONDARY.name()}; 
-                    font-size: 18px; 
-                    text-align: center;
-                    padding: 60px;
-                    background-color: {PANEL_BG.name()};
-                    border-radius: 15px;
-                    border: 2px dashed {PURPLE_PRIMARY.name()};
-                """)
-                empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                empty_label.setMinimumHeight(300)
-                self.my_businesses_layout.addWidget(empty_label, 0, 0, 1, 2)
-                return
-            
-            # Получаем размеры контейнера
-            container_size = self.my_businesses_container.size()
-            container_width = container_size.width()
-            container_height = container_size.height()
-            
-            # Создаем карточки для каждого бизнеса
-            for i, business_data in enumerate(self.business_manager.my_businesses):
-                # Находим шаблон бизнеса
-                business_template = next((b for b in self.business_templates if b.id == business_data['id']), None)
-                if business_template:
-                    card = self.create_business_card(
-                        business_template, 
-                        is_owned=True,
-                        container_width=container_width,
-                        container_height=container_height
-                    )
-                    
-                    # Позиционируем в сетке 2x3
-                    row = i // 2
-                    col = i % 2
-                    self.my_businesses_layout.addWidget(card, row, col)
-            
-            # Добавляем растягивающиеся элементы для правильного расположения
-            rows_needed = (len(self.business_manager.my_businesses) + 1) // 2
-            for row in range(rows_needed):
-                self.my_businesses_layout.setRowStretch(row, 1)
-            self.my_businesses_layout.setColumnStretch(0, 1)
-            self.my_businesses_layout.setColumnStretch(1, 1)
+        """Синхронизация карточек собственных бизнесов"""
+        if hasattr(self, 'my_businesses_model'):
+            templates = self.templates_by_id
+            owned = [templates[business_data['id']] for business_data in self.business_manager.my_businesses
+                     if business_data['id'] in templates]
+            self.my_businesses_model.set_items(owned)
+            self.my_businesses_empty.setVisible(not owned)
+            self.my_businesses_view.setVisible(bool(owned))
 
     def load_catalog(self):
-        """Загрузка каталога бизнесов с правильным позиционированием"""
-        if hasattr(self, 'catalog_layout'):
-            self.clear_layout(self.catalog_layout)
-            
+        """Синхронизация карточек каталога с фильтром и купленными бизнесами"""
+        if hasattr(self, 'catalog_model'):
             # Фильтруем доступные бизнесы (еще не купленные)
-            available_businesses = []
-            for business in self.business_templates:
-                if not any(owned['id'] == business.id for owned in self.business_manager.my_businesses):
-                    if self.current_filter == "all" or business.category == self.current_filter:
-                        available_businesses.append(business)
-            
-            if not available_businesses:
-                # Сообщение, если все бизнесы куплены
-                empty_label = QLabel("🎊 Все доступные бизнесы приобретены!\n\nРазвивайте текущие для увеличения дохода.")
-                empty_label.setStyleSheet(f"""
-                    color: {TEXT_SECONDARY.name()}; 
-                    font-size: 18px; 
-                    text-align: center;
-                    padding: 60px;
-                    background-color: {PANEL_BG.name()};
-                    border-radius: 15px;
-                    border: 2px dashed {ACCENT2.name()};
-                """)
-                empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                empty_label.setMinimumHeight(300)
-                self.catalog_layout.addWidget(empty_label, 0, 0, 1, 2)
-                return
-            
-            # Получаем размеры контейнера
-            container_size = self.catalog_container.size()
-            container_width = container_size.width()
-            container_height = container_size.height()
-            
-            # Создаем карточки для каждого доступного бизнеса
-            for i, business in enumerate(available_businesses):
-                card = self.create_business_card(
-                    business,
-                    is_owned=False,
-                    container_width=container_width,
-                    container_height=container_height
-                )
-                
-                # Позиционируем в сетке 2x3
-                row = i // 2
-                col = i % 2
-                self.catalog_layout.addWidget(card, row, col)
-            
-            # Добавляем растягивающиеся элементы
-            rows_needed = (len(available_businesses) + 1) // 2
-            for row in range(rows_needed):
-                self.catalog_layout.setRowStretch(row, 1)
-            self.catalog_layout.setColumnStretch(0, 1)
-            self.catalog_layout.setColumnStretch(1, 1)
+            owned_ids = self.business_manager.my_businesses.owned_ids
+            available_businesses = [
+                business for business in self.business_templates
+                if business.id not in owned_ids
+                and (self.current_filter == "all" or business.category == self.current_filter)
+            ]
+            self.catalog_model.set_items(available_businesses)
+            self.catalog_empty.setVisible(not available_businesses)
+            self.catalog_view.setVisible(bool(available_businesses))
 
     def show_business_details_tab(self, business_data):
         """Показывает детали бизнеса во вкладке вместо диалога"""
@@ -4568,7 +4335,7 @@ class RevolutionaryBusinessMenu(QWidget):
     def update_balance_display(self):
         """Обновление отображения баланса"""
         if hasattr(self, 'balance_label'):
-            self.balance_label.setText(f"💰 ${self.business_manager.player_balance:,}")
+            self.balance_label.setText(f"💰 ${self.business_manager.player_balance:,.0f}")
 
     def create_business_management_header(self, business_data):
         """Создает заголовок для управления бизнесом"""
@@ -4691,14 +4458,7 @@ class RevolutionaryBusinessMenu(QWidget):
     def create_compact_metric_card(self, title, value, description, color):
         """Создает компактную карточку метрики"""
         widget = QFrame()
-        widget.setStyleSheet(f"""
-            QFrame {{
-                background-color: {CARD_BG.name()};
-                border: 1px solid {PURPLE_PRIMARY.name()};
-                border-radius: 6px;
-                padding: 10px;
-            }}
-        """)
+        widget.setProperty("role", "metric-card")
         widget.setFixedHeight(70)  # Фиксированная высота
 
         layout = QVBoxLayout(widget)
@@ -4707,15 +4467,18 @@ class RevolutionaryBusinessMenu(QWidget):
 
         # Заголовок
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"color: {TEXT_SECONDARY.name()}; font-size: 10px;")
+        title_label.setProperty("role", "metric-title")
 
-        # Значение
+        # Значение: цвет задается вызывающим кодом, поэтому через палитру, а не через стили
         value_label = QLabel(value)
-        value_label.setStyleSheet(f"color: {color}; font-size: 12px; font-weight: bold;")
+        value_label.setProperty("role", "metric-value")
+        value_palette = value_label.palette()
+        value_palette.setColor(QPalette.ColorRole.WindowText, QColor(color))
+        value_label.setPalette(value_palette)
 
         # Описание
         desc_label = QLabel(description)
-        desc_label.setStyleSheet(f"color: {TEXT_TERTIARY.name()}; font-size: 8px;")
+        desc_label.setProperty("role", "metric-description")
         desc_label.setWordWrap(True)
 
         layout.addWidget(title_label)
@@ -4923,8 +4686,7 @@ class RevolutionaryBusinessMenu(QWidget):
 
     def upgrade_business_from_management(self, business_data, upgrade_type, cost):
         """Улучшение бизнеса из меню управления"""
-        if self.business_manager.player_balance >= cost:
-            self.business_manager.player_balance -= cost
+        if self.business_manager.spend(cost):
             self.show_notification("✅ Успех!", f"Улучшение '{self.get_upgrade_name(upgrade_type)}' применено!")
             self.update_balance_display()
         else:
@@ -5037,31 +4799,33 @@ class RevolutionaryBusinessMenu(QWidget):
 
     def global_boost(self):
         """Глобальное ускорение"""
-        self.show_notification("🚀 Ускорение", "Активировано глобальное ускорение на 1 час!")
-
+        if self.business_manager.activate_boost('global', self.GLOBAL_BOOST_DURATION):
+            self.show_notification("🚀 Ускорение", "Активировано глобальное ускорение на 1 час!")
+        else:
+            remaining = self.business_manager.boost_remaining('global')
+            self.show_notification("🚀 Ускорение", f"Ускорение уже активно: осталось "
+                                   f"{coreLogic.format_duration(remaining)}")
+
+    def on_shown(self):
+        """Меню открыто: экономика догоняет текущий момент"""
+        coreLogic.CLOCK.advance()
+        # Баланс мог измениться, пока меню было скрыто: пересчитываем доступность покупок
+        self.load_catalog()
+    
     def setup_business_timers(self):
         """Настройка таймеров для бизнесов"""
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_businesses)
-        self.update_timer.start(5000)  # Обновление каждые 5 секунд
+        self.update_timer = FrameScheduler.instance().subscribe(
+            lambda dt: self.update_businesses(), self, interval=5.0)  # Обновление каждые 5 секунд
 
     def update_businesses(self):
         """Обновление состояния бизнесов"""
         # Здесь будет логика обновления доходов и состояния бизнесов
         pass
 
-    def resizeEvent(self, a0):
-        """Обработчик изменения размера окна"""
-        super().resizeEvent(a0)
-        # Обновляем layout при изменении размера
-        QTimer.singleShot(50, self.refresh_interface)
-
     def refresh_interface(self):
         """Полное обновление интерфейса"""
-        if hasattr(self, 'my_businesses_layout'):
-            self.load_my_businesses()
-        if hasattr(self, 'catalog_layout'):
-            self.load_catalog()
+        self.load_my_businesses()
+        self.load_catalog()
 
     def clear_layout(self, layout):
         """Очистка layout"""
@@ -5092,7 +4856,7 @@ class ProfileMenu(QWidget):
         
         # Заголовок
         title = QLabel("👤 Профиль Игрока")
-        title.setStyleSheet(f"color: {TEXT_PRIMARY.name()}; font-size: 32px; font-weight: bold;")
+        title.setProperty("role", "profile-title")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
@@ -5110,6 +4874,7 @@ class ProfileMenu(QWidget):
         # Статистика
         stats_widget = self.create_stats_widget()
         layout.addWidget(stats_widget)
+        self.refresh_from_snapshot()
         
         layout.addSpacing(20)
         
@@ -5124,20 +4889,13 @@ class ProfileMenu(QWidget):
         
     def create_profile_info(self):
         widget = QFrame()
-        widget.setStyleSheet(f"""
-            QFrame {{
-                background-color: {PANEL_BG.name()};
-                border: 2px solid {PURPLE_PRIMARY.name()};
-                border-radius: 15px;
-                padding: 20px;
-            }}
-        """)
+        widget.setProperty("role", "profile-panel")
         
         layout = QHBoxLayout()
         
         # Аватар
         avatar = QLabel("👑")
-        avatar.setStyleSheet("font-size: 64px;")
+        avatar.setProperty("role", "profile-avatar")
         avatar.setAlignment(Qt.AlignmentFlag.AlignCenter)
         avatar.setFixedSize(100, 100)
         layout.addWidget(avatar)
@@ -5146,17 +4904,17 @@ class ProfileMenu(QWidget):
         info_layout = QVBoxLayout()
         
         name_label = QLabel("Игрок123")
-        name_label.setStyleSheet(f"color: {TEXT_PRIMARY.name()}; font-size: 24px; font-weight: bold;")
+        name_label.setProperty("role", "profile-name")
         
         level_label = QLabel("Уровень: 15")
-        level_label.setStyleSheet(f"color: {TEXT_SECONDARY.name()}; font-size: 16px;")
+        level_label.setProperty("role", "profile-level")
         
-        balance_label = QLabel("Баланс: $1,250,000")
-        balance_label.setStyleSheet(f"color: {ACCENT2.name()}; font-size: 18px; font-weight: bold;")
+        self.balance_label = QLabel("Баланс: $0")
+        self.balance_label.setProperty("role", "profile-balance")
         
         info_layout.addWidget(name_label)
         info_layout.addWidget(level_label)
-        info_layout.addWidget(balance_label)
+        info_layout.addWidget(self.balance_label)
         layout.addLayout(info_layout)
         
         layout.addStretch()
@@ -5195,21 +4953,23 @@ class ProfileMenu(QWidget):
         layout = QGridLayout()
         
         stats = [
-            ("💰 Общий заработок:", "$5,250,000"),
-            ("🎯 Всего кликов:", "125,430"),
-            ("🏪 Бизнесов:", "8"),
-            ("📈 Инвестиций:", "12"),
-            ("🛒 Покупок:", "25"),
-            ("⏱️ Время в игре:", "45ч 30м")
+            ("total_earned", "💰 Общий заработок:", "$0"),
+            ("clicks", "🎯 Всего кликов:", "125,430"),
+            ("businesses", "🏪 Бизнесов:", "0"),
+            ("investments", "📈 Инвестиций:", "12"),
+            ("purchases", "🛒 Покупок:", "25"),
+            ("play_time", "⏱️ Время в игре:", "45ч 30м")
         ]
+        self.stat_labels = {}
         
         row, col = 0, 0
-        for name, value in stats:
+        for key, name, value in stats:
             name_label = QLabel(name)
-            name_label.setStyleSheet(f"color: {TEXT_SECONDARY.name()}; font-size: 14px;")
+            name_label.setProperty("role", "profile-stat-name")
             
             value_label = QLabel(value)
-            value_label.setStyleSheet(f"color: {TEXT_PRIMARY.name()}; font-size: 14px; font-weight: bold;")
+            value_label.setProperty("role", "profile-stat-value")
+            self.stat_labels[key] = value_label
             
             layout.addWidget(name_label, row, col * 2)
             layout.addWidget(value_label, row, col * 2 + 1)
@@ -5222,6 +4982,17 @@ class ProfileMenu(QWidget):
         widget.setLayout(layout)
         return widget
         
+    def on_shown(self):
+        """Экран профиля открыт"""
+        self.refresh_from_snapshot()
+        
+    def refresh_from_snapshot(self):
+        """Обновляет данные профиля из одного снимка status"""
+        status = ExportDB.status_snapshot()
+        self.balance_label.setText(f"Баланс: ${status.balance:,.0f}")
+        self.stat_labels["total_earned"].setText(f"${status.all_money:,.0f}")
+        self.stat_labels["businesses"].setText(str(status.amount_business))
+        
     def create_achievements_widget(self):
         widget = QGroupBox("🏆 Достижения")
         widget.setStyleSheet(f"""
@@ -5620,23 +5391,24 @@ class SettingsMenu(QWidget):
         selected_quality = self.comboboxes['quality'].currentText()
         selected_volume = self.comboboxes['volume'].value()
         
-        # Применяем настройки
-        self.settings_manager.set_current_theme(selected_theme)
-        self.settings_manager.set_current_window_state(selected_state)
-        
-        width, height = map(int, selected_resolution.split('x'))
-        self.settings_manager.set_current_window_size(width, height)
-        
-        self.settings_manager.set_current_fps(int(selected_fps))
-        self.settings_manager.set_current_lang(selected_language)
+        # Применяем настройки (одна атомарная запись config.json на все изменения)
+        with self.settings_manager.batch():
+            self.settings_manager.set_current_theme(selected_theme)
+            self.settings_manager.set_current_window_state(selected_state)
+            
+            width, height = map(int, selected_resolution.split('x'))
+            self.settings_manager.set_current_window_size(width, height)
+            
+            self.settings_manager.set_current_fps(int(selected_fps))
+            self.settings_manager.set_current_lang(selected_language)
         
         # Проверяем изменения, требующие перезапуска
         restart_required = False
         changed_settings = []
         
         if selected_theme != old_theme:
-            restart_required = True
-            changed_settings.append(f"Тема: {old_theme} → {selected_theme}")
+            # Тема применяется сразу: одна таблица стилей на все приложение
+            THEMES.apply(selected_theme)
         
         if selected_language != old_language:
             restart_required = True
@@ -5654,9 +5426,9 @@ class SettingsMenu(QWidget):
             restart_required = True
             changed_settings.append(f"Язык: {old_language} → {selected_language}")
 
-        if selected_fps != old_fps:
-            restart_required = True
-            changed_settings.append(f"FPS: {old_fps} → {selected_fps}")
+        if int(selected_fps) != old_fps:
+            # FPS применяется сразу, без перезапуска
+            FrameScheduler.instance().set_fps(int(selected_fps))
 
         if selected_quality != old_quality:
             restart_required = True
@@ -5720,6 +5492,8 @@ class SettingsMenu(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
+            # Сохраняем накопленный баланс до запуска нового процесса
+            coreLogic.LEDGER.flush()
             # Перезапускаем приложение
             QApplication.quit()
             import subprocess
@@ -5776,11 +5550,120 @@ class SettingsMenu(QWidget):
         else:
             super().keyPressEvent(a0)
 
+class StartupWorker(QThread):
+    """Выполняет этапы запуска в фоновом потоке.
+    
+    stages - список (название, функция без аргументов). Этапы работают только
+    с данными (базы, каталог, часы экономики), поэтому их можно выполнять вне
+    потока интерфейса; о ходе работы worker сообщает сигналами. Соединения
+    с базами, открытые потоком, закрываются при его завершении.
+    """
+    
+    stageStarted = pyqtSignal(int, str)  # Номер и название этапа
+    stageFailed = pyqtSignal(str, str)  # Название этапа и текст ошибки
+    completed = pyqtSignal()
+    
+    def __init__(self, stages, parent=None):
+        super().__init__(parent)
+        self.stages = stages
+    
+    def run(self):
+        try:
+            for index, (name, stage) in enumerate(self.stages):
+                self.stageStarted.emit(index, name)
+                try:
+                    stage()
+                except Exception as e:
+                    traceback.print_exc()
+                    self.stageFailed.emit(name, str(e))
+                    return
+        finally:
+            coreLogic.DB.close_thread()
+        self.completed.emit()
+
+class ScreenRegistry:
+    """Ленивый реестр экранов QStackedWidget.
+    
+    Экран создается фабрикой при первом обращении и только тогда попадает
+    в стек, а его сигналы подключаются к переданным обработчикам. prewarm
+    заранее создает экраны по одному за шаг таймера, пока выполняется условие,
+    чтобы между созданиями успевали рисоваться кадры.
+    """
+    
+    PREWARM_INTERVAL = 30  # мс между созданиями экранов
+    
+    def __init__(self, stack):
+        self.stack = stack
+        self.factories = {}  # имя -> (фабрика, {сигнал: обработчик})
+        self.screens = {}
+        self.prewarm_queue = []
+        self.prewarm_total = 0
+        self.prewarm_condition = None
+        self.prewarm_progress = None
+        self.prewarm_timer = QTimer(stack)
+        self.prewarm_timer.setSingleShot(True)
+        self.prewarm_timer.setInterval(self.PREWARM_INTERVAL)
+        self.prewarm_timer.timeout.connect(self.prewarm_step)
+    
+    def register(self, name, factory, **signals):
+        self.factories[name] = (factory, signals)
+    
+    def get(self, name):
+        """Экран по имени (создается при первом обращении)"""
+        screen = self.screens.get(name)
+        if screen is None:
+            factory, signals = self.factories[name]
+            screen = self.screens[name] = factory()
+            for signal, slot in signals.items():
+                getattr(screen, signal).connect(slot)
+            # Новый экран пока не показан
+            if self.stack.count() and hasattr(screen, 'on_hidden'):
+                screen.on_hidden()
+            self.stack.addWidget(screen)
+        return screen
+    
+    def show(self, name):
+        self.stack.setCurrentWidget(self.get(name))
+    
+    def is_current(self, name):
+        screen = self.screens.get(name)
+        return screen is not None and screen is self.stack.currentWidget()
+    
+    def prewarm(self, names, condition=lambda: True, on_progress=None):
+        """Создает экраны names в фоне, пока condition() истинно.
+        
+        on_progress(готово, всего) вызывается после каждого шага.
+        """
+        self.prewarm_queue = list(names)
+        self.prewarm_total = len(self.prewarm_queue)
+        self.prewarm_condition = condition
+        self.prewarm_progress = on_progress
+        self.prewarm_timer.start()
+    
+    def prewarm_step(self):
+        if not self.prewarm_condition():
+            self.prewarm_queue.clear()
+            return
+        while self.prewarm_queue:
+            name = self.prewarm_queue.pop(0)
+            if name not in self.screens:
+                self.get(name)
+                break
+        if self.prewarm_progress is not None:
+            self.prewarm_progress(self.prewarm_total - len(self.prewarm_queue), self.prewarm_total)
+        if self.prewarm_queue:
+            self.prewarm_timer.start()
+
 class MainWindow(QMainWindow):
     """Главное окно приложения"""
     
+    # Экраны, создаваемые заранее, пока идет загрузка (в порядке вероятности перехода)
+    PREWARM_SCREENS = ("main_menu", "clicker", "businesses", "investments",
+                       "shop_selection", "light_shop", "profile", "settings")
+    
     def __init__(self):
         super().__init__()
+        THEMES.apply(Settings.get_current_theme())
         self.setWindowTitle(f"{AppLogic.name} v{GAME_VERSION}")
         self.setWindowIcon(QIcon("images/icon.ico"))
         
@@ -5818,58 +5701,109 @@ class MainWindow(QMainWindow):
         
         # Стек виджетов для переключения между экранами
         self.content_stack = QStackedWidget()
-        self.content_stack.setStyleSheet(f"background: transparent;")
-        
-        # Создаем экраны
-        self.loading_screen = LoadingScreen()
-        self.main_menu = MainMenuScreen()
-        self.clicker_game = ClickerGame()
-        self.investment_menu = InvestmentMenu()
-        self.shop_selection = ShopSelectionMenu()
-        self.light_shop = LightShopMenu()
-        #self.business_menu = BusinessMenu()
-        self.business_menu = RevolutionaryBusinessMenu()
-        self.profile_menu = ProfileMenu()
-        self.settings_menu = SettingsMenu()
-        
-        # Добавляем экраны в стек
-        self.content_stack.addWidget(self.loading_screen)        # 0
-        self.content_stack.addWidget(self.main_menu)             # 1
-        self.content_stack.addWidget(self.clicker_game)          # 2
-        self.content_stack.addWidget(self.investment_menu)       # 3
-        self.content_stack.addWidget(self.shop_selection)        # 4
-        self.content_stack.addWidget(self.light_shop)            # 5
-        self.content_stack.addWidget(self.business_menu)         # 6
-        self.content_stack.addWidget(self.profile_menu)          # 7
-        self.content_stack.addWidget(self.settings_menu)         # 8
+        THEMES.attach(self.content_stack, "* { background: transparent; }")
         
         main_layout.addWidget(self.content_stack)
         self.central_widget.setLayout(main_layout)
         
-        # Подключаем сигналы
-        self.loading_screen.loadingFinished.connect(self.show_main_menu)
-        self.main_menu.playClicked.connect(self.show_clicker_game)
-        self.main_menu.settingsClicked.connect(self.show_settings)
-        self.main_menu.exitClicked.connect(self.close)
-        
-        # Подключаем сигналы выхода в меню
-        self.clicker_game.exitToMenu.connect(self.show_main_menu)
-        self.investment_menu.exitToClicker.connect(self.show_clicker_game)
-        self.shop_selection.exitToClicker.connect(self.show_clicker_game)
-        self.light_shop.exitToShopSelectionMenu.connect(self.show_shop_selection)
-        self.business_menu.exitToClicker.connect(self.show_clicker_game)
-        self.profile_menu.exitToClicker.connect(self.show_clicker_game)
-        self.settings_menu.exitToMenu.connect(self.show_main_menu)
-        
-        # Подключаем навигацию между разделами
-        self.shop_selection.shopSelected.connect(self.handle_shop_selection)
-        self.clicker_game.navigationRequested.connect(self.handle_navigation)
-        
-        # Показываем экран загрузки
-        self.content_stack.setCurrentIndex(0)
+        # Хуки on_shown/on_hidden экранов
+        self.current_screen = None
+        self.content_stack.currentChanged.connect(self.on_screen_changed)
+        
+        # Экраны создаются при первом переходе; сигналы подключаются при создании
+        self.screens = ScreenRegistry(self.content_stack)
+        self.screens.register("loading", LoadingScreen,
+                              loadingFinished=self.on_loading_finished)
+        self.screens.register("main_menu", MainMenuScreen,
+                              playClicked=self.show_clicker_game,
+                              settingsClicked=self.show_settings,
+                              exitClicked=self.close)
+        self.screens.register("clicker", ClickerGame,
+                              exitToMenu=self.show_main_menu,
+                              navigationRequested=self.handle_navigation)
+        self.screens.register("investments", InvestmentMenu,
+                              exitToClicker=self.show_clicker_game)
+        self.screens.register("shop_selection", ShopSelectionMenu,
+                              exitToClicker=self.show_clicker_game,
+                              shopSelected=self.handle_shop_selection)
+        self.screens.register("light_shop", LightShopMenu,
+                              exitToShopSelectionMenu=self.show_shop_selection)
+        #self.screens.register("businesses", BusinessMenu, exitToClicker=self.show_clicker_game)
+        self.screens.register("businesses", RevolutionaryBusinessMenu,
+                              exitToClicker=self.show_clicker_game)
+        self.screens.register("profile", ProfileMenu,
+                              exitToClicker=self.show_clicker_game)
+        self.screens.register("settings", SettingsMenu,
+                              exitToMenu=self.show_main_menu)
+        
+        # Экран загрузки показывает реальный ход запуска: сначала этапы в фоновом
+        # потоке, затем заблаговременное создание экранов
+        self.screens.show("loading")
+        self.startup = StartupWorker(STARTUP_STAGES, self)
+        self.startup.stageStarted.connect(self.on_startup_stage)
+        self.startup.stageFailed.connect(self.on_startup_failed)
+        self.startup.completed.connect(self.on_startup_completed)
+        self.startup.start()
         
         # Флаг для отслеживания полноэкранного режима
         self.is_fullscreen = False
+    
+    def startup_steps(self):
+        """Число шагов загрузки: этапы запуска и создание экранов"""
+        return len(STARTUP_STAGES) + len(self.PREWARM_SCREENS)
+    
+    def on_startup_stage(self, index, name):
+        self.screens.get("loading").set_progress(100 * index / self.startup_steps(), name)
+    
+    def on_startup_failed(self, stage, error):
+        QMessageBox.critical(self, "Ошибка запуска", f"Этап «{stage}» завершился с ошибкой:\n{error}")
+        self.close()
+    
+    def on_startup_completed(self):
+        # Шрифты регистрируются в потоке интерфейса, когда фоновые этапы уже завершены
+        discover_fonts()
+        
+        # Часы игры продвигают экономику бизнесов и начисляют аренду - единственный тик дохода;
+        # время отсутствия уже учтено этапом запуска
+        self.clock_timer = FrameScheduler.instance().subscribe(
+            lambda dt: coreLogic.CLOCK.advance(), interval=5.0)
+        
+        # Экраны создаются, пока крутится экран загрузки
+        self.screens.prewarm(self.PREWARM_SCREENS, lambda: self.screens.is_current("loading"),
+                             self.on_prewarm_progress)
+    
+    def on_prewarm_progress(self, done, total):
+        loading = self.screens.get("loading")
+        if done == total:
+            loading.finish()
+        else:
+            loading.set_progress(100 * (len(STARTUP_STAGES) + done) / self.startup_steps(), "Подготовка экранов")
+    
+    def on_loading_finished(self):
+        self.show_main_menu()
+        self.show_offline_summary()
+    
+    def show_offline_summary(self):
+        """Одно сообщение о доходе и событиях экономики за время отсутствия"""
+        global OFFLINE_PROGRESS
+        if OFFLINE_PROGRESS is None:
+            return
+        offline, events = OFFLINE_PROGRESS
+        OFFLINE_PROGRESS = None
+        messages = [message for message in map(describe_economy_event, events) if message is not None]
+        if offline.income <= 0 and not messages:
+            return
+        lines = [f"Прошло {offline.elapsed / 3600:.1f} ч, доход: +${offline.income:,.2f}"]
+        lines += [f"\n{title}\n{text}" for title, text in messages]
+        QMessageBox.information(self, "💤 Пока вас не было", "\n".join(lines))
+    
+    def closeEvent(self, a0):
+        # Этапы запуска пишут в базы: выходим только после их завершения
+        self.startup.wait()
+        # Последний тик часов: доход и состояние экономики на момент выхода (журнал запишет их при закрытии)
+        if coreLogic.CLOCK.economy is not None:
+            coreLogic.CLOCK.advance()
+        super().closeEvent(a0)
 
     def toggle_fullscreen(self):
         """Переключение между полноэкранным и оконным режимом"""
@@ -5904,6 +5838,22 @@ class MainWindow(QMainWindow):
         if self.centralWidget() and self.centralWidget().layout():
             self.centralWidget().layout().activate()
     
+    def on_screen_changed(self, index):
+        """Сообщает экранам о скрытии и показе"""
+        screen = self.content_stack.widget(index)
+        if self.current_screen is not None and self.current_screen is not screen and hasattr(self.current_screen, 'on_hidden'):
+            self.current_screen.on_hidden()
+        self.current_screen = screen
+        if hasattr(screen, 'on_shown'):
+            screen.on_shown()
+        FrameScheduler.instance().wake()
+    
+    def changeEvent(self, a0):
+        """Свернутое окно не рисует кадры"""
+        super().changeEvent(a0)
+        if a0 is not None and a0.type() == QEvent.Type.WindowStateChange:
+            FrameScheduler.instance().set_suspended(self.isMinimized())
+    
     def handle_navigation(self, destination):
         """Обрабатывает навигационные запросы из кликера"""
         if destination == "main_menu":
@@ -5919,7 +5869,7 @@ class MainWindow(QMainWindow):
         
     def show_main_menu(self):
         """Показать главное меню"""
-        self.content_stack.setCurrentIndex(1)
+        self.screens.show("main_menu")
         self.apply_window_state()
 
     def apply_window_state(self):
@@ -5940,32 +5890,32 @@ class MainWindow(QMainWindow):
         
     def show_clicker_game(self):
         """Показать игровой кликер"""
-        self.content_stack.setCurrentIndex(2)
+        self.screens.show("clicker")
         
     def show_investments(self):
         """Показать инвестиции"""
-        self.content_stack.setCurrentIndex(3)
+        self.screens.show("investments")
         
     def show_shop_selection(self):
         """Показать выбор магазина"""
-        self.content_stack.setCurrentIndex(4)
+        self.screens.show("shop_selection")
         
     def show_businesses(self):
         """Показать бизнесы"""
-        self.content_stack.setCurrentIndex(6)
+        self.screens.show("businesses")
         
     def show_profile(self):
         """Показать профиль"""
-        self.content_stack.setCurrentIndex(7)
+        self.screens.show("profile")
         
     def show_settings(self):
         """Показать настройки"""
-        self.content_stack.setCurrentIndex(8)
+        self.screens.show("settings")
         
     def handle_shop_selection(self, shop_type):
         """Обработать выбор магазина"""
         if shop_type == "legal":
-            self.content_stack.setCurrentIndex(5)  # Light shop
+            self.screens.show("light_shop")
         elif shop_type == "black_market":
             QMessageBox.information(self, "Черный рынок", "Черный рынок в разработке!")
         
@@ -5977,8 +5927,7 @@ class MainWindow(QMainWindow):
                 self.toggle_fullscreen()
             else:
                 # Если мы не в главном меню, возвращаемся в него
-                current_index = self.content_stack.currentIndex()
-                if current_index != 1:  # Не главное меню
+                if not self.screens.is_current("main_menu"):
                     self.show_main_menu()
         elif a0 is not None and a0.key() == Qt.Key.Key_F11:
             # Переключение полноэкранного режима по F11
@@ -5986,6 +5935,59 @@ class MainWindow(QMainWindow):
         else:
             super().keyPressEvent(a0)
 
+# Этапы запуска (выполняются StartupWorker в фоновом потоке)
+
+def open_databases():
+    """Миграции баз игры и загрузка кошелька"""
+    # WAL и версии схемы для обеих баз (применяются только недостающие миграции)
+    migrate(coreLogic.DATA_DB, DATA_MIGRATIONS)
+    BusinessDatabaseInitializer(coreLogic.BUSINESSES_DB).migrate()
+    # Обновление баланса при запуске (раньше выполнялось при импорте модуля)
+    UpdateDB.update_balance_and_condition()
+
+def discover_fonts():
+    # QFontDatabase доступна только из потока интерфейса: вызывается после этапов запуска
+    global MAIN_FONT_FAMILY
+    OPENTYPE_MANAGER.init_fonts()
+    MAIN_FONT_FAMILY = OPENTYPE_MANAGER.main_font_family
+
+BUSINESS_ECONOMY = None
+
+def business_economy():
+    """Общая экономика бизнесов: восстанавливается из data.db и подключается к часам игры"""
+    global BUSINESS_ECONOMY
+    if BUSINESS_ECONOMY is None:
+        # Деньги экономики - журнал кошелька: покупки списываются, доход зачисляется в один баланс
+        BUSINESS_ECONOMY = economy.BusinessEconomy(wallet=coreLogic.LEDGER)
+        state = coreLogic.LEDGER.economy_state()
+        if state is not None:
+            BUSINESS_ECONOMY.restore_state(state)
+        coreLogic.CLOCK.attach(BUSINESS_ECONOMY)
+    return BUSINESS_ECONOMY
+
+OFFLINE_PROGRESS = None  # (ClockReport, события экономики) за время отсутствия, до показа игроку
+
+def credit_offline_progress():
+    # Доход за время, пока игра была закрыта: сохраненная экономика бизнесов продвигается на это время
+    # (сроки исследований и обучений - в свой момент, доход и ресурсы между ними - одной формулой).
+    # Обвязки экономики с сообщениями еще нет, поэтому события собираются и показываются после загрузки
+    global OFFLINE_PROGRESS
+    events = []
+    collect = events.append
+    engine = business_economy()
+    engine.subscribe(collect)
+    try:
+        offline = coreLogic.CLOCK.advance()
+    finally:
+        engine.unsubscribe(collect)
+    OFFLINE_PROGRESS = (offline, events)
+
+STARTUP_STAGES = [
+    ("Открытие баз данных", open_databases),
+    ("Загрузка каталога магазина", coreLogic.CATALOG.load),
+    ("Доход за время отсутствия", credit_offline_progress),
+]
+
 def main():
     # ОТКЛЮЧАЕМ НЕНУЖНЫЕ ПРЕДУПРЕЖДЕНИЯ QT
     os.environ["QT_LOGGING_RULES"] = "qt.text.font=false"
@@ -6003,12 +6005,9 @@ def main():
 
     qInstallMessageHandler(qt_debug_handler)
     app = QApplication(sys.argv)
-
-    # ТЕПЕРЬ инициализируем шрифты ПОСЛЕ создания app
-    global OPENTYPE_MANAGER, MAIN_FONT_FAMILY
-    OPENTYPE_MANAGER = OpenType()
-    OPENTYPE_MANAGER.init_fonts()
-    MAIN_FONT_FAMILY = OPENTYPE_MANAGER.main_font_family
+    
+    # Базы, каталог, шрифты и доход за время отсутствия загружаются
+    # в фоне, пока MainWindow показывает экран загрузки
     
     # Устанавливаем стиль приложения
     app.setStyle("Fusion")